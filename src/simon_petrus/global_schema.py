@@ -4,7 +4,11 @@ AGPL-3.0-licensed
 Copyright (C) GKI Salatiga 2024
 Written by Samarthya Lykamanuella (github.com/groaking)
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
 from urllib.error import URLError
+import requests
 import urllib
 
 from PyQt5 import QtWidgets
@@ -12,17 +16,38 @@ from PyQt5 import QtWidgets
 from lib.logger import Logger as Lg
 from lib.assets import AppAssets
 from lib.database import AppDatabase
+from lib.exceptions import InvalidPushCredentialError
+from lib.git_data import GitDataCommitter
+from lib.google_api import GoogleApiManager
+from lib.http_cache import HttpValidatorCache
+from lib.http_client import HttpClient
+from lib.image_optimizer import ImageOptimizer
+from lib.image_placeholder import ImagePlaceholderStore
+from lib.pdf_worker import PdfWorker
+from lib.playlist_cursor import PlaylistCursorStore
 from lib.preferences import SavedPreferences
+from lib.response_cache import ResponseCache
 from loading_animation import ScreenLoadingAnimation
 
 # ------------------------ THIS SECTION DEALS WITH THE GLOBAL VARIABLES ------------------------ #
 
+# The maximum number of resources downloaded concurrently when refreshing all data.
+REFRESH_MAX_WORKERS = 5
+
 global anim
 global app_assets
 global app_db
 global cur_fragment
+global google_api
+global http_cache
+global http_client
+global image_optimizer
+global image_placeholders
+global pdf_worker
 global prefs
+global response_cache
 global win_main
+global yt_cursors
 
 
 def init():
@@ -32,6 +57,38 @@ def init():
     prefs = SavedPreferences()
     prefs.init_configuration()
 
+    # The app-wide HTTP validator cache, used to avoid re-downloading unchanged remote data.
+    global http_cache
+    http_cache = HttpValidatorCache(prefs.JSON_HTTP_VALIDATORS)
+
+    # The app-wide Google API credential and service manager.
+    global google_api
+    google_api = GoogleApiManager(prefs.JSON_GOOGLE_ACCOUNT_SERVICE_KEY)
+
+    # The app-wide pooled HTTP client, reusing its connections to the WordPress and YouTube APIs.
+    global http_client
+    http_client = HttpClient()
+
+    # The app-wide YouTube playlist cursors, used to only ingest the videos added since the last synchronization.
+    global yt_cursors
+    yt_cursors = PlaylistCursorStore(prefs.JSON_YT_PLAYLIST_CURSORS)
+
+    # The app-wide cache of remote lookup responses, to avoid repeating the same lookups across a session.
+    global response_cache
+    response_cache = ResponseCache(prefs.JSON_RESPONSE_CACHE)
+
+    # The app-wide PDF worker process pool, along with its persistent thumbnail cache.
+    global pdf_worker
+    pdf_worker = PdfWorker(prefs.PDF_THUMBNAIL_DIRECTORY, prefs.TEMP_DIRECTORY)
+
+    # The app-wide optimizer of the images picked for the carousel and the QRIS code.
+    global image_optimizer
+    image_optimizer = ImageOptimizer(prefs.IMAGE_CACHE_DIRECTORY, prefs.settings['image_optimize_dimensions'])
+
+    # The app-wide store of the precomputed image dimensions and placeholders of the carousel and the gallery.
+    global image_placeholders
+    image_placeholders = ImagePlaceholderStore(prefs.JSON_IMAGE_PLACEHOLDERS)
+
     # Initializes the app's internal database (global variable).
     global app_db
     app_db = AppDatabase()
@@ -88,6 +145,10 @@ def push_all_data():
     # Ensures the latest temporary JSON dict is retrieved.
     app_assets.db = app_db.db
 
+    # Publish everything as one atomic commit, unless the legacy per-file push is preferred.
+    if prefs.settings['push_single_commit'] == 1:
+        return push_all_data_single_commit()
+
     # Round one: uploading the assets data.
     is_success, j_1, msg = app_assets.push_assets(anim)
     if not is_success:
@@ -103,6 +164,38 @@ def push_all_data():
     return True, (j_1, j_2), msg
 
 
+def push_all_data_single_commit():
+    """
+    This function stages the JSON schema as well as the changed carousel, static HTML,
+    and custom images data, then publishes them in one single commit through the Git Data API.
+    :return: push status, the generic GitHub API JSON response, and the log message.
+    """
+    try:
+        committer = GitDataCommitter(app_db.credentials['api_github'])
+        app_assets.stage_assets(committer, anim)
+        app_db.stage_json_schema(committer, anim)
+
+        # Publishing the commit.
+        j = committer.commit('Manual update from "Simon Petrus"', anim)
+
+        # Final return: if successful.
+        msg = 'All assets data and JSON schema have been uploaded and committed successfully!'
+        anim.set_prog_msg(100, msg)
+        Lg('global_schema.push_all_data_single_commit', msg)
+        return True, j, msg
+
+    except InvalidPushCredentialError as e:
+        msg = (f'API Key yang Anda berikan tidak dapat digunakan untuk melakukan Git-Push.'
+               f' Sebaiknya ganti kredensial "*.json.enc" Anda: {e}')
+        Lg('global_schema.push_all_data_single_commit', msg)
+        return False, {}, msg
+
+    except Exception as e:
+        msg = f'An unknown error has just happened: {e}'
+        Lg('global_schema.push_all_data_single_commit', msg)
+        return False, {}, msg
+
+
 def refresh_all_data():
     """
     This function refreshes all data used in this app, from the main JSON schema
@@ -110,15 +203,44 @@ def refresh_all_data():
     :return: True (not significant, but it is expressed so that the multithreader won't freeze infinitely).
     """
     try:
-        app_db.refresh_json_schema()
-        app_assets.get_carousel()
-        app_assets.get_gallery()
-        app_assets.get_static()
-        app_assets.get_main_qris()
+        # The independent resources to refresh, with their user-friendly names.
+        jobs = [
+            ('JSON schema', app_db.refresh_json_schema),
+            ('carousel', app_assets.get_carousel),
+            ('gallery', app_assets.get_gallery),
+            ('static content', app_assets.get_static),
+            ('QRIS image', app_assets.get_main_qris),
+        ]
+
+        # Fetching the resources concurrently over one shared keep-alive session.
+        with requests.Session() as s:
+            adapter = HTTPAdapter(pool_connections=REFRESH_MAX_WORKERS, pool_maxsize=REFRESH_MAX_WORKERS)
+            s.mount('https://', adapter)
+
+            with ThreadPoolExecutor(max_workers=REFRESH_MAX_WORKERS) as executor:
+                futures = {executor.submit(target, session=s): name for name, target in jobs}
+
+                for i, f in enumerate(as_completed(futures)):
+                    try:
+                        # Re-raise any exception encountered in the worker thread.
+                        f.result()
+                    except Exception:
+                        # Do not start the remaining jobs, and wait for the running ones before reporting the failure,
+                        # so that no local file is still being written once the failure has been reported.
+                        for a in futures.keys():
+                            a.cancel()
+                        wait(futures.keys())
+                        raise
+
+                    msg = f'Refreshed the {futures[f]} ({i + 1}/{len(futures)}) ...'
+                    anim.set_prog_msg(round(100 * (i + 1) / len(futures)), msg)
+                    Lg('global_schema.refresh_all_data', msg)
+
         return True, 'Data synchronization successful!'
 
-    except URLError as e:
-        msg = f'Error encountered while refreshing all data. The internet suddenly disconnects: {e}'
+    except (URLError, RequestException) as e:
+        # Also catches the HTTP errors (e.g., HTTP 404 or 500) raised by any job's "raise_for_status".
+        msg = f'Error encountered while refreshing all data. The internet suddenly disconnects or a download fails: {e}'
         Lg('global_schema.refresh_all_data', msg)
         return False, msg
 
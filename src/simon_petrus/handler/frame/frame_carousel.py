@@ -263,6 +263,9 @@ class FrameCarousel(QtWidgets.QFrame, frame_carousel.Ui_Frame):
             # Add this item to the JSON dict.
             a[key] = data
 
+        # Precomputing the banner and poster BlurHashes, so that the app can lay out the carousel right away.
+        global_schema.app_assets.precompute_carousel_images(a)
+
         # Overwrite the existing forms object.
         global_schema.app_db.db['carousel'] = a
 
@@ -377,29 +380,12 @@ class FrameCarousel(QtWidgets.QFrame, frame_carousel.Ui_Frame):
 
         if item_type == self.CAROUSEL_TYPE_POSTER:
 
-            # Duplicating the banner from local path to Simon Petrus' internal storage.
+            # Storing the banner and the poster in Simon Petrus' internal storage, optimized for downloading.
             banner_source = self.c.cur_frame_obj.findChild(QtWidgets.QLabel, 'txt_img_loc').toolTip().strip()
-            banner_dest_filename = 'banner_' + str(time.time_ns()) + os.path.splitext(banner_source)[1]
-            banner_dest = base + os.sep + banner_dest_filename
-
-            # Copying the banner.
-            # Using binary read, which is pretty cool
-            with open(banner_source, 'rb') as fi:
-                new_banner_bytes = fi.read()
-            with open(banner_dest, 'wb') as fo:
-                fo.write(new_banner_bytes)
+            banner_dest_filename = global_schema.app_assets.ingest_carousel_image(banner_source, base, 'banner_', 'banner')
 
-            # Duplicating the poster from local path to Simon Petrus' internal storage.
             poster_source = self.c.cur_frame_obj.findChild(QtWidgets.QLabel, 'txt_poster_loc').toolTip().strip()
-            poster_dest_filename = 'poster_' + str(time.time_ns()) + os.path.splitext(poster_source)[1]
-            poster_dest = base + os.sep + poster_dest_filename
-
-            # Copying the poster.
-            # Using binary read, which is pretty cool
-            with open(poster_source, 'rb') as fi:
-                new_poster_bytes = fi.read()
-            with open(poster_dest, 'wb') as fo:
-                fo.write(new_poster_bytes)
+            poster_dest_filename = global_schema.app_assets.ingest_carousel_image(poster_source, base, 'poster_', 'poster')
 
             new_data = {
                 'banner': banner_dest_filename,
@@ -419,9 +405,10 @@ class FrameCarousel(QtWidgets.QFrame, frame_carousel.Ui_Frame):
             # Downloading the YouTube thumbnail image.
             # Saving/downloading.
             download_url = thumb
-            saved_dest_filename = 'banner_' + str(time.time_ns()) + os.path.splitext(thumb)[1]
-            saved_dest = base + os.sep + saved_dest_filename
-            urllib.request.urlretrieve(download_url, saved_dest)
+            saved_source = global_schema.prefs.TEMP_DIRECTORY + os.sep + 'yt_thumb_' + str(time.time_ns()) + \
+                os.path.splitext(thumb)[1]
+            urllib.request.urlretrieve(download_url, saved_source)
+            saved_dest_filename = global_schema.app_assets.ingest_carousel_image(saved_source, base, 'banner_', 'banner')
 
             new_data = {
                 'banner': saved_dest_filename,
@@ -439,17 +426,9 @@ class FrameCarousel(QtWidgets.QFrame, frame_carousel.Ui_Frame):
 
         elif item_type == self.CAROUSEL_TYPE_URL:
 
-            # Duplicating the banner from local path to Simon Petrus' internal storage.
+            # Storing the banner in Simon Petrus' internal storage, optimized for downloading.
             banner_source = self.c.cur_frame_obj.findChild(QtWidgets.QLabel, 'txt_img_loc').toolTip().strip()
-            banner_dest_filename = 'banner_' + str(time.time_ns()) + os.path.splitext(banner_source)[1]
-            banner_dest = base + os.sep + banner_dest_filename
-
-            # Copying the banner.
-            # Using binary read, which is pretty cool
-            with open(banner_source, 'rb') as fi:
-                new_banner_bytes = fi.read()
-            with open(banner_dest, 'wb') as fo:
-                fo.write(new_banner_bytes)
+            banner_dest_filename = global_schema.app_assets.ingest_carousel_image(banner_source, base, 'banner_', 'banner')
 
             new_data = {
                 'banner': banner_dest_filename,
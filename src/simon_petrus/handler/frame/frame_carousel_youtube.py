@@ -5,11 +5,11 @@ Copyright (C) GKI Salatiga 2024
 Written by Samarthya Lykamanuella (github.com/groaking)
 """
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtWidgets
 from PyQt5.QtCore import pyqtSlot
 
-from lib.external.thread import ThreadWithResult
 from lib.string_validator import StringValidator
+from lib.task_runner import TaskRunner
 from lib.uploader import Uploader
 from ui import frame_carousel_yt
 
@@ -36,20 +36,8 @@ class FrameCarouselYouTube(QtWidgets.QFrame, frame_carousel_yt.Ui_FrameYouTube):
         uploader = Uploader()
 
         # Using multithreading to prevent GUI freezing [9]
-        t = ThreadWithResult(target=uploader.get_yt_video_data, args=(v,))
-        t.start()
-        while True:
-            if getattr(t, 'result', None):
-                # Obtaining the thread function's result
-                yt_video_data = t.result
-                t.join()
-
-                break
-            else:
-                # When this block is reached, it means the function has not returned any value
-                # While we wait for the thread response to be returned, let us prevent
-                # Qt5 GUI freezing by repeatedly executing the following line:
-                QtCore.QCoreApplication.processEvents()
+        yt_video_data = TaskRunner.run_and_wait(
+            uploader.get_yt_video_data, args=(v,), on_error=lambda e: {'pageInfo': {'totalResults': 0}})
 
         # Check if the video is found on YouTube.
         if yt_video_data['pageInfo']['totalResults'] == 0:
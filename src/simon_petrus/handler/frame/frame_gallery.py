@@ -5,7 +5,7 @@ Copyright (C) GKI Salatiga 2024
 Written by Samarthya Lykamanuella (github.com/groaking)
 """
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtWidgets
 from PyQt5.QtCore import pyqtSlot
 from urllib.parse import urlparse
 import copy
@@ -14,9 +14,9 @@ import pyperclip
 import global_schema
 from handler.dialog.dialog_gallery import DialogGallery
 from httplib2.error import ServerNotFoundError
-from lib.external.thread import ThreadWithResult
 from lib.logger import Logger as Lg
 from lib.string_validator import StringValidator
+from lib.task_runner import TaskRunner
 from ui import frame_gallery
 
 
@@ -157,12 +157,11 @@ class FrameGallery(QtWidgets.QFrame, frame_gallery.Ui_Frame):
         # The currently selected item's Google Drive folder ID.
         item_data = self.cur_item.data(self.DEFAULT_ITEM_ROLE)
         title = item_data['title']
-        folder_id = item_data['folder_id']
 
-        # Whether we should only download the first 100 photos or fetch all photos in a Google Drive folder.
+        # Whether we should only download the first page of photos or fetch all photos in a Google Drive folder.
         flag_fetch_all = global_schema.prefs.settings['gdrive_fetch_all_photos']
         Lg('FrameGallery.on_btn_fetch_clicked', f'FLAG: Fetch all Google Drive photos: {flag_fetch_all}')
-        fetch_only_100 = False if flag_fetch_all == 1 else True
+        fetch_only_first_page = False if flag_fetch_all == 1 else True
 
         # Disable all elements in this window, to prevent user input.
         global_schema.anim.clear_and_show()
@@ -172,22 +171,12 @@ class FrameGallery(QtWidgets.QFrame, frame_gallery.Ui_Frame):
         global_schema.anim.set_prog_msg(50, 'Synchronizing the Google Drive folder content with GKI Salatiga+ ...')
 
         # Using multithreading to prevent GUI freezing [9]
-        # (Supress downloading so that the image will not get downloaded on frame change.)
-        t = ThreadWithResult(target=global_schema.app_assets.get_gdrive_folder_list,
-                             args=(folder_id, fetch_only_100,))
-        t.start()
-        while True:
-            if getattr(t, 'result', None):
-                # Obtaining the thread function's result
-                all_files, is_success, return_msg = t.result
-                t.join()
-
-                break
-            else:
-                # When this block is reached, it means the function has not returned any value
-                # While we wait for the thread response to be returned, let us prevent
-                # Qt5 GUI freezing by repeatedly executing the following line:
-                QtCore.QCoreApplication.processEvents()
+        # Only the photos added or changed since the album's last update are transferred.
+        photos, is_success, return_msg = TaskRunner.run_and_wait(
+            global_schema.app_assets.sync_gdrive_album,
+            args=(item_data, fetch_only_first_page,),
+            on_error=lambda e: ([], False, f'Unknown error detected: {e}')
+        )
 
         # Re-enable all elements in this window.
         global_schema.anim.hide()
@@ -202,18 +191,8 @@ class FrameGallery(QtWidgets.QFrame, frame_gallery.Ui_Frame):
         # Set last update value.
         item_data['last_update'] = StringValidator.get_date()
 
-        # Apply the retrieved data to the currently selected item.
-        a = []
-        for b in all_files:
-            if b['mimeType'].startswith('image/'):
-                a.append({
-                    'id': b['id'],
-                    'name': b['name'],
-                    'date': b['createdTime'].split('T')[0]
-                })
-
         # Overwriting the item's data.
-        item_data['photos'] = copy.deepcopy(a)
+        item_data['photos'] = photos
         self.cur_item.setData(self.DEFAULT_ITEM_ROLE, item_data)
 
         # Recalculate items and displays.
@@ -227,6 +206,84 @@ class FrameGallery(QtWidgets.QFrame, frame_gallery.Ui_Frame):
             QtWidgets.QMessageBox.Ok
         )
 
+    @pyqtSlot()
+    def on_btn_fetch_all_clicked(self):
+        # Asking whether to refresh the albums of the selected year or of every year.
+        year = self.findChild(QtWidgets.QComboBox, 'combo_year').currentText()
+        r = QtWidgets.QMessageBox.question(
+            self, 'Mutakhirkan semua album',
+            f'Mutakhirkan semua album pada "Tahun {year}" saja?\n'
+            f'Pilih "Yes to All" untuk memutakhirkan album dari semua tahun.',
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.YesToAll | QtWidgets.QMessageBox.Cancel
+        )
+        if r == QtWidgets.QMessageBox.Cancel:
+            return
+
+        # Making sure that the displayed album order has been applied to the gallery dict.
+        self.reconsider_album_order()
+
+        # The year and index of every album to refresh.
+        years = [year] if r == QtWidgets.QMessageBox.Yes else sorted(self.gallery_dict.keys())
+        targets = [(a, i) for a in years for i in range(len(self.gallery_dict[a]))]
+        if len(targets) == 0:
+            return
+
+        # Whether we should only download the first page of photos or fetch all photos in a Google Drive folder.
+        fetch_only_first_page = False if global_schema.prefs.settings['gdrive_fetch_all_photos'] == 1 else True
+
+        # Disable all elements in this window, to prevent user input.
+        global_schema.anim.clear_and_show()
+        global_schema.disable_widget(global_schema.win_main)
+
+        # The fallback progress bar and status.
+        global_schema.anim.set_prog_msg(0, f'Synchronizing {len(targets)} Google Drive albums with GKI Salatiga+ ...')
+
+        # Using multithreading to prevent GUI freezing [9]
+        # This is a full synchronization, so the photos deleted from Google Drive are also removed.
+        results = TaskRunner.run_and_wait(
+            global_schema.app_assets.sync_gdrive_albums,
+            args=([self.gallery_dict[a][i] for a, i in targets], fetch_only_first_page,),
+            kwargs={'detect_removals': True},
+            on_error=lambda e: [([], False, f'Unknown error detected: {e}')] * len(targets),
+            on_progress=global_schema.anim.set_prog_msg,
+            with_progress=True
+        )
+
+        # Re-enable all elements in this window.
+        global_schema.anim.hide()
+        global_schema.enable_widget(global_schema.win_main)
+
+        # The changes are only applied if every album has been refreshed successfully.
+        failed = [
+            f'{self.gallery_dict[a][i]["title"]}: {results[j][2]}'
+            for j, (a, i) in enumerate(targets) if not results[j][1]
+        ]
+        if len(failed) > 0:
+            QtWidgets.QMessageBox.warning(
+                self, 'Gagal memutakhirkan data album!',
+                f'Tidak ada album yang diubah, karena {len(failed)} album gagal dimutakhirkan:\n' + '\n'.join(failed),
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+
+        # Applying every refreshed album at once.
+        new_gallery_dict = copy.deepcopy(self.gallery_dict)
+        for j, (a, i) in enumerate(targets):
+            new_gallery_dict[a][i]['photos'] = results[j][0]
+            new_gallery_dict[a][i]['last_update'] = StringValidator.get_date()
+        self.gallery_dict = new_gallery_dict
+
+        # Recalculate items and displays.
+        self.cur_item = None
+        self.on_combo_year_index_changed()
+
+        # Notify the user about successful fetching.
+        QtWidgets.QMessageBox.information(
+            self, 'Berhasil memutakhirkan data album!',
+            f'Berhasil memutakhirkan data isi konten dari {len(targets)} album.',
+            QtWidgets.QMessageBox.Ok
+        )
+
     @pyqtSlot()
     def on_btn_move_down_clicked(self):
         if self.cur_item is None:
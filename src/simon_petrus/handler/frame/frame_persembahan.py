@@ -5,14 +5,13 @@ Copyright (C) GKI Salatiga 2024
 Written by Samarthya Lykamanuella (github.com/groaking)
 """
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtWidgets
 from PyQt5.QtCore import pyqtSlot
 from PyQt5.QtGui import QPixmap
 import os
 
 import global_schema
 from handler.dialog.dialog_persembahan import DialogPersembahan
-from lib.external.thread import ThreadWithResult
 from lib.logger import Logger as Lg
 from ui import frame_persembahan
 
@@ -62,22 +61,9 @@ class FramePersembahan(QtWidgets.QFrame, frame_persembahan.Ui_Frame):
 
     def init_qris(self):
 
-        # Using multithreading to prevent GUI freezing [9]
+        # Only the local path is resolved here, so there is no need to spawn a background task.
         # (Supress downloading so that the image will not get downloaded on frame change.)
-        t = ThreadWithResult(target=global_schema.app_assets.get_main_qris, args=(True,))
-        t.start()
-        while True:
-            if getattr(t, 'result', None):
-                # Obtaining the thread function's result
-                qris_loc = t.result
-                t.join()
-
-                break
-            else:
-                # When this block is reached, it means the function has not returned any value
-                # While we wait for the thread response to be returned, let us prevent
-                # Qt5 GUI freezing by repeatedly executing the following line:
-                QtCore.QCoreApplication.processEvents()
+        qris_loc = global_schema.app_assets.get_main_qris(True)
 
         # Save the main QRIS path and share it to every member of this class.
         self.qris_loc = qris_loc
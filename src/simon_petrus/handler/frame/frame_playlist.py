@@ -5,7 +5,7 @@ Copyright (C) GKI Salatiga 2024
 Written by Samarthya Lykamanuella (github.com/groaking)
 """
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtWidgets
 from PyQt5.QtCore import pyqtSlot
 from urllib.parse import urlparse
 import copy
@@ -14,9 +14,9 @@ import pyperclip
 
 import global_schema
 from handler.dialog.dialog_playlist import DialogPlaylist
-from lib.external.thread import ThreadWithResult
 from lib.logger import Logger as Lg
 from lib.string_validator import StringValidator
+from lib.task_runner import TaskRunner
 from lib.uploader import Uploader
 from ui import frame_playlist
 
@@ -189,27 +189,15 @@ class FramePlaylist(QtWidgets.QFrame, frame_playlist.Ui_Frame):
         # Determining the right action to take.
         if kind == 'rss':
             f = item_data['rss-title-keyword']
-            target=uploader.get_yt_rss_data
+            target = lambda keyword: uploader.get_yt_rss_data(keyword, force_refresh=True)
         elif kind == 'regular':
             target = uploader.get_yt_playlist_data
             f = item_data['playlist-id']
 
         # Using multithreading to prevent GUI freezing [9]
         # (Supress downloading so that the image will not get downloaded on frame change.)
-        t = ThreadWithResult(target=target, args=(f,))
-        t.start()
-        while True:
-            if getattr(t, 'result', None):
-                # Obtaining the thread function's result
-                results, is_success, return_msg = t.result
-                t.join()
-
-                break
-            else:
-                # When this block is reached, it means the function has not returned any value
-                # While we wait for the thread response to be returned, let us prevent
-                # Qt5 GUI freezing by repeatedly executing the following line:
-                QtCore.QCoreApplication.processEvents()
+        results, is_success, return_msg = TaskRunner.run_and_wait(
+            target, args=(f,), on_error=lambda e: ([], False, f'Unknown error detected: {e}'))
 
         # Re-enable all elements in this window.
         global_schema.enable_widget(global_schema.win_main)
@@ -227,35 +215,11 @@ class FramePlaylist(QtWidgets.QFrame, frame_playlist.Ui_Frame):
         # Apply the retrieved data to the currently selected item.
         a = []
         if kind == 'rss':
-            for b in results:
-                if not b['is_data_empty'] == 1:
-                    a.append({
-                        'title': b['video_title'],
-                        'date': b['date_published'].split('T')[0],
-                        'desc': b['video_description'],
-                        'link': b['video_url'],
-                        'thumbnail': b['video_thumbnail']
-                    })
+            a = Uploader.get_yt_rss_playlist_items(results)
 
         elif kind == 'regular':
-            # DEBUG.
-            # print(json.dumps(results))
-
-            for b in results['items']:
-
-                # Mitigate "high quality" thumbnail cannot be specified.
-                # (Or, if the video is private or already deleted.)
-                if b['snippet']['thumbnails'] == {} or b['snippet']['title'] == 'Deleted video':
-                    Lg('FramePlaylist', f'We cannot retrieve this iteration\'s video info: it is probably deleted.')
-                    continue
-
-                a.append({
-                    'title': b['snippet']['title'],
-                    'date': b['snippet']['publishedAt'].split('T')[0],
-                    'desc': b['snippet']['description'],
-                    'link': StringValidator.get_youtube_link_from_id(b['snippet']['resourceId']['videoId']),
-                    'thumbnail': b['snippet']['thumbnails']['high']['url']
-                })
+            # The playlist videos are already in the content item format.
+            a = results
 
         # Overwriting the item's data.
         item_data['content'] = copy.deepcopy(a)
@@ -274,6 +238,68 @@ class FramePlaylist(QtWidgets.QFrame, frame_playlist.Ui_Frame):
         # Update the snippet display.
         self.update_snippet_data()
 
+    @pyqtSlot()
+    def on_btn_fetch_all_clicked(self):
+        # Making sure that the displayed playlist order has been applied to the playlist dict.
+        self.reconsider_playlist_order()
+
+        # The list and index of every playlist to refresh.
+        targets = [(a, i) for a in ('pinned', 'standard') for i in range(len(self.playlist_dict[a]))]
+        if len(targets) == 0:
+            return
+
+        # Disable all elements in this window, to prevent user input.
+        global_schema.disable_widget(global_schema.win_main)
+        global_schema.anim.clear_and_show()
+
+        # The fallback progress bar and status.
+        global_schema.anim.set_prog_msg(0, f'Synchronizing {len(targets)} YouTube playlists ...')
+
+        # Using multithreading to prevent GUI freezing [9]
+        results = TaskRunner.run_and_wait(
+            Uploader().sync_yt_playlists,
+            args=([self.playlist_dict[a][i] for a, i in targets],),
+            on_error=lambda e: [([], False, f'Unknown error detected: {e}')] * len(targets),
+            on_progress=global_schema.anim.set_prog_msg,
+            with_progress=True
+        )
+
+        # Re-enable all elements in this window.
+        global_schema.enable_widget(global_schema.win_main)
+        global_schema.anim.hide()
+
+        # The changes are only applied if every playlist has been refreshed successfully.
+        failed = [
+            f'{self.playlist_dict[a][i]["title"]}: {results[j][2]}'
+            for j, (a, i) in enumerate(targets) if not results[j][1]
+        ]
+        if len(failed) > 0:
+            QtWidgets.QMessageBox.warning(
+                self, 'Gagal memutakhirkan data!',
+                f'Tidak ada daftar putar yang diubah, karena {len(failed)} daftar putar gagal dimutakhirkan:\n'
+                + '\n'.join(failed),
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+
+        # Applying every refreshed playlist at once.
+        new_playlist_dict = copy.deepcopy(self.playlist_dict)
+        for j, (a, i) in enumerate(targets):
+            new_playlist_dict[a][i]['content'] = copy.deepcopy(results[j][0])
+            new_playlist_dict[a][i]['last-update'] = StringValidator.get_date()
+        self.playlist_dict = new_playlist_dict
+
+        # Recalculate items and displays.
+        self.cur_item = None
+        self.prefill_fields()
+
+        # Notify the user about successful fetching.
+        QtWidgets.QMessageBox.information(
+            self, 'Berhasil memutakhirkan data!',
+            f'Berhasil memutakhirkan data isi konten dari {len(targets)} daftar putar.',
+            QtWidgets.QMessageBox.Ok
+        )
+
     @pyqtSlot()
     def on_btn_move_down_clicked(self):
         if self.cur_item is None:
@@ -10,8 +10,8 @@ from PyQt5.QtCore import pyqtSlot
 import os
 
 import global_schema
-from lib.external.thread import ThreadWithResult
 from lib.string_validator import StringValidator
+from lib.task_runner import TaskRunner
 from lib.uploader import Uploader
 from ui import frame_warta_upload
 
@@ -68,20 +68,11 @@ class FrameWartaJemaat(QtWidgets.QFrame, frame_warta_upload.Ui_Frame):
         global_schema.disable_widget(global_schema.win_main)
 
         # Using multithreading to prevent GUI freezing [9]
-        t = ThreadWithResult(target=uploader.upload_warta, args=(self.pdf_loc, post_title,))
-        t.start()
-        while True:
-            if getattr(t, 'result', None):
-                # Obtaining the thread function's result
-                is_success, msg = t.result
-                t.join()
-
-                break
-            else:
-                # When this block is reached, it means the function has not returned any value
-                # While we wait for the thread response to be returned, let us prevent
-                # Qt5 GUI freezing by repeatedly executing the following line:
-                QtCore.QCoreApplication.processEvents()
+        is_success, msg = TaskRunner.run_and_wait(
+            uploader.upload_warta,
+            args=(self.pdf_loc, post_title,),
+            on_error=lambda e: (False, f'Unknown error is detected: {e}')
+        )
 
         # Closing the loading animation and re-enable the window.
         global_schema.enable_widget(global_schema.win_main)
@@ -10,7 +10,7 @@ from PyQt5.QtCore import pyqtSlot
 import os
 
 import global_schema
-from lib.external.thread import ThreadWithResult
+from lib.task_runner import TaskRunner
 from lib.uploader import Uploader
 from ui import frame_wp_homepage
 
@@ -46,20 +46,11 @@ class FrameWordPressHome(QtWidgets.QFrame, frame_wp_homepage.Ui_Frame):
         global_schema.disable_widget(global_schema.win_main)
 
         # Using multithreading to prevent GUI freezing [9]
-        t = ThreadWithResult(target=uploader.update_wp_homepage, args=(is_autofetch_youtube, is_autofetch_instagram, custom_youtube_link, custom_poster_img_path,))
-        t.start()
-        while True:
-            if getattr(t, 'result', None):
-                # Obtaining the thread function's result
-                is_success, msg = t.result
-                t.join()
-
-                break
-            else:
-                # When this block is reached, it means the function has not returned any value
-                # While we wait for the thread response to be returned, let us prevent
-                # Qt5 GUI freezing by repeatedly executing the following line:
-                QtCore.QCoreApplication.processEvents()
+        is_success, msg = TaskRunner.run_and_wait(
+            uploader.update_wp_homepage,
+            args=(is_autofetch_youtube, is_autofetch_instagram, custom_youtube_link, custom_poster_img_path,),
+            on_error=lambda e: (False, f'Unknown error is detected: {e}')
+        )
 
         # Closing the loading animation and re-enable the window.
         global_schema.enable_widget(global_schema.win_main)
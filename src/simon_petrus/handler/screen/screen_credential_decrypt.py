@@ -14,8 +14,8 @@ import global_schema
 from handler.screen.screen_credential_generate import ScreenCredentialGenerate
 from handler.screen.screen_main import ScreenMain
 from lib.credentials import CredentialValidator
-from lib.external.thread import ThreadWithResult
 from lib.logger import Logger as Lg
+from lib.task_runner import TaskRunner
 from ui import screen_credential_decrypt
 
 
@@ -92,20 +92,8 @@ class ScreenCredentialDecrypt(QtWidgets.QMainWindow, screen_credential_decrypt.U
         global_schema.disable_widget(self)
 
         # Using multithreading to prevent GUI freezing [9]
-        t = ThreadWithResult(target=validator.decrypt, args=(password_key,))
-        t.start()
-        while True:
-            if getattr(t, 'result', None):
-                # Obtaining the thread function's result
-                is_valid, decrypted_dict, message = t.result
-                t.join()
-
-                break
-            else:
-                # When this block is reached, it means the function has not returned any value
-                # While we wait for the thread response to be returned, let us prevent
-                # Qt5 GUI freezing by repeatedly executing the following line:
-                QtCore.QCoreApplication.processEvents()
+        is_valid, decrypted_dict, message = TaskRunner.run_and_wait(
+            validator.decrypt, args=(password_key,), on_error=lambda e: (False, {}, f'Unknown error detected: {e}'))
 
         # Closing the loading animation and re-enable the window.
         global_schema.enable_widget(self)
@@ -140,20 +128,8 @@ class ScreenCredentialDecrypt(QtWidgets.QMainWindow, screen_credential_decrypt.U
                 global_schema.anim.set_prog_msg(50, 'Synchronizing the JSON data with the GitHub repository main branch ...')
 
                 # Using multithreading to prevent GUI freezing [9]
-                t = ThreadWithResult(target=global_schema.refresh_all_data, args=())
-                t.start()
-                while True:
-                    if getattr(t, 'result', None):
-                        # Obtaining the thread function's result
-                        is_refresh_success, refresh_msg = t.result
-                        t.join()
-
-                        break
-                    else:
-                        # When this block is reached, it means the function has not returned any value
-                        # While we wait for the thread response to be returned, let us prevent
-                        # Qt5 GUI freezing by repeatedly executing the following line:
-                        QtCore.QCoreApplication.processEvents()
+                is_refresh_success, refresh_msg = TaskRunner.run_and_wait(
+                    global_schema.refresh_all_data, on_error=lambda e: (False, f'Unknown error encountered: {e}'))
 
                 # Display whatever status message returned from the decryption to the user.
                 msg_title = 'Synchronization successful!' if is_refresh_success else 'Failed to refresh data!'
@@ -5,15 +5,15 @@ Copyright (C) GKI Salatiga 2024
 Written by Samarthya Lykamanuella (github.com/groaking)
 """
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtWidgets
 from PyQt5.QtCore import pyqtSlot
 import base64
 import json
 
 import global_schema
 from lib.credentials import CredentialGenerator
-from lib.external.thread import ThreadWithResult
 from lib.logger import Logger as Lg
+from lib.task_runner import TaskRunner
 from ui import screen_credential_generator
 
 
@@ -60,25 +60,23 @@ class ScreenCredentialGenerate(QtWidgets.QMainWindow, screen_credential_generato
                 global_schema.disable_widget(self)
 
                 # Using multithreading to prevent GUI freezing [9]
-                t = ThreadWithResult(target=generator.encrypt, args=(a, decryption_password,))
-                t.start()
-                while True:
-                    if getattr(t, 'result', None):
-                        # Obtaining the thread function's result
-                        encrypted_bytes = t.result
-                        t.join()
-
-                        break
-                    else:
-                        # When this block is reached, it means the function has not returned any value
-                        # While we wait for the thread response to be returned, let us prevent
-                        # Qt5 GUI freezing by repeatedly executing the following line:
-                        QtCore.QCoreApplication.processEvents()
+                # The exception raised by the encryption (if any) is returned in place of the encrypted bytes.
+                encrypted_bytes = TaskRunner.run_and_wait(
+                    generator.encrypt, args=(a, decryption_password,), on_error=lambda e: e)
 
                 # Closing the loading animation and re-enable the window.
                 global_schema.enable_widget(self)
                 global_schema.anim.hide()
 
+                if isinstance(encrypted_bytes, Exception):
+                    Lg('main.ScreenCredentialGenerate.on_btn_gen_clicked',
+                       f'Failed to encrypt the credential: {encrypted_bytes}')
+                    QtWidgets.QMessageBox.warning(
+                        self, 'Error Detected!', f'Failed to encrypt the credential: {encrypted_bytes}',
+                        QtWidgets.QMessageBox.Ok
+                    )
+                    return
+
                 # Ask the user wherein this credential should be stored.
                 # (Qt5 has built-in overwrite confirmation dialog.)
                 ff = 'Encrypted JSON file (*.json.enc)'
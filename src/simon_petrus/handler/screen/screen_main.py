@@ -28,8 +28,9 @@ from handler.frame.frame_warta_jemaat import FrameWartaJemaat
 from handler.frame.frame_wordpress_home import FrameWordPressHome
 from handler.screen.screen_settings import ScreenSettings
 from lib.external.meipass import resource_path
-from lib.external.thread import ThreadWithResult
+from lib.fragment_registry import FragmentRegistry
 from lib.logger import Logger as Lg
+from lib.task_runner import TaskRunner
 from ui import screen_main
 
 
@@ -52,6 +53,23 @@ class ScreenMain(QtWidgets.QMainWindow, screen_main.Ui_MainWindow):
         self.label_logo.setScaledContents(True)
         # self.label_logo.resize(pixmap.width(), pixmap.height())
 
+        # The fragment registry. Fragments are only built when first displayed,
+        # and are rebuilt only when the data sections they display have changed.
+        self.fragments = FragmentRegistry()
+        self.fragments.register('fragment_agenda', FrameAgenda, ('agenda',))
+        self.fragments.register('fragment_carousel', FrameCarousel, ('carousel',))
+        self.fragments.register('fragment_default', FrameDefault)
+        self.fragments.register('fragment_formulir', FrameFormulir, ('forms',))
+        self.fragments.register('fragment_gallery', FrameGallery, ('gallery',))
+        self.fragments.register('fragment_persembahan', FramePersembahan, ('offertory', 'qris'))
+        self.fragments.register('fragment_playlist', FramePlaylist, ('yt',))
+        self.fragments.register('fragment_renungan', FrameRenungan, ('ykb',))
+        self.fragments.register('fragment_social_media', FrameSocialMedia, ('url-profile',))
+        self.fragments.register('fragment_static', FrameStatic, ('static',))
+        self.fragments.register('fragment_tata_ibadah', FrameTataIbadah)
+        self.fragments.register('fragment_warta_jemaat', FrameWartaJemaat)
+        self.fragments.register('fragment_wp_home', FrameWordPressHome)
+
         # Displaying the default fragment.
         self.clear_fragment_and_display(global_schema.cur_fragment)
 
@@ -59,11 +77,16 @@ class ScreenMain(QtWidgets.QMainWindow, screen_main.Ui_MainWindow):
         """
         This function removes every child element from the GridLayout that is used
         to display the fragments. [4]
+        Cached fragments are only hidden so that they can be displayed again without rebuilding.
         :return: nothing.
         """
-        for i in range(self.fragment_layout.count()):
+        for i in reversed(range(self.fragment_layout.count())):
             item = self.fragment_layout.itemAt(i).widget()
-            item.deleteLater()
+            self.fragment_layout.removeWidget(item)
+            if self.fragments.is_cached(item):
+                item.hide()
+            else:
+                item.deleteLater()
 
     def clear_fragment_and_display(self, fragment_str: str):
         """
@@ -74,35 +97,15 @@ class ScreenMain(QtWidgets.QMainWindow, screen_main.Ui_MainWindow):
         # Prevents freezing [5]
         QtCore.QCoreApplication.processEvents()
 
-        # The fragment dictionary.
-        const_fragment_dictionary = {
-            'fragment_agenda': FrameAgenda(),
-            'fragment_carousel': FrameCarousel(),
-            'fragment_default': FrameDefault(),
-            'fragment_formulir': FrameFormulir(),
-            'fragment_gallery': FrameGallery(),
-            'fragment_persembahan': FramePersembahan(),
-            'fragment_playlist': FramePlaylist(),
-            'fragment_renungan': FrameRenungan(),
-            'fragment_social_media': FrameSocialMedia(),
-            'fragment_static': FrameStatic(),
-            'fragment_tata_ibadah': FrameTataIbadah(),
-            'fragment_warta_jemaat': FrameWartaJemaat(),
-            'fragment_wp_home': FrameWordPressHome()
-        }
-
-        # Prepare the fragment.
-        fragment = const_fragment_dictionary[fragment_str]
-
         # Clear the previous fragment.
         self.clear_fragment_layout_content()
 
-        # Preparing the fragment to display.
-        frame = QtWidgets.QFrame()
-        fragment.setupUi(frame)
+        # Prepare the fragment. Only the requested fragment gets built (or reused from the cache).
+        fragment = self.fragments.get(fragment_str)
 
         # Displaying the frame
         self.fragment_layout.addWidget(fragment)
+        fragment.show()
 
     @pyqtSlot()
     def on_action_changelog_triggered(self):
@@ -140,20 +143,8 @@ class ScreenMain(QtWidgets.QMainWindow, screen_main.Ui_MainWindow):
             global_schema.disable_widget(global_schema.win_main)
 
             # Using multithreading to prevent GUI freezing [9]
-            t = ThreadWithResult(target=global_schema.push_all_data, args=())
-            t.start()
-            while True:
-                if getattr(t, 'result', None):
-                    # Obtaining the thread function's result
-                    is_success, _, msg = t.result
-                    t.join()
-
-                    break
-                else:
-                    # When this block is reached, it means the function has not returned any value
-                    # While we wait for the thread response to be returned, let us prevent
-                    # Qt5 GUI freezing by repeatedly executing the following line:
-                    QtCore.QCoreApplication.processEvents()
+            is_success, _, msg = TaskRunner.run_and_wait(
+                global_schema.push_all_data, on_error=lambda e: (False, {}, f'An unknown error has just happened: {e}'))
 
             # Closing the loading animation and re-enable the window.
             global_schema.enable_widget(global_schema.win_main)
@@ -184,20 +175,8 @@ class ScreenMain(QtWidgets.QMainWindow, screen_main.Ui_MainWindow):
         Lg('main.ScreenMain.on_btn_sync_clicked', msg)
 
         # Using multithreading to prevent GUI freezing [9]
-        t = ThreadWithResult(target=global_schema.refresh_all_data, args=())
-        t.start()
-        while True:
-            if getattr(t, 'result', None):
-                # Obtaining the thread function's result
-                is_success, refresh_msg = t.result
-                t.join()
-
-                break
-            else:
-                # When this block is reached, it means the function has not returned any value
-                # While we wait for the thread response to be returned, let us prevent
-                # Qt5 GUI freezing by repeatedly executing the following line:
-                QtCore.QCoreApplication.processEvents()
+        is_success, refresh_msg = TaskRunner.run_and_wait(
+            global_schema.refresh_all_data, on_error=lambda e: (False, f'Unknown error encountered: {e}'))
 
         # Closing the loading animation and re-enable the window.
         global_schema.enable_widget(global_schema.win_main)
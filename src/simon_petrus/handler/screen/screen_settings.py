@@ -14,6 +14,9 @@ from ui import screen_settings
 
 class ScreenSettings(QtWidgets.QMainWindow, screen_settings.Ui_MainWindow):
 
+    # The PDF thumbnail image formats, in the order of the combo box items.
+    PDF_THUMBNAIL_FORMATS = ['png', 'jpeg', 'webp']
+
     def __init__(self, *args, obj=None, **kwargs):
         super(ScreenSettings, self).__init__(*args, **kwargs)
         self.setupUi(self)
@@ -24,12 +27,20 @@ class ScreenSettings(QtWidgets.QMainWindow, screen_settings.Ui_MainWindow):
         # Displaying the appropriate settings value in each field.
         self.chk_autosync.setChecked(True if global_schema.prefs.settings['autosync_on_launch'] == 1 else False)
         self.chk_gdrive_fetch_all.setChecked(True if global_schema.prefs.settings['gdrive_fetch_all_photos'] == 1 else False)
+        self.chk_pdf_optimize.setChecked(True if global_schema.prefs.settings['pdf_optimize_before_upload'] == 1 else False)
+        self.chk_gallery_sharded.setChecked(True if global_schema.prefs.settings['gallery_sharded'] == 1 else False)
+        self.combo_pdf_thumbnail_format.setCurrentIndex(
+            self.PDF_THUMBNAIL_FORMATS.index(global_schema.prefs.settings['pdf_thumbnail_format']))
 
     @pyqtSlot()
     def on_btn_apply_clicked(self):
         # Saving the settings value.
         global_schema.prefs.settings['autosync_on_launch'] = 1 if self.chk_autosync.isChecked() is True else 0
         global_schema.prefs.settings['gdrive_fetch_all_photos'] = 1 if self.chk_gdrive_fetch_all.isChecked() is True else 0
+        global_schema.prefs.settings['pdf_optimize_before_upload'] = 1 if self.chk_pdf_optimize.isChecked() is True else 0
+        global_schema.prefs.settings['gallery_sharded'] = 1 if self.chk_gallery_sharded.isChecked() is True else 0
+        global_schema.prefs.settings['pdf_thumbnail_format'] = \
+            self.PDF_THUMBNAIL_FORMATS[self.combo_pdf_thumbnail_format.currentIndex()]
 
         # Writing config into file.
         global_schema.prefs.save_config()
@@ -47,3 +58,14 @@ class ScreenSettings(QtWidgets.QMainWindow, screen_settings.Ui_MainWindow):
     @pyqtSlot()
     def on_btn_cancel_clicked(self):
         self.close()
+
+    @pyqtSlot()
+    def on_btn_clear_cache_clicked(self):
+        # Forcing every subsequent YouTube, WordPress, and Instagram lookup to be requested afresh.
+        global_schema.response_cache.clear()
+
+        QtWidgets.QMessageBox.information(
+            self, 'Berhasil menghapus cache!',
+            'Cache data daring berhasil dihapus. Data YouTube, WordPress, dan Instagram akan diambil ulang.',
+            QtWidgets.QMessageBox.Ok
+        )
@@ -9,24 +9,37 @@ REFERENCES:
     [1] Comparison of two files for similarities
     - https://docs.python.org/3/library/filecmp.html
     - https://stackoverflow.com/a/1072576
+    [2] Compression methods of zip archive members
+    - https://docs.python.org/3/library/zipfile.html#zipfile.ZipFile.write
+    [3] Searching for files in Google Drive
+    - https://developers.google.com/drive/api/guides/search-files
+    - https://developers.google.com/drive/api/reference/rest/v3/files/list
+    [4] The image metadata and thumbnail link of Google Drive files
+    - https://developers.google.com/drive/api/reference/rest/v3/files#File.FIELDS.image_media_metadata
+    - https://developers.google.com/drive/api/reference/rest/v3/files#File.FIELDS.thumbnail_link
+    [5] Listing the contents of a repository directory using the GitHub API
+    - https://docs.github.com/en/rest/repos/contents#get-repository-content
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime as dt, timedelta
 import time
 
 from google.auth.exceptions import TransportError
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from zipfile import ZipFile
-import base64
+from zipfile import BadZipFile, ZIP_DEFLATED, ZIP_STORED, ZipFile
 import filecmp
 import json
 import os
+import re
 import requests
 import shutil
-import urllib.request
+import zlib
 
 from httplib2 import ServerNotFoundError
 
+from lib.contents_upload import StreamingContentsUpload
+from lib.exceptions import InvalidPushCredentialError
+from lib.gallery_shards import ShardedGallery
+from lib.git_data import GitDataCommitter
 from lib.logger import Logger as Lg
 from loading_animation import ScreenLoadingAnimation
 import global_schema
@@ -50,6 +63,14 @@ class AppAssets(object):
     GALLERY_JSON_API = 'https://api.github.com/repos/gkisalatiga/gkisplus-data/contents/gkisplus-gallery.json'
     GALLERY_JSON_URL = 'https://raw.githubusercontent.com/gkisalatiga/gkisplus-data/main/gkisplus-gallery.json'
 
+    # The directory (relative to repo's root), base URL, and API end point of the per-year gallery shards,
+    # along with the path and URL of their index file.
+    GALLERY_SHARD_PATH = 'gkisplus-gallery'
+    GALLERY_SHARD_API = 'https://api.github.com/repos/gkisalatiga/gkisplus-data/contents/gkisplus-gallery'
+    GALLERY_SHARD_URL = 'https://raw.githubusercontent.com/gkisalatiga/gkisplus-data/main/gkisplus-gallery'
+    GALLERY_INDEX_PATH = 'gkisplus-gallery/index.json'
+    GALLERY_INDEX_URL = 'https://raw.githubusercontent.com/gkisalatiga/gkisplus-data/main/gkisplus-gallery/index.json'
+
     # The URL, path (relative to repo's root), and API end point of the static (profile info) JSON file.
     STATIC_JSON_PATH = 'gkisplus-static.json'
     STATIC_JSON_API = 'https://api.github.com/repos/gkisalatiga/gkisplus-data/contents/gkisplus-static.json'
@@ -60,19 +81,23 @@ class AppAssets(object):
     ASSETS_PATH_IMAGES = 'images'
     ASSETS_PATH_STATIC = 'static'
 
-    # The Google Drive API scopes.
-    GOOGLE_DRIVE_SCOPES = [
-        'https://www.googleapis.com/auth/docs',
-        'https://www.googleapis.com/auth/drive',
-        'https://www.googleapis.com/auth/drive.appdata',
-        'https://www.googleapis.com/auth/drive.apps.readonly',
-        'https://www.googleapis.com/auth/drive.file',
-        'https://www.googleapis.com/auth/drive.meet.readonly',
-        'https://www.googleapis.com/auth/drive.metadata',
-        'https://www.googleapis.com/auth/drive.metadata.readonly',
-        'https://www.googleapis.com/auth/drive.photos.readonly',
-        'https://www.googleapis.com/auth/drive.readonly',
-    ]
+    # The maximum number of files per page allowed by the Google Drive API.
+    GDRIVE_PAGE_SIZE = 1000
+
+    # The maximum number of Google Drive albums synchronized at the same time.
+    GDRIVE_MAX_WORKERS = 4
+
+    # The Google Drive file fields of a gallery photo, including those from which its placeholder is computed. [4]
+    GDRIVE_PHOTO_FIELDS = 'id, name, createdTime, md5Checksum, thumbnailLink, imageMediaMetadata(width, height, rotation)'
+
+    # The size (in pixels) of the Google Drive thumbnail from which a photo's placeholder is computed.
+    GDRIVE_THUMBNAIL_SIZE = 64
+
+    # The maximum number of Google Drive thumbnails downloaded at the same time for each album.
+    PLACEHOLDER_MAX_WORKERS = 4
+
+    # The file extensions of already-compressed images, which are zipped without recompression.
+    PRECOMPRESSED_EXTENSIONS = ('.gif', '.jpeg', '.jpg', '.png', '.webp')
 
     def __init__(self):
         self.static_meta = None
@@ -83,10 +108,13 @@ class AppAssets(object):
         self.prefs = global_schema.prefs
         self.saved_carousel_loc = None
         self.saved_gallery_loc = None
+        self.saved_gallery_shard_dir = None
+        self.saved_gallery_index_loc = None
         self.saved_static_loc = None
         self.saved_qris_loc = None
 
         # This determines whether to upload files.
+        # (Files identical to the remote ones are skipped anyway by comparing their git blob SHA-1.)
         self.do_upload_carousel = False
         self.do_upload_gallery = True  # --- better this way; no need to check the individual state one by one
         self.do_upload_static = True  # --- better this way; no need to check the individual state one by one
@@ -96,6 +124,9 @@ class AppAssets(object):
         self.gallery = {}
         self.gallery_meta = {}
 
+        # The gallery index of the shards last saved or downloaded, when the gallery is sharded per year.
+        self.gallery_index = {}
+
         # Initialize the assets folder before everything else.
         self.init_assets_folder()
 
@@ -136,6 +167,9 @@ class AppAssets(object):
 
         # Init the gallery JSON file location.
         self.saved_gallery_loc = self.prefs.ASSETS_DIRECTORY + os.sep + self.GALLERY_JSON_PATH
+        self.saved_gallery_shard_dir = self.prefs.ASSETS_DIRECTORY + os.sep + self.GALLERY_SHARD_PATH
+        self.saved_gallery_index_loc = self.saved_gallery_shard_dir + os.sep + os.path.split(self.GALLERY_INDEX_PATH)[1]
+        os.makedirs(self.saved_gallery_shard_dir, exist_ok=True)
 
         # Init the gallery JSON file, if and only if it is already downloaded locally.
         self.get_gallery(True)
@@ -149,47 +183,196 @@ class AppAssets(object):
         # Post-logging.
         Lg('lib.assets.AppAssets.init_assets_folder', f'Initialization done!')
 
-    def get_carousel(self, supress_download: bool = False, auto_extract: bool = True):
+    def build_carousel_zip(self):
+        """
+        Zip the carousel banners and posters listed in the JSON schema into the local carousel zip file.
+        The previous zip file is reused as-is if none of its members has changed, and new members are appended
+        to it without rewriting the rest. Already-compressed images are stored without recompression. [2]
+        :return: the local path to the carousel zip file.
+        """
+        # Determining the location of the zip file.
+        zip_loc = self.saved_carousel_loc
+
+        # Listing the zip members to be packaged, keyed by their arcname.
+        members = {}
+        for a in self.db['carousel'].keys():
+            # The current node.
+            b = self.db['carousel'][a]
+
+            base = self.ASSETS_PATH_CAROUSEL + os.sep + 'carousel' + os.sep + a
+            members['carousel/' + a + '/' + b['banner']] = base + os.sep + b['banner']
+
+            # Only applies to posters.
+            if b['type'] == 'poster':
+                members['carousel/' + a + '/' + b['poster-image']] = base + os.sep + b['poster-image']
+
+        # Reading the members of the previous zip file, if any.
+        existing = {}
+        if os.path.isfile(zip_loc):
+            try:
+                with ZipFile(zip_loc, mode='r') as zi:
+                    existing = {a.filename: a for a in zi.infolist() if not a.is_dir()}
+            except BadZipFile:
+                Lg('lib.assets.AppAssets.build_carousel_zip', f'The previous zip file is corrupted: {zip_loc}')
+
+        # Comparing the size and the checksum of each source file against the previous zip file.
+        changed = [
+            a for a in members.keys()
+            if a not in existing
+            or existing[a].file_size != os.path.getsize(members[a])
+            or existing[a].CRC != self.get_file_crc32(members[a])
+        ]
+        removed = [a for a in existing.keys() if a not in members]
+
+        if len(changed) == 0 and len(removed) == 0:
+            Lg('lib.assets.AppAssets.build_carousel_zip', 'No carousel file has changed. Reusing the previous zip file.')
+            return zip_loc
+
+        # The local zip file will no longer match the downloaded one.
+        global_schema.http_cache.forget(self.CAROUSEL_ZIP_URL)
+
+        if len(removed) == 0 and all(a not in existing for a in changed):
+            # Only new members are added, so they are appended to the previous zip file.
+            Lg('lib.assets.AppAssets.build_carousel_zip', f'Appending {len(changed)} new file(s) to the carousel zip.')
+            with ZipFile(zip_loc, mode='a') as zo:
+                for a in changed:
+                    zo.write(members[a], arcname=a, compress_type=self.get_zip_compression(a))
+
+        else:
+            # Members are replaced or removed, so the zip file is rebuilt into a temporary file first.
+            Lg('lib.assets.AppAssets.build_carousel_zip',
+               f'Rebuilding the carousel zip ({len(changed)} changed, {len(removed)} removed file(s)).')
+            temp_loc = zip_loc + '.part'
+            with ZipFile(temp_loc, mode='w') as zo:
+                for a in members.keys():
+                    zo.write(members[a], arcname=a, compress_type=self.get_zip_compression(a))
+            os.replace(temp_loc, zip_loc)
+
+        return zip_loc
+
+    def get_carousel(self, supress_download: bool = False, auto_extract: bool = True, session: requests.Session = None):
         """
         Download the GKI Salatiga+ main carousel Zip file from the GitHub repo.
         :param auto_extract: whether to automatically extract the zip file upon successful download.
         :param supress_download: whether to only return the downloaded path without actually downloading any zip file.
+        :param session: (optional) the pooled HTTP session to download with.
         :return: the local path to the downloaded carousel zip file.
         """
         download_url = self.CAROUSEL_ZIP_URL
         saved_file_path = self.saved_carousel_loc
 
-        # Before all else, remove all files in the carousel extract directory in order to conserve space.
-        shutil.rmtree(self.ASSETS_PATH_CAROUSEL, ignore_errors=True)
+        # Ensures the carousel extract directory exists.
         os.makedirs(self.ASSETS_PATH_CAROUSEL, exist_ok=True)
 
         # Saving/downloading the zip file.
         if not supress_download:
-            urllib.request.urlretrieve(download_url, saved_file_path)
-            Lg('lib.assets.AppAssets.get_carousel', f'Successfully downloaded: {download_url}!')
+            if global_schema.http_cache.download(download_url, saved_file_path, session):
+                Lg('lib.assets.AppAssets.get_carousel', f'Successfully downloaded: {download_url}!')
 
-        # Unzipping the data.
+        # Unzipping the data, only writing the members that have changed.
         if auto_extract:
             Lg('lib.assets.AppAssets.get_carousel', f'Extracting zip file: {saved_file_path}!')
-            with ZipFile(saved_file_path, 'r') as z:
-                z.extractall(self.ASSETS_PATH_CAROUSEL)
+            n_written, n_deleted = self.extract_carousel_zip(saved_file_path)
+            Lg('lib.assets.AppAssets.get_carousel', f'Extracted {n_written} and removed {n_deleted} carousel files.')
+            if n_written > 0 or n_deleted > 0:
+                global_schema.app_db.bump_revision('carousel')
 
         # Return the carousel zip local path.
         return saved_file_path
 
-    def get_gallery(self, supress_download: bool = False):
+    def extract_carousel_zip(self, zip_path: str):
+        """
+        Incrementally extract the carousel zip file into the carousel assets directory.
+        A member is only written if the file on disk differs from it in size or CRC32 checksum,
+        and only the files no longer present in the zip file are deleted.
+        :param zip_path: the local path to the carousel zip file.
+        :return: the number of written files and the number of deleted files.
+        """
+        extract_dir = os.path.abspath(self.ASSETS_PATH_CAROUSEL)
+        n_written = 0
+        n_deleted = 0
+
+        # The absolute paths of every file member of the zip file.
+        member_paths = set()
+
+        with ZipFile(zip_path, 'r') as z:
+            for info in z.infolist():
+                if info.is_dir():
+                    continue
+
+                target = os.path.abspath(os.path.join(extract_dir, info.filename))
+                member_paths.add(target)
+
+                # Skip the members which are identical to the file on disk.
+                if os.path.isfile(target) and os.path.getsize(target) == info.file_size:
+                    if self.get_file_crc32(target) == info.CRC:
+                        continue
+
+                z.extract(info, extract_dir)
+                n_written += 1
+
+        # Removing the orphaned files, except the carousel zip file itself.
+        # Any unfinished download of the zip file is also kept, since it may still be in progress.
+        keep_path = os.path.abspath(zip_path)
+        for root, dirs, files in os.walk(extract_dir, topdown=False):
+            for f in files:
+                path = os.path.abspath(os.path.join(root, f))
+                is_zip = path == keep_path or (
+                    path.startswith(keep_path + '.') and path.endswith(global_schema.http_cache.TEMP_SUFFIX))
+                if path not in member_paths and not is_zip:
+                    os.remove(path)
+                    n_deleted += 1
+
+            # Removing the directories left empty.
+            if root != extract_dir and len(os.listdir(root)) == 0:
+                os.rmdir(root)
+
+        return n_written, n_deleted
+
+    @staticmethod
+    def get_file_crc32(path: str):
+        """
+        Compute the CRC32 checksum of a local file, as stored in zip file headers.
+        :param path: the local file path.
+        :return: the unsigned 32-bit CRC32 checksum.
+        """
+        crc = 0
+        with open(path, 'rb') as fi:
+            for chunk in iter(lambda: fi.read(1024 * 1024), b''):
+                crc = zlib.crc32(chunk, crc)
+        return crc & 0xFFFFFFFF
+
+    @staticmethod
+    def get_zip_compression(path: str):
+        """
+        Determine the zip compression method of a file, based on its extension.
+        :param path: the file path or zip arcname.
+        :return: ZIP_STORED for already-compressed images, ZIP_DEFLATED otherwise.
+        """
+        if os.path.splitext(path)[1].lower() in AppAssets.PRECOMPRESSED_EXTENSIONS:
+            return ZIP_STORED
+        return ZIP_DEFLATED
+
+    def get_gallery(self, supress_download: bool = False, session: requests.Session = None):
         """
         Download the GKI Salatiga+ main gallery JSON file from the GitHub repo.
         :param supress_download: whether to only return the downloaded path without actually downloading any file.
+        :param session: (optional) the pooled HTTP session to download with.
         :return: the local path to the downloaded gallery JSON file.
         """
+        # The single gallery JSON file is still read until the sharded gallery has been saved for the first time.
+        if self.is_gallery_sharded():
+            index_path = self.get_gallery_shards(supress_download, session)
+            if index_path is not None:
+                return index_path
+
         download_url = self.GALLERY_JSON_URL
         saved_file_path = self.saved_gallery_loc
 
         # Saving/downloading the JSON file.
         if not supress_download:
-            urllib.request.urlretrieve(download_url, saved_file_path)
-            Lg('lib.assets.AppAssets.get_gallery', f'Successfully downloaded: {download_url}!')
+            if global_schema.http_cache.download(download_url, saved_file_path, session):
+                Lg('lib.assets.AppAssets.get_gallery', f'Successfully downloaded: {download_url}!')
 
         # Ensures file exists.
         if not os.path.isfile(saved_file_path):
@@ -198,66 +381,99 @@ class AppAssets(object):
         # Parse the JSON.
         with open(saved_file_path, 'r') as fi:
             j = json.load(fi)
+
+        # The edits saved while the gallery was sharded are migrated back into the single file.
+        index = self.read_local_gallery_index()
+        if index is not None and index['meta']['update-count'] > j['meta']['update-count']:
+            Lg('lib.assets.AppAssets.get_gallery', 'The sharded gallery is newer. Migrating it into the single file ...')
+            self.gallery_index = index
+            self.gallery = dict(ShardedGallery(self.saved_gallery_shard_dir, list(index['shards'].keys())).items())
+            self.gallery_meta = index['meta']
+            self.save_local_gallery()
+            return saved_file_path
+
+        if j['gallery'] != self.gallery:
+            global_schema.app_db.bump_revision('gallery')
         self.gallery = j['gallery']
         self.gallery_meta = j['meta']
 
         # Return the carousel zip local path.
         return saved_file_path
 
+    def get_gallery_shards(self, supress_download: bool = False, session: requests.Session = None):
+        """
+        Download the GKI Salatiga+ gallery index from the GitHub repo, along with the per-year shards which have
+        changed since they were last downloaded. The shards are only parsed upon their first access.
+        :param supress_download: whether to only return the downloaded path without actually downloading any file.
+        :param session: (optional) the pooled HTTP session to download with.
+        :return: the local path to the downloaded gallery index file, or None if the gallery has never been sharded.
+        """
+        saved_file_path = self.saved_gallery_index_loc
+
+        # Saving/downloading the index file.
+        if not supress_download:
+            try:
+                if global_schema.http_cache.download(self.GALLERY_INDEX_URL, saved_file_path, session):
+                    Lg('lib.assets.AppAssets.get_gallery_shards', f'Successfully downloaded: {self.GALLERY_INDEX_URL}!')
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                Lg('lib.assets.AppAssets.get_gallery_shards', 'The sharded gallery has not been published yet.')
+
+        # Ensures file exists.
+        if not os.path.isfile(saved_file_path):
+            return None
+
+        # Parse the JSON.
+        with open(saved_file_path, 'r') as fi:
+            j = json.load(fi)
+
+        # Only the shards whose local copy differs from the one listed in the index are downloaded.
+        if not supress_download:
+            for year, shard in j['shards'].items():
+                filename = ShardedGallery.get_shard_filename(year)
+                path = self.saved_gallery_shard_dir + os.sep + filename
+                if os.path.isfile(path) and GitDataCommitter.get_file_blob_sha(path) == shard['sha']:
+                    continue
+
+                download_url = self.GALLERY_SHARD_URL + '/' + filename
+                if global_schema.http_cache.download(download_url, path, session):
+                    Lg('lib.assets.AppAssets.get_gallery_shards', f'Successfully downloaded: {download_url}!')
+
+        # The edits saved into the single file while the gallery was not sharded are migrated into the shards.
+        # The single file is only parsed if it has been written after the index.
+        if (os.path.isfile(self.saved_gallery_loc)
+                and os.path.getmtime(self.saved_gallery_loc) > os.path.getmtime(saved_file_path)):
+            with open(self.saved_gallery_loc, 'r') as fi:
+                k = json.load(fi)
+            if k['meta']['update-count'] > j['meta']['update-count']:
+                Lg('lib.assets.AppAssets.get_gallery_shards', 'The single gallery file is newer. Migrating it ...')
+                self.gallery_index = j
+                self.gallery = k['gallery']
+                self.gallery_meta = k['meta']
+                self.save_local_gallery_shards()
+                return saved_file_path
+
+        if j != self.gallery_index:
+            global_schema.app_db.bump_revision('gallery')
+        self.gallery_index = j
+        self.gallery = ShardedGallery(self.saved_gallery_shard_dir, list(j['shards'].keys()))
+        self.gallery_meta = j['meta']
+
+        # Return the index local path.
+        return saved_file_path
+
     def get_gdrive_folder_list(self, folder_id: str = '', only_first_page: bool = True):
         """
         Enlist file contents of a give Google Drive folder's ID.
         :param folder_id: the folder ID to search for files.
-        :param only_first_page: whether to enlist the first 100 files or all files in a GDrive folder.
+        :param only_first_page: whether to enlist the first page of files or all files in a GDrive folder.
         :return: generic Google Drive API JSON response.
         """
         try:
-            # Parsing the token as the API credential.
-            token_json_location = global_schema.prefs.JSON_GOOGLE_ACCOUNT_SERVICE_KEY
-            creds = Credentials.from_authorized_user_file(token_json_location, self.GOOGLE_DRIVE_SCOPES)
-
-            # If the credential has expired, refresh it.
-            if creds.expired and creds.refresh_token:
-                Lg('AppAssets.get_gdrive_folder_list',
-                   'The Google Drive OAUTH2.0 credential is expired. Refreshing now ...')
-                creds.refresh(Request())
-                # Save the refreshed credentials for the next run
-                with open(token_json_location, 'w') as token:
-                    token.write(creds.to_json())
-
-            # Attempt to upload the requested file to Google Drive.
-            # Error-catching is done at level of the method which called this function.
-            service = build('drive', 'v3', credentials=creds)
-
-            # Return data fields that we desire.
-            # SOURCE: https://developers.google.com/drive/api/reference/rest/v3/files
-            fields = 'nextPageToken, files(id, name, createdTime, mimeType)'
-
-            # The page token.
-            page_token = None
-
-            # Stores all items from all pages.
-            all_items = []
-
-            # Call the Drive v3 API to upload a file
-            # SOURCE: https://www.perplexity.ai/search/how-to-obtain-photo-thumbnail-pQkR8AzvRG6uEhqSP.ug3Q
-            # SOURCE: https://www.perplexity.ai/search/google-drive-thumbnaillink-exp-38WMfnivSXmCrgzU0QUgdA
-            while True:
-                results = service.files().list(
-                    q=f"'{folder_id}' in parents",
-                    fields=fields,
-                    pageToken=page_token
-                ).execute()
-                items = results.get('files', [])
-
-                # Appending to all items.
-                all_items.extend(items)
-
-                # Go to next page.
-                page_token = results.get('nextPageToken', None)
-                if page_token is None or only_first_page:
-                    break
-
+            all_items, is_complete = self.list_gdrive_files(
+                folder_id, fields='id, name, createdTime, mimeType', only_first_page=only_first_page
+            )
             return all_items, True, 'Google Drive folder content sync successful!'
 
         except ServerNotFoundError as e:
@@ -275,10 +491,215 @@ class AppAssets(object):
             Lg('AppAssets.get_gdrive_folder_list', msg)
             return [], False, msg
 
-    def get_main_qris(self, supress_download: bool = False):
+    def list_gdrive_files(self, folder_id: str, fields: str, extra_query: str = '', only_first_page: bool = False):
+        """
+        List the files of a Google Drive folder, using the largest page size allowed by the Drive API. [3]
+        Error-catching is done at level of the method which called this function.
+        :param folder_id: the folder ID to search for files.
+        :param fields: the file fields to return, e.g., 'id, name'. The fewer, the smaller the response.
+        :param extra_query: (optional) additional search terms, joined to the folder query with "and".
+        :param only_first_page: whether to stop after the first page of files.
+        :return: the list of files, and whether the list is complete (i.e., no page has been left out).
+        """
+        service = global_schema.google_api.get_service('drive', 'v3')
+
+        # Filtering on the server, so that the unwanted files are never transferred.
+        query = f"'{folder_id}' in parents and trashed = false"
+        if extra_query != '':
+            query += f' and ({extra_query})'
+
+        # The page token.
+        page_token = None
+
+        # Stores all items from all pages.
+        all_items = []
+
+        # Call the Drive v3 API to list the files.
+        # SOURCE: https://www.perplexity.ai/search/how-to-obtain-photo-thumbnail-pQkR8AzvRG6uEhqSP.ug3Q
+        # SOURCE: https://www.perplexity.ai/search/google-drive-thumbnaillink-exp-38WMfnivSXmCrgzU0QUgdA
+        while True:
+            results = service.files().list(
+                q=query,
+                fields=f'nextPageToken, files({fields})',
+                pageSize=self.GDRIVE_PAGE_SIZE,
+                pageToken=page_token
+            ).execute()
+
+            # Appending to all items.
+            all_items.extend(results.get('files', []))
+
+            # Go to next page.
+            page_token = results.get('nextPageToken', None)
+            if page_token is None or only_first_page:
+                break
+
+        return all_items, page_token is None
+
+    @staticmethod
+    def merge_gdrive_photos(photos: list, changed_files: list, remaining_ids: set = None):
+        """
+        Merge the new and changed Google Drive images into an album's existing photo list.
+        :param photos: the album's existing photo list, each item having the keys "id", "name", and "date".
+        :param changed_files: the Google Drive files created or modified since the album's last update.
+        :param remaining_ids: (optional) the IDs of every image still in the folder. Photos not in it are removed.
+            Pass None when this is not known, so that no photo is removed.
+        :return: the merged photo list, the number of added photos, and the number of removed photos.
+        """
+        merged = [a for a in photos if remaining_ids is None or a['id'] in remaining_ids]
+        n_removed = len(photos) - len(merged)
+
+        # Updating the changed photos in place and appending the new ones.
+        index = {a['id']: i for i, a in enumerate(merged)}
+        n_added = 0
+        for b in changed_files:
+            c = {
+                'id': b['id'],
+                'name': b['name'],
+                'date': b['createdTime'].split('T')[0]
+            }
+            if c['id'] in index:
+                merged[index[c['id']]] = c
+            else:
+                index[c['id']] = len(merged)
+                merged.append(c)
+                n_added += 1
+
+        return merged, n_added, n_removed
+
+    def sync_gdrive_album(self, album: dict, only_first_page: bool = True, detect_removals: bool = False):
+        """
+        Incrementally synchronize a gallery album's photo list with its Google Drive folder.
+        Only the images created or modified since the album's last update are transferred in full.
+        Removed images are only detected on a full synchronization, from a listing of every image ID in the folder.
+        :param album: the album's gallery JSON node, having the keys "folder_id", "last_update", and "photos".
+        :param only_first_page: whether to only enlist the first page of images in the Google Drive folder.
+        :param detect_removals: whether to also list every image in the folder (regardless of "only_first_page"),
+            so that the photos deleted from Google Drive are removed from the album.
+        :return: the synchronized photo list, the success status, and the log message.
+        """
+        try:
+            folder_id = album['folder_id']
+            image_query = "mimeType contains 'image/'"
+
+            if album['last_update'] == '' or len(album['photos']) == 0:
+                # Never synchronized before. Fetching everything.
+                changed_files, _ = self.list_gdrive_files(
+                    folder_id, self.GDRIVE_PHOTO_FIELDS, image_query, only_first_page)
+                photos, n_added, n_removed = self.merge_gdrive_photos([], changed_files)
+                photo_files = changed_files
+
+            else:
+                # The last update is a local date, so one extra day is included to cover any timezone difference.
+                since = dt.strptime(album['last_update'], '%Y-%m-%d') - timedelta(days=1)
+                since = since.strftime('%Y-%m-%dT%H:%M:%S')
+                changed_files, _ = self.list_gdrive_files(
+                    folder_id, self.GDRIVE_PHOTO_FIELDS,
+                    f"{image_query} and (createdTime > '{since}' or modifiedTime > '{since}')", only_first_page
+                )
+
+                # The remaining images are only listed to detect removals (on a full synchronization),
+                # or to backfill the placeholders which some of the existing photos still lack.
+                # The placeholder fields are only listed in the latter case.
+                is_precomputed = all('blurhash' in a for a in album['photos'])
+                remaining_files, remaining_ids = [], None
+                if detect_removals:
+                    remaining_files, _ = self.list_gdrive_files(
+                        folder_id, 'id' if is_precomputed else self.GDRIVE_PHOTO_FIELDS, image_query, False)
+                    remaining_ids = set(a['id'] for a in remaining_files)
+                elif not is_precomputed:
+                    remaining_files, _ = self.list_gdrive_files(
+                        folder_id, self.GDRIVE_PHOTO_FIELDS, image_query, only_first_page)
+
+                photos, n_added, n_removed = self.merge_gdrive_photos(album['photos'], changed_files, remaining_ids)
+                photo_files = changed_files if is_precomputed else changed_files + remaining_files
+
+            n_precomputed = self.precompute_gdrive_photos(photos, photo_files)
+
+            msg = (f'Google Drive album sync successful! {n_added} photo(s) added, {n_removed} photo(s) removed, '
+                   f'{n_precomputed} placeholder(s) updated.')
+            Lg('AppAssets.sync_gdrive_album', msg)
+            return photos, True, msg
+
+        except ServerNotFoundError as e:
+            msg = f'Error detected. Looks like your internet is down: {e}'
+            Lg('AppAssets.sync_gdrive_album', msg)
+            return [], False, msg
+
+        except TransportError as e:
+            msg = f'Cannot resolve authenticator domain: {e}'
+            Lg('AppAssets.sync_gdrive_album', msg)
+            return [], False, msg
+
+        except Exception as e:
+            msg = f'Unknown error detected: {e}'
+            Lg('AppAssets.sync_gdrive_album', msg)
+            return [], False, msg
+
+    def sync_gdrive_albums(self, albums: list, only_first_page: bool = True, progress_callback=None,
+                           detect_removals: bool = False):
+        """
+        Synchronize several gallery albums with their Google Drive folders concurrently.
+        :param albums: the albums' gallery JSON nodes to synchronize.
+        :param only_first_page: whether to only enlist the first page of images in each Google Drive folder.
+        :param progress_callback: (optional) a function receiving the progress value (0-100) and a status message
+            each time an album is done.
+        :param detect_removals: whether to remove the photos deleted from each Google Drive folder.
+            See "sync_gdrive_album".
+        :return: the list of (photo list, success status, log message) tuples, in the same order as the albums.
+        """
+        results = [None] * len(albums)
+
+        with ThreadPoolExecutor(max_workers=self.GDRIVE_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self.sync_gdrive_album, a, only_first_page, detect_removals): i
+                for i, a in enumerate(albums)
+            }
+
+            for n, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                results[i] = future.result()
+
+                msg = f'({n}/{len(albums)}) Synchronized the album: {albums[i]["title"]}'
+                Lg('AppAssets.sync_gdrive_albums', msg)
+                if progress_callback is not None:
+                    progress_callback(round(100 * n / len(albums)), msg)
+
+        return results
+
+    def get_gdrive_photo_info(self, photo_file: dict):
+        """
+        Obtain the dimensions and the placeholder of a Google Drive image, computed from its small thumbnail. [4]
+        :param photo_file: the Google Drive file, listed with GDRIVE_PHOTO_FIELDS.
+        :return: the dict with the keys "width", "height", and "blurhash".
+        """
+        def download_thumbnail():
+            # Requesting a thumbnail of the given size instead of the default one.
+            url = re.sub(r'=s\d+$', '', photo_file['thumbnailLink']) + f'=s{self.GDRIVE_THUMBNAIL_SIZE}'
+            token = global_schema.google_api.get_user_credentials().token
+            r = global_schema.http_client.get(url, headers={'Authorization': f'Bearer {token}'})
+            r.raise_for_status()
+            return r.content
+
+        info = global_schema.image_placeholders.get_info(
+            photo_file['id'], photo_file.get('md5Checksum', ''), download_thumbnail, save=False
+        )
+
+        # The thumbnail is downscaled, so the photo's actual dimensions are taken from its metadata instead.
+        meta = photo_file.get('imageMediaMetadata', {})
+        if 'width' in meta and 'height' in meta:
+            info['width'], info['height'] = meta['width'], meta['height']
+
+            # The photo is displayed rotated by 90 or 270 degrees.
+            if meta.get('rotation', 0) in (1, 3):
+                info['width'], info['height'] = info['height'], info['width']
+
+        return info
+
+    def get_main_qris(self, supress_download: bool = False, session: requests.Session = None):
         """
         Download the app's main QRIS code image for offertory from the GitHub source.
         :param supress_download: whether we should not re-download the QRIS image, but instead return its local path.
+        :param session: (optional) the pooled HTTP session to download with.
         :return: the local path to the downloaded QRIS image.
         """
         download_url = self.QRIS_IMAGE_URL
@@ -287,16 +708,18 @@ class AppAssets(object):
 
         # Saving/downloading the post image.
         if not supress_download:
-            urllib.request.urlretrieve(download_url, saved_file_path)
-            Lg('lib.assets.AppAssets.get_main_qris', f'Successfully downloaded: {download_url}!')
+            if global_schema.http_cache.download(download_url, saved_file_path, session):
+                global_schema.app_db.bump_revision('qris')
+                Lg('lib.assets.AppAssets.get_main_qris', f'Successfully downloaded: {download_url}!')
 
         # Return the main QRIS local path.
         return saved_file_path
 
-    def get_static(self, supress_download: bool = False):
+    def get_static(self, supress_download: bool = False, session: requests.Session = None):
         """
         Download the GKI Salatiga+ static JSON file from the GitHub repo.
         :param supress_download: whether to only return the downloaded path without actually downloading any file.
+        :param session: (optional) the pooled HTTP session to download with.
         :return: the local path to the downloaded static JSON file.
         """
         download_url = self.STATIC_JSON_URL
@@ -304,8 +727,8 @@ class AppAssets(object):
 
         # Saving/downloading the JSON file.
         if not supress_download:
-            urllib.request.urlretrieve(download_url, saved_file_path)
-            Lg('lib.assets.AppAssets.get_static', f'Successfully downloaded: {download_url}!')
+            if global_schema.http_cache.download(download_url, saved_file_path, session):
+                Lg('lib.assets.AppAssets.get_static', f'Successfully downloaded: {download_url}!')
 
         # Ensures file exists.
         if not os.path.isfile(saved_file_path):
@@ -314,6 +737,8 @@ class AppAssets(object):
         # Parse the JSON.
         with open(saved_file_path, 'r') as fi:
             j = json.load(fi)
+        if j['static'] != self.static:
+            global_schema.app_db.bump_revision('static')
         self.static = j['static']
         self.static_meta = j['meta']
 
@@ -323,6 +748,124 @@ class AppAssets(object):
         # Return the carousel zip local path.
         return saved_file_path
 
+    def read_local_gallery_index(self):
+        """
+        Read the local gallery index, if the gallery has ever been sharded.
+        :return: the gallery index dict, or None if there is no local index.
+        """
+        if not os.path.isfile(self.saved_gallery_index_loc):
+            return None
+        with open(self.saved_gallery_index_loc, 'r') as fi:
+            return json.load(fi)
+
+    def is_gallery_sharded(self):
+        """
+        Whether the gallery is stored as an index plus one JSON file per year, instead of one single JSON file.
+        :return: True if the gallery is sharded per year.
+        """
+        return self.prefs.settings['gallery_sharded'] == 1
+
+    def ingest_carousel_image(self, source_path: str, dest_directory: str, prefix: str, asset_type: str):
+        """
+        Store an image picked by the user into a carousel item's directory, downscaled and re-encoded
+        so that the carousel zip downloaded by every app user stays small.
+        An image which is already stored in the directory (i.e., when editing an item) is kept as it is,
+        so that it does not lose quality by being re-encoded over and over.
+        :param source_path: the image picked by the user.
+        :param dest_directory: the carousel item's directory.
+        :param prefix: the stored file name's prefix, e.g., 'banner_'.
+        :param asset_type: the kind of image asset, i.e., 'banner' or 'poster'.
+        :return: the stored image's file name.
+        """
+        if os.path.dirname(os.path.abspath(source_path)) == os.path.abspath(dest_directory):
+            return os.path.basename(source_path)
+
+        optimized_path = global_schema.image_optimizer.optimize(
+            source_path, asset_type, self.prefs.settings['image_optimize_format'],
+            self.prefs.settings['image_optimize_quality']
+        )
+
+        dest_filename = prefix + str(time.time_ns()) + os.path.splitext(optimized_path)[1]
+        shutil.copyfile(optimized_path, dest_directory + os.sep + dest_filename)
+        return dest_filename
+
+    def precompute_carousel_images(self, carousel: dict):
+        """
+        Add the dimensions and the BlurHash placeholder of every banner and poster to the carousel JSON schema,
+        computed from the local carousel files. Unchanged files are not read again.
+        :param carousel: the carousel JSON dict, updated in place.
+        :return: nothing.
+        """
+        for a in carousel.keys():
+            # The current node.
+            b = carousel[a]
+
+            images = {'banner': b['banner']}
+            if b['type'] == 'poster':
+                images['poster'] = b['poster-image']
+
+            for prefix, filename in images.items():
+                path = self.ASSETS_PATH_CAROUSEL + os.sep + 'carousel' + os.sep + a + os.sep + filename
+                if not os.path.isfile(path):
+                    continue
+
+                def read_image():
+                    with open(path, 'rb') as fi:
+                        return fi.read()
+
+                try:
+                    info = global_schema.image_placeholders.get_info(
+                        'carousel/' + a + '/' + filename, str(self.get_file_crc32(path)), read_image, save=False
+                    )
+                except ValueError as e:
+                    Lg('lib.assets.AppAssets.precompute_carousel_images', f'Skipping {path}: {e}')
+                    continue
+
+                b[prefix + '-width'] = info['width']
+                b[prefix + '-height'] = info['height']
+                b[prefix + '-blurhash'] = info['blurhash']
+
+                # Dropping the bulky base64 thumbnail which used to be stored instead of the BlurHash.
+                b.pop(prefix + '-placeholder', None)
+
+        global_schema.image_placeholders.save()
+
+    def precompute_gdrive_photos(self, photos: list, photo_files: list):
+        """
+        Add the dimensions and the BlurHash placeholder of the given Google Drive images to an album's photo list.
+        Only the photos still lacking a placeholder (i.e., the new, changed, or never precomputed ones) are updated.
+        A photo whose placeholder cannot be computed is left without one, so that it is retried on the next sync.
+        :param photos: the album's photo list. The updated photos are replaced by updated copies.
+        :param photo_files: the Google Drive files listed with GDRIVE_PHOTO_FIELDS.
+        :return: the number of photos updated.
+        """
+        index = {a['id']: i for i, a in enumerate(photos)}
+        targets = {
+            a['id']: a for a in photo_files
+            if a['id'] in index and 'blurhash' not in photos[index[a['id']]] and 'thumbnailLink' in a
+        }
+        if len(targets) == 0:
+            return 0
+
+        n_updated = 0
+        with ThreadPoolExecutor(max_workers=self.PLACEHOLDER_MAX_WORKERS) as executor:
+            futures = {executor.submit(self.get_gdrive_photo_info, b): a for a, b in targets.items()}
+
+            for future in as_completed(futures):
+                i = index[futures[future]]
+                try:
+                    photo = dict(photos[i], **future.result())
+
+                    # Dropping the bulky base64 thumbnail which used to be stored instead of the BlurHash.
+                    photo.pop('placeholder', None)
+                    photos[i] = photo
+                    n_updated += 1
+                except Exception as e:
+                    Lg('AppAssets.precompute_gdrive_photos', f'Skipping the photo {photos[i]["name"]}: {e}')
+
+        global_schema.image_placeholders.save()
+        return n_updated
+
     def push_assets(self, anim_window: ScreenLoadingAnimation = None):
         """
         Push all assets to the GitHub repo, with regard to file changes to save bandwith.
@@ -369,6 +912,49 @@ class AppAssets(object):
             Lg('lib.assets.AppAssets.push_assets', msg)
             return False, {}, msg
 
+    def stage_assets(self, committer: GitDataCommitter, anim_window: ScreenLoadingAnimation = None):
+        """
+        Stage the changed assets into a single-commit batch instead of pushing them one by one.
+        :param committer: the Git Data API committer that will publish the staged files.
+        :param anim_window: the loading screen animator to prevent screen freezing during operations.
+        :return: nothing.
+        """
+        if self.do_upload_main_qris:
+            msg = f'Staging the main QRIS image ...'
+            anim_window.set_prog_msg(10, msg)
+            Lg('lib.assets.AppAssets.stage_assets', msg)
+            committer.stage_file(self.QRIS_IMAGE_PATH, self.saved_qris_loc)
+
+        if self.do_upload_carousel:
+            msg = f'Staging the carousel posters ...'
+            anim_window.set_prog_msg(20, msg)
+            Lg('lib.assets.AppAssets.stage_assets', msg)
+            committer.stage_file(self.CAROUSEL_ZIP_PATH, self.build_carousel_zip())
+
+        if self.do_upload_gallery and self.is_gallery_sharded() and len(self.gallery_index) > 0:
+            msg = f'Staging the gallery albums ...'
+            anim_window.set_prog_msg(25, msg)
+            Lg('lib.assets.AppAssets.stage_assets', msg)
+
+            # The shards identical to the remote ones are dropped by the committer before anything is uploaded.
+            for year in self.gallery_index['shards'].keys():
+                filename = ShardedGallery.get_shard_filename(year)
+                committer.stage_file(
+                    self.GALLERY_SHARD_PATH + '/' + filename, self.saved_gallery_shard_dir + os.sep + filename, True)
+            committer.stage_file(self.GALLERY_INDEX_PATH, self.saved_gallery_index_loc, True)
+
+        elif self.do_upload_gallery:
+            msg = f'Staging the gallery albums ...'
+            anim_window.set_prog_msg(25, msg)
+            Lg('lib.assets.AppAssets.stage_assets', msg)
+            committer.stage_file(self.GALLERY_JSON_PATH, self.saved_gallery_loc, True)
+
+        if self.do_upload_static:
+            msg = f'Staging the static contents ...'
+            anim_window.set_prog_msg(30, msg)
+            Lg('lib.assets.AppAssets.stage_assets', msg)
+            committer.stage_file(self.STATIC_JSON_PATH, self.saved_static_loc, True)
+
     def push_carousel(self):
         """
         Pushing the carousel banners.
@@ -388,58 +974,21 @@ class AppAssets(object):
         # z.write('/nadi/data/raw/downloads/maxresdefault.jpg')
         # z.close()
 
-        # Determining the location of the zip file.
-        zip_loc = self.saved_carousel_loc
-
         # Zipping the carousel banners.
-        with ZipFile(zip_loc, mode='w', compression=8) as zo:
-            for a in self.db['carousel'].keys():
-                # The current node.
-                b = self.db['carousel'][a]
-
-                # DEBUG.
-                # print('Really None? ', zo is None)
-                # print('WHY? ', zo, a)
-                # zo.write('/nadi/data/raw/downloads/maxresdefault.jpg')
-                # print('Really None? ', zo is None)
-
-                base = self.ASSETS_PATH_CAROUSEL + os.sep + 'carousel' + os.sep + a
-                zo.write(base + os.sep + b['banner'], arcname=('carousel' + os.sep + a + os.sep + b['banner']))
-
-                # Only applies to posters.
-                if b['type'] == 'poster':
-                    zo.write(
-                        base + os.sep + b['poster-image'],
-                        arcname=('carousel' + os.sep + a + os.sep + b['poster-image'])
-                    )
-
-        # Read the zip file.
-        with open(zip_loc, 'rb') as fi:
-            carousel_bytes = fi.read()
+        zip_loc = self.build_carousel_zip()
 
-        # Converting the zip file bytes into base64.
-        carousel_b64_data = base64.b64encode(carousel_bytes).decode('UTF-8')
+        # Skip the upload if the remote zip file is identical to the local one.
+        if GitDataCommitter.get_file_blob_sha(zip_loc) == latest_sha:
+            Lg('lib.assets.AppAssets.push_carousel', 'The carousel zip file has not changed. Skipping ...')
+            return
 
-        # DEBUG. Please always comment out.
-        # print(self.credentials)
-
-        # Preparing the push request header and payload data.
-        headers = {
-            'Authorization': f'Bearer {self.credentials["api_github"]}',
-            'Content-Type': 'application/json'
-        }
-        data_payload = {
-            'message': 'Manual carousel update from "Simon Petrus"',
-            'content': carousel_b64_data,
-            'branch': 'main',
-            'sha': latest_sha,
-            'path': self.CAROUSEL_ZIP_PATH
-        }
-
-        # Sending the http request.
+        # Streaming the zip file as base64 into the request body.
         msg = f'Uploading the carousel data payload ...'
         Lg('lib.assets.AppAssets.push_carousel', msg)
-        r = requests.put(self.CAROUSEL_ZIP_API, headers=headers, json=data_payload)
+        r = StreamingContentsUpload.put_file(
+            self.CAROUSEL_ZIP_API, self.credentials['api_github'], zip_loc, self.CAROUSEL_ZIP_PATH,
+            'Manual carousel update from "Simon Petrus"', latest_sha
+        )
 
         # DEBUG. Please comment out after use.
         # print(r.json())
@@ -453,6 +1002,11 @@ class AppAssets(object):
         Pushing the gallery JSON file.
         :return: nothing.
         """
+        # The sharded gallery is only pushed once it has been saved (or downloaded) at least once.
+        if self.is_gallery_sharded() and len(self.gallery_index) > 0:
+            self.push_gallery_shards()
+            return
+
         # Retrieving the latest SHA in order to detect changes and checkpoints.
         r = requests.get(self.GALLERY_JSON_API)
         latest_sha = r.json()['sha']
@@ -460,33 +1014,18 @@ class AppAssets(object):
         # DEBUG. Please comment out on production.
         # print(r.json())
 
-        # Read the image file.
-        with open(self.saved_gallery_loc, 'rb') as fi:
-            gallery_bytes = fi.read()
-
-        # Converting the file bytes into base64.
-        gallery_b64_data = base64.b64encode(gallery_bytes).decode('UTF-8')
-
-        # DEBUG. Please always comment out.
-        # print(self.credentials)
+        # Skip the upload if the remote file is identical to the local one.
+        if GitDataCommitter.get_file_blob_sha(self.saved_gallery_loc) == latest_sha:
+            Lg('lib.assets.AppAssets.push_gallery', 'The gallery JSON file has not changed. Skipping ...')
+            return
 
-        # Preparing the push request header and payload data.
-        headers = {
-            'Authorization': f'Bearer {self.credentials["api_github"]}',
-            'Content-Type': 'application/json'
-        }
-        data_payload = {
-            'message': 'Manual Gallery update from "Simon Petrus"',
-            'content': gallery_b64_data,
-            'branch': 'main',
-            'sha': latest_sha,
-            'path': self.GALLERY_JSON_PATH
-        }
-
-        # Sending the http request.
+        # Streaming the file as base64 into the request body.
         msg = f'Uploading the gallery JSON data payload ...'
         Lg('lib.assets.AppAssets.push_gallery', msg)
-        r = requests.put(self.GALLERY_JSON_API, headers=headers, json=data_payload)
+        r = StreamingContentsUpload.put_file(
+            self.GALLERY_JSON_API, self.credentials['api_github'], self.saved_gallery_loc, self.GALLERY_JSON_PATH,
+            'Manual Gallery update from "Simon Petrus"', latest_sha
+        )
 
         # DEBUG. Please comment out after use.
         # print(r.json())
@@ -495,6 +1034,54 @@ class AppAssets(object):
         msg = f'Pushing GKI Salatiga+ app gallery JSON file to main repository branch successful!'
         Lg('lib.database.AppDatabase.push_gallery', msg)
 
+    def push_gallery_shards(self):
+        """
+        Pushing the gallery shards which differ from the remote ones, then the gallery index.
+        The first failed upload stops the push, so that the index is only pushed once every shard is on the remote.
+        :return: nothing.
+        """
+        # Retrieving the latest SHA of every remote shard in one request. [5]
+        # Only a missing directory means that there is no remote shard yet.
+        r = requests.get(self.GALLERY_SHARD_API, headers={'Authorization': f'Bearer {self.credentials["api_github"]}'})
+        if r.status_code == 404:
+            remote_shas = {}
+        else:
+            r.raise_for_status()
+            remote_shas = {a['path']: a['sha'] for a in r.json()}
+
+        # The index is pushed last, so that it never lists a shard which has not been pushed yet.
+        files = [
+            self.GALLERY_SHARD_PATH + '/' + ShardedGallery.get_shard_filename(a)
+            for a in self.gallery_index['shards'].keys()
+        ]
+        files.append(self.GALLERY_INDEX_PATH)
+
+        n_pushed = 0
+        for repo_path in files:
+            local_path = self.saved_gallery_shard_dir + os.sep + os.path.split(repo_path)[1]
+
+            # Skip the upload if the remote file is identical to the local one.
+            if GitDataCommitter.get_file_blob_sha(local_path) == remote_shas.get(repo_path):
+                continue
+
+            # Streaming the file as base64 into the request body.
+            msg = f'Uploading the gallery shard: {repo_path} ...'
+            Lg('lib.assets.AppAssets.push_gallery_shards', msg)
+            r = StreamingContentsUpload.put_file(
+                self.GALLERY_SHARD_API + '/' + os.path.split(repo_path)[1], self.credentials['api_github'],
+                local_path, repo_path, 'Manual Gallery update from "Simon Petrus"', remote_shas.get(repo_path)
+            )
+
+            # A rejected API key is reported as such. Any other failure (e.g., a conflicting SHA) is raised as is.
+            if r.status_code in (401, 403):
+                raise InvalidPushCredentialError
+            r.raise_for_status()
+            n_pushed += 1
+
+        # Concluding logging.
+        msg = f'Pushed {n_pushed} changed gallery file(s) to main repository branch successfully!'
+        Lg('lib.assets.AppAssets.push_gallery_shards', msg)
+
     def push_qris(self):
         """
         Pushing the QRIS image.
@@ -507,33 +1094,18 @@ class AppAssets(object):
         # DEBUG. Please comment out on production.
         # print(r.json())
 
-        # Read the image file.
-        with open(self.saved_qris_loc, 'rb') as fi:
-            qris_bytes = fi.read()
-
-        # Converting the QRIS image bytes into base64.
-        qris_b64_data = base64.b64encode(qris_bytes).decode('UTF-8')
-
-        # DEBUG. Please always comment out.
-        # print(self.credentials)
-
-        # Preparing the push request header and payload data.
-        headers = {
-            'Authorization': f'Bearer {self.credentials["api_github"]}',
-            'Content-Type': 'application/json'
-        }
-        data_payload = {
-            'message': 'Manual QRIS update from "Simon Petrus"',
-            'content': qris_b64_data,
-            'branch': 'main',
-            'sha': latest_sha,
-            'path': self.QRIS_IMAGE_PATH
-        }
+        # Skip the upload if the remote file is identical to the local one.
+        if GitDataCommitter.get_file_blob_sha(self.saved_qris_loc) == latest_sha:
+            Lg('lib.assets.AppAssets.push_qris', 'The QRIS image has not changed. Skipping ...')
+            return
 
-        # Sending the http request.
+        # Streaming the file as base64 into the request body.
         msg = f'Uploading the QRIS data payload ...'
         Lg('lib.assets.AppAssets.push_qris', msg)
-        r = requests.put(self.QRIS_IMAGE_API, headers=headers, json=data_payload)
+        r = StreamingContentsUpload.put_file(
+            self.QRIS_IMAGE_API, self.credentials['api_github'], self.saved_qris_loc, self.QRIS_IMAGE_PATH,
+            'Manual QRIS update from "Simon Petrus"', latest_sha
+        )
 
         # DEBUG. Please comment out after use.
         # print(r.json())
@@ -554,33 +1126,18 @@ class AppAssets(object):
         # DEBUG. Please comment out on production.
         # print(r.json())
 
-        # Read the image file.
-        with open(self.saved_static_loc, 'rb') as fi:
-            static_bytes = fi.read()
-
-        # Converting the file bytes into base64.
-        static_b64_data = base64.b64encode(static_bytes).decode('UTF-8')
-
-        # DEBUG. Please always comment out.
-        # print(self.credentials)
-
-        # Preparing the push request header and payload data.
-        headers = {
-            'Authorization': f'Bearer {self.credentials["api_github"]}',
-            'Content-Type': 'application/json'
-        }
-        data_payload = {
-            'message': 'Manual static content update from "Simon Petrus"',
-            'content': static_b64_data,
-            'branch': 'main',
-            'sha': latest_sha,
-            'path': self.STATIC_JSON_PATH
-        }
+        # Skip the upload if the remote file is identical to the local one.
+        if GitDataCommitter.get_file_blob_sha(self.saved_static_loc) == latest_sha:
+            Lg('lib.assets.AppAssets.push_static', 'The static content JSON file has not changed. Skipping ...')
+            return
 
-        # Sending the http request.
+        # Streaming the file as base64 into the request body.
         msg = f'Uploading the static content JSON data payload ...'
         Lg('lib.assets.AppAssets.push_static', msg)
-        r = requests.put(self.STATIC_JSON_API, headers=headers, json=data_payload)
+        r = StreamingContentsUpload.put_file(
+            self.STATIC_JSON_API, self.credentials['api_github'], self.saved_static_loc, self.STATIC_JSON_PATH,
+            'Manual static content update from "Simon Petrus"', latest_sha
+        )
 
         # DEBUG. Please comment out after use.
         # print(r.json())
@@ -596,6 +1153,9 @@ class AppAssets(object):
         :param new_qris_path: the path to the QRIS path that will replace the existing one.
         :return: nothing.
         """
+        # The QR code must stay sharp, so it is only downscaled and stripped of its metadata, never lossily encoded.
+        new_qris_path = global_schema.image_optimizer.optimize(new_qris_path, 'qris', 'png')
+
         # Comparing the two bytes. [1]
         if not filecmp.cmp(self.saved_qris_loc, new_qris_path):
             self.do_upload_main_qris = True
@@ -609,6 +1169,8 @@ class AppAssets(object):
                 new_img_bytes = fi.read()
             with open(self.saved_qris_loc, 'wb') as fo:
                 fo.write(new_img_bytes)
+            global_schema.http_cache.forget(self.QRIS_IMAGE_URL)
+            global_schema.app_db.bump_revision('qris')
 
         else:
             Lg('lib.assets.AppAssets.queue_main_qris_change', 'Nothing interesting down here.')
@@ -619,6 +1181,14 @@ class AppAssets(object):
         Save the current state of the gallery JSON schema into the local file.
         :return: nothing.
         """
+        if self.is_gallery_sharded():
+            self.save_local_gallery_shards()
+            return
+
+        # A sharded gallery is read whole before being written back into one single file.
+        if isinstance(self.gallery, ShardedGallery):
+            self.gallery = dict(self.gallery.items())
+
         with open(self.saved_gallery_loc, 'w') as fo:
             # Preparing the JSON metadata.
             self.gallery_meta['update-count'] += 1
@@ -635,6 +1205,67 @@ class AppAssets(object):
             json.dump(a, fo, ensure_ascii=False, indent=4)
             Lg('lib.assets.AppAssets.save_local_gallery', f'Saved the gallery JSON file successfully!')
 
+        # Mark the gallery as changed.
+        global_schema.app_db.bump_revision('gallery')
+        global_schema.http_cache.forget(self.GALLERY_JSON_URL)
+
+    def save_local_gallery_shards(self):
+        """
+        Save the current state of the gallery JSON schema into the local index and per-year shard files.
+        Only the shards which have been accessed, and whose content has changed since, are written.
+        :return: nothing.
+        """
+        old_shards = self.gallery_index.get('shards', {})
+        shards = {}
+        n_written = 0
+
+        for year in self.gallery.keys():
+            path = self.saved_gallery_shard_dir + os.sep + ShardedGallery.get_shard_filename(year)
+
+            # A shard never read from the disk cannot have changed.
+            if isinstance(self.gallery, ShardedGallery) and not self.gallery.is_loaded(year) and year in old_shards:
+                shards[year] = old_shards[year]
+                continue
+
+            content = ShardedGallery.dump_shard(year, self.gallery[year])
+            sha = GitDataCommitter.get_blob_sha(content)
+            if year not in old_shards or old_shards[year]['sha'] != sha or not os.path.isfile(path):
+                with open(path + '.part', 'wb') as fo:
+                    fo.write(content)
+                os.replace(path + '.part', path)
+                global_schema.http_cache.forget(self.GALLERY_SHARD_URL + '/' + ShardedGallery.get_shard_filename(year))
+                n_written += 1
+
+            shards[year] = {
+                'path': self.GALLERY_SHARD_PATH + '/' + ShardedGallery.get_shard_filename(year),
+                'sha': sha,
+                'albums': len(self.gallery[year])
+            }
+
+        # Removing the shards of the deleted years.
+        for year in old_shards.keys():
+            path = self.saved_gallery_shard_dir + os.sep + ShardedGallery.get_shard_filename(year)
+            if year not in shards and os.path.isfile(path):
+                os.remove(path)
+
+        # Preparing the JSON metadata.
+        self.gallery_meta['update-count'] += 1
+        self.gallery_meta['last-update'] = round(time.time())
+        self.gallery_meta['last-actor'] = 'SIMON_PETRUS'
+
+        # Write/dump the index file, which lists the blob SHA of every shard.
+        self.gallery_index = {
+            'meta': self.gallery_meta,
+            'shards': shards
+        }
+        with open(self.saved_gallery_index_loc, 'w') as fo:
+            json.dump(self.gallery_index, fo, ensure_ascii=False, indent=4)
+        Lg('lib.assets.AppAssets.save_local_gallery_shards', f'Saved the gallery index and {n_written} changed shard(s)!')
+
+        # Mark the gallery as changed.
+        global_schema.app_db.bump_revision('gallery')
+        global_schema.http_cache.forget(self.GALLERY_INDEX_URL)
+
     def save_local_static(self):
         """
         Save the current state of the static content JSON schema into the local file.
@@ -656,5 +1287,9 @@ class AppAssets(object):
             json.dump(a, fo, ensure_ascii=False, indent=4)
             Lg('lib.assets.AppAssets.save_local_static', f'Saved the static content JSON file successfully!')
 
+        # Mark the static content as changed.
+        global_schema.app_db.bump_revision('static')
+        global_schema.http_cache.forget(self.STATIC_JSON_URL)
+
     def set_credentials(self, cred: dict):
         self.credentials = cred
@@ -0,0 +1,122 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Create or update file contents using the GitHub REST API
+    - https://docs.github.com/en/rest/repos/contents#create-or-update-file-contents
+    [2] Streaming uploads with the "requests" library
+    - https://requests.readthedocs.io/en/latest/user/advanced/#streaming-uploads
+"""
+import base64
+import io
+import json
+import os
+import requests
+
+
+class StreamingBase64Body(object):
+    """
+    A file-like JSON request body whose "content" field base64-encodes a file on the fly. [2]
+    Only one encoded chunk is held in memory at a time, instead of the whole file, its base64 copy, and its JSON dump.
+    """
+
+    # The number of raw bytes encoded at a time. It must be a multiple of 3,
+    # so that no base64 padding character is emitted in the middle of the stream.
+    ENCODE_CHUNK_SIZE = 3 * 64 * 1024
+
+    def __init__(self, fi, content_size: int, fields: dict):
+        """
+        :param fi: the binary file object to upload, positioned at its start.
+        :param content_size: the number of bytes in the file object.
+        :param fields: the other (small, non-empty) fields of the JSON body.
+        """
+        self.fi = fi
+
+        # Everything but the base64 content is small, so it is serialized by the JSON library as usual.
+        fields = json.dumps(fields)
+        self.prefix = (fields[:-1] + ', "content": "').encode('utf-8')
+        self.suffix = b'"}'
+
+        # The exact body size, so that the request is sent with a "Content-Length" header. [2]
+        self.length = len(self.prefix) + 4 * ((content_size + 2) // 3) + len(self.suffix)
+
+        self.chunks = iter(self)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        yield self.prefix
+        for chunk in iter(lambda: self.fi.read(self.ENCODE_CHUNK_SIZE), b''):
+            yield base64.b64encode(chunk)
+        yield self.suffix
+
+    def read(self, size: int = -1):
+        """
+        Return the next encoded chunk of the request body.
+        :param size: ignored. The body is always read one encoded chunk at a time.
+        :return: the next chunk, or an empty bytes object once the body is exhausted.
+        """
+        return next(self.chunks, b'')
+
+
+class StreamingContentsUpload(StreamingBase64Body):
+    """ A streamed request body of the GitHub Contents API, which creates or updates a single file. [1] """
+
+    def __init__(self, fi, content_size: int, repo_path: str, message: str, sha: str | None = None,
+                 branch: str = 'main'):
+        """
+        :param fi: the binary file object to upload, positioned at its start.
+        :param content_size: the number of bytes in the file object.
+        :param repo_path: the file path relative to the repo's root.
+        :param message: the commit message.
+        :param sha: the blob SHA of the remote file being replaced, or None if the file is new.
+        :param branch: the branch to commit into.
+        """
+        # The SHA must be left out (instead of being null) when creating a new file. [1]
+        fields = {'message': message, 'branch': branch, 'path': repo_path}
+        if sha is not None:
+            fields['sha'] = sha
+        super().__init__(fi, content_size, fields)
+
+    @staticmethod
+    def put_file(api_url: str, api_key: str, local_path: str, repo_path: str, message: str, sha: str | None = None):
+        """
+        Upload a local file through the GitHub Contents API without reading it whole into memory.
+        :param api_url: the Contents API end point of the file.
+        :param api_key: the GitHub API key.
+        :param local_path: the local file to upload.
+        :param repo_path: the file path relative to the repo's root.
+        :param message: the commit message.
+        :param sha: (optional) the blob SHA of the remote file being replaced. Omit it when creating a new file.
+        :return: the response of the request.
+        """
+        with open(local_path, 'rb') as fi:
+            body = StreamingContentsUpload(fi, os.path.getsize(local_path), repo_path, message, sha)
+            return requests.put(api_url, headers=StreamingContentsUpload.get_headers(api_key), data=body)
+
+    @staticmethod
+    def put_bytes(api_url: str, api_key: str, content: bytes, repo_path: str, message: str, sha: str | None = None):
+        """
+        Upload in-memory bytes through the GitHub Contents API without creating a base64 copy of them.
+        :param api_url: the Contents API end point of the file.
+        :param api_key: the GitHub API key.
+        :param content: the file content to upload.
+        :param repo_path: the file path relative to the repo's root.
+        :param message: the commit message.
+        :param sha: (optional) the blob SHA of the remote file being replaced. Omit it when creating a new file.
+        :return: the response of the request.
+        """
+        body = StreamingContentsUpload(io.BytesIO(content), len(content), repo_path, message, sha)
+        return requests.put(api_url, headers=StreamingContentsUpload.get_headers(api_key), data=body)
+
+    @staticmethod
+    def get_headers(api_key: str):
+        return {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        }
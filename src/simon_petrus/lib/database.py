@@ -19,7 +19,9 @@ import os
 import requests
 import time
 
+from lib.contents_upload import StreamingContentsUpload
 from lib.exceptions import InvalidPushCredentialError
+from lib.git_data import GitDataCommitter
 from lib.logger import Logger as Lg
 from loading_animation import ScreenLoadingAnimation
 import global_schema
@@ -38,6 +40,41 @@ class AppDatabase(object):
         self.is_db_valid = False
         self.prefs = global_schema.prefs
 
+        # The per-section change counter, used to detect which data section has changed.
+        self.revisions = {}
+
+    def bump_revision(self, *sections: str):
+        """
+        Mark the given data sections as changed, so that any cached view of them gets rebuilt.
+        :param sections: the data section names (e.g., 'agenda', 'gallery') whose revision will be incremented.
+        :return: nothing.
+        """
+        for a in sections:
+            self.revisions[a] = self.revisions.get(a, 0) + 1
+
+    def get_revision(self, section: str):
+        """
+        Obtain the current change counter of a given data section.
+        :param section: the data section name whose revision will be returned.
+        :return: the integer revision of the data section, zero if the section has never changed.
+        """
+        return self.revisions.get(section, 0)
+
+    def get_json_schema_string(self):
+        """
+        Read the local JSON schema file and serialize it into the string that will be pushed to the GitHub repo.
+        :return: the JSON schema as a string.
+        """
+        with open(global_schema.prefs.JSON_DATA_SCHEMA, 'r', encoding='utf-8') as fi:
+            j = json.load(fi)
+
+        # Merging the "meta" and "data" of the JSON schema.
+        '''j = {
+            'meta': self.db_meta,
+            'data': self.db
+        }'''
+        return json.dumps(j, ensure_ascii=False, indent=4)
+
     def load_json_schema(self):
         """
         If exists in the app's directory, parse the downloaded JSON schema as dict
@@ -50,9 +87,14 @@ class AppDatabase(object):
             with open(json_loc, 'r', encoding='utf-8') as fi:
                 try:
                     parsed_json = json.load(fi)
+
+                    # Only mark the sections whose content actually differs as changed.
+                    old_db = self.db
                     self.db = parsed_json['data']
                     self.db_meta = parsed_json['meta']
                     self.is_db_valid = True
+                    self.bump_revision(*[a for a in set(old_db.keys()) | set(self.db.keys())
+                                         if old_db.get(a) != self.db.get(a)])
                     Lg('lib.database.AppDatabase.load_json_schema',
                        f'Loaded cached JSON schema: {json_loc}')
                 except Exception as e:
@@ -67,9 +109,10 @@ class AppDatabase(object):
             # Fallback. Retrieve the latest JSON data if the local one is corrupt.
             self.refresh_json_schema()
 
-    def refresh_json_schema(self):
+    def refresh_json_schema(self, session: requests.Session = None):
         """
         Downloads the GKI Salatiga+ JSON schema from the remote source (GitHub repo).
+        :param session: (optional) the pooled HTTP session to download with.
         :return: True if download is successful.
         """
 
@@ -78,7 +121,13 @@ class AppDatabase(object):
 
         save_path = self.prefs.JSON_DATA_SCHEMA
         try:
-            r = requests.get(self.GITHUB_JSON_URL)
+            # Only download the JSON schema if it has changed since the last download.
+            r = global_schema.http_cache.fetch(self.GITHUB_JSON_URL, save_path, session)
+            if r is None:
+                Lg('lib.database.AppDatabase.refresh_json_schema', f'The local JSON schema is already current.')
+                self.load_json_schema()
+                return True
+
             j = r.json()
             with open(save_path, 'w', encoding='utf-8') as fo:
                 fo.write(base64.b64decode(j['content']).decode('utf-8'))
@@ -122,40 +171,26 @@ class AppDatabase(object):
             # print(r.json())
 
             # Assumes everything in the JSON file is in sync with the "db" property/variable.
-            with open(global_schema.prefs.JSON_DATA_SCHEMA, 'r', encoding='utf-8') as fi:
-                j = json.load(fi)
+            j_as_json_bytes = self.get_json_schema_string().encode('utf-8')
 
-            # Merging the "meta" and "data" of the JSON schema.
-            '''j = {
-                'meta': self.db_meta,
-                'data': self.db
-            }'''
-            j_as_json_string = json.dumps(j, ensure_ascii=False, indent=4)
+            # Skip the upload if the remote JSON schema is identical to the local one.
+            if GitDataCommitter.get_blob_sha(j_as_json_bytes) == latest_sha:
+                msg = f'The JSON schema has not changed. Nothing to upload!'
+                anim_window.set_prog_msg(100, msg)
+                Lg('lib.database.AppDatabase.push_json_schema', msg)
+                return True, r.json(), msg
 
             # DEBUG. Please comment out on production.
-            # print(j_as_json_string)
-
-            # Converting the current app's local JSON schema data into base64.
-            b64_json_content = base64.b64encode(bytes(j_as_json_string, 'UTF-8')).decode('UTF-8')
-
-            # Preparing the push request header and payload data.
-            headers = {
-                'Authorization': f'Bearer {self.credentials["api_github"]}',
-                'Content-Type': 'application/json'
-            }
-            data_payload = {
-                'message': commit_msg,
-                'content': b64_json_content,
-                'branch': 'main',
-                'sha': latest_sha,
-                'path': self.GITHUB_JSON_FILENAME
-            }
+            # print(j_as_json_bytes)
 
-            # Sending the http request.
+            # Streaming the JSON schema as base64 into the request body.
             msg = f'Uploading the JSON data payload ...'
             anim_window.set_prog_msg(80, msg)
             Lg('lib.database.AppDatabase.push_json_schema', msg)
-            r = requests.put(self.GITHUB_JSON_URL, headers=headers, json=data_payload)
+            r = StreamingContentsUpload.put_bytes(
+                self.GITHUB_JSON_URL, self.credentials['api_github'], j_as_json_bytes, self.GITHUB_JSON_FILENAME,
+                commit_msg, latest_sha
+            )
 
             # DEBUG. Please comment out after use.
             # print(json.dumps(r.json()))
@@ -184,6 +219,18 @@ class AppDatabase(object):
             Lg('lib.database.AppDatabase.push_json_schema', msg)
             return False, {}, msg
 
+    def stage_json_schema(self, committer: GitDataCommitter, anim_window: ScreenLoadingAnimation = None):
+        """
+        Stage the local JSON schema into a single-commit batch instead of pushing it on its own.
+        :param committer: the Git Data API committer that will publish the staged files.
+        :param anim_window: the loading screen animator to prevent screen freezing during operations.
+        :return: nothing.
+        """
+        msg = f'Staging the JSON schema ...'
+        anim_window.set_prog_msg(35, msg)
+        Lg('lib.database.AppDatabase.stage_json_schema', msg)
+        committer.stage_bytes(self.GITHUB_JSON_FILENAME, self.get_json_schema_string().encode('utf-8'), True)
+
     def save_local(self, updated_item: str = 'unspecified'):
         """
         Save the current state of the JSON schema into the local file.
@@ -206,3 +253,7 @@ class AppDatabase(object):
             # Write/dump the JSON file.
             json.dump(a, fo, ensure_ascii=False, indent=4)
             Lg('lib.database.AppDatabase.save_local', f'Saved JSON schema successfully!')
+
+        # Mark the updated item as changed.
+        self.bump_revision(updated_item)
+        global_schema.http_cache.forget(self.GITHUB_JSON_URL)
@@ -0,0 +1,114 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Implementing an LRU cache using OrderedDict
+    - https://docs.python.org/3/library/collections.html#ordereddict-examples-and-recipes
+"""
+from collections import OrderedDict
+
+from PyQt5 import QtWidgets
+
+import global_schema
+from lib.logger import Logger as Lg
+
+
+class FragmentRegistry(object):
+    """ Lazily builds the main screen's fragments and keeps the recently built ones in a bounded cache. """
+
+    # The maximum number of built fragments to keep in memory.
+    MAX_CACHED_FRAGMENTS = 5
+
+    def __init__(self, max_cached: int = MAX_CACHED_FRAGMENTS):
+        # The registered fragment factories, keyed by the fragment string.
+        self.factories = {}
+
+        # The data sections on which each registered fragment depends.
+        self.dependencies = {}
+
+        # The built fragments, ordered from the least to the most recently used. [1]
+        self.cache = OrderedDict()
+
+        self.max_cached = max_cached if max_cached > 0 else 1
+
+    def register(self, fragment_str: str, factory, sections: tuple = ()):
+        """
+        Register a fragment factory without building the fragment.
+        :param fragment_str: the fragment name, e.g., 'fragment_agenda'.
+        :param factory: a callable (usually the frame class) that builds the fragment's QWidget.
+        :param sections: the data section names (as tracked by "AppDatabase.revisions") that this fragment displays.
+        :return: nothing.
+        """
+        self.factories[fragment_str] = factory
+        self.dependencies[fragment_str] = tuple(sections)
+
+    def get(self, fragment_str: str):
+        """
+        Obtain the requested fragment, building it only if it has not been cached
+        or if any of its data sections has changed since it was built.
+        :param fragment_str: the fragment name to obtain.
+        :return: the fragment's QWidget.
+        """
+        signature = self.get_signature(fragment_str)
+
+        if fragment_str in self.cache:
+            fragment, cached_signature = self.cache[fragment_str]
+            if cached_signature == signature:
+                self.cache.move_to_end(fragment_str)
+                return fragment
+
+            # The underlying data has changed. Discard the stale fragment.
+            Lg('lib.fragment_registry.FragmentRegistry.get', f'Data changed, rebuilding: {fragment_str}')
+            self.discard(fragment_str)
+
+        # Building the fragment for the first time.
+        Lg('lib.fragment_registry.FragmentRegistry.get', f'Building the fragment: {fragment_str}')
+        fragment = self.factories[fragment_str]()
+        self.cache[fragment_str] = (fragment, signature)
+
+        # Evict the least recently used fragments, but never the one just built.
+        while len(self.cache) > self.max_cached:
+            self.discard(next(iter(self.cache)))
+
+        return fragment
+
+    def get_signature(self, fragment_str: str):
+        """
+        Compute the data signature of a fragment from the revisions of its data sections.
+        :param fragment_str: the fragment name whose signature will be computed.
+        :return: a tuple of section revisions.
+        """
+        return tuple(global_schema.app_db.get_revision(a) for a in self.dependencies[fragment_str])
+
+    def discard(self, fragment_str: str):
+        """
+        Remove a fragment from the cache and schedule its QWidget for deletion.
+        :param fragment_str: the fragment name to discard.
+        :return: nothing.
+        """
+        if fragment_str not in self.cache:
+            return
+
+        fragment, _ = self.cache.pop(fragment_str)
+        fragment.hide()
+        fragment.deleteLater()
+
+    def invalidate(self):
+        """
+        Discard every cached fragment, forcing the next "get" call to rebuild it.
+        :return: nothing.
+        """
+        for a in list(self.cache.keys()):
+            self.discard(a)
+
+    def is_cached(self, fragment: QtWidgets.QWidget):
+        """
+        Whether a given QWidget is currently held in the fragment cache.
+        :param fragment: the QWidget to check.
+        :return: True if the widget is cached.
+        """
+        return any(a[0] is fragment for a in self.cache.values())
@@ -0,0 +1,93 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Implementing a custom mapping type
+    - https://docs.python.org/3/library/collections.abc.html#collections.abc.MutableMapping
+    - https://docs.python.org/3/library/copy.html#copy.deepcopy
+"""
+from collections.abc import MutableMapping
+import copy
+import json
+import os
+
+
+class ShardedGallery(MutableMapping):
+    """
+    The gallery albums keyed by year, with each year stored in its own JSON shard file. [1]
+    It behaves like the plain gallery dict, but a year's shard is only read from the disk upon its first access,
+    so that only the accessed (and thus possibly edited) years ever need to be written back.
+    """
+
+    def __init__(self, shard_directory: str, years: list):
+        """
+        :param shard_directory: the local directory of the shard files.
+        :param years: the years listed in the gallery index, in order.
+        """
+        self.shard_directory = shard_directory
+
+        # The album lists keyed by year. None marks a shard which has not been read from the disk yet.
+        self.shards = {a: None for a in years}
+
+    @staticmethod
+    def get_shard_filename(year: str):
+        """
+        Determine the file name of a year's shard.
+        :param year: the gallery year, e.g., '2024'.
+        :return: the shard's file name.
+        """
+        return f'{year}.json'
+
+    @staticmethod
+    def dump_shard(year: str, albums: list):
+        """
+        Serialize a year's shard.
+        :param year: the gallery year.
+        :param albums: the year's album list.
+        :return: the shard's UTF-8 JSON bytes.
+        """
+        return json.dumps({'year': year, 'albums': albums}, ensure_ascii=False, indent=4).encode('utf-8')
+
+    def get_shard_path(self, year: str):
+        return self.shard_directory + os.sep + self.get_shard_filename(year)
+
+    def is_loaded(self, year: str):
+        """
+        Whether a year's shard has been read from the disk (or assigned) and may thus have been edited.
+        :param year: the gallery year.
+        :return: True if the shard is held in memory.
+        """
+        return self.shards.get(year) is not None
+
+    def __getitem__(self, year: str):
+        albums = self.shards[year]
+        if albums is None:
+            with open(self.get_shard_path(year), 'r') as fi:
+                albums = self.shards[year] = json.load(fi)['albums']
+        return albums
+
+    def __setitem__(self, year: str, albums: list):
+        self.shards[year] = albums
+
+    def __delitem__(self, year: str):
+        del self.shards[year]
+
+    def __contains__(self, year):
+        # Checking for a year must not read its shard.
+        return year in self.shards
+
+    def __iter__(self):
+        return iter(self.shards)
+
+    def __len__(self):
+        return len(self.shards)
+
+    def __deepcopy__(self, memo: dict):
+        # The shards not read yet are only copied as markers, since their files are not modified in place.
+        c = ShardedGallery(self.shard_directory, [])
+        c.shards = {a: copy.deepcopy(b, memo) for a, b in self.shards.items()}
+        return c
@@ -0,0 +1,222 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] GitHub Git Database REST API (blobs, trees, commits, and references)
+    - https://docs.github.com/en/rest/git/blobs
+    - https://docs.github.com/en/rest/git/trees
+    - https://docs.github.com/en/rest/git/commits
+    - https://docs.github.com/en/rest/git/refs
+    [2] How git computes the SHA-1 of a blob object
+    - https://git-scm.com/book/en/v2/Git-Internals-Git-Objects
+"""
+import hashlib
+import io
+import os
+import requests
+
+from lib.contents_upload import StreamingBase64Body
+from lib.exceptions import InvalidPushCredentialError
+from lib.logger import Logger as Lg
+from loading_animation import ScreenLoadingAnimation
+
+
+class GitDataCommitter(object):
+    """ Stages several files and pushes them to the GKI Salatiga+ data repo as one single, atomic commit. [1] """
+
+    # The GitHub REST API base URL of the GKI Salatiga+ data repository.
+    GITHUB_REPO_API = 'https://api.github.com/repos/gkisalatiga/gkisplus-data'
+
+    # The branch to which the commit will be pushed.
+    GITHUB_BRANCH = 'main'
+
+    # The git file mode of a regular (non-executable) file.
+    GIT_FILE_MODE = '100644'
+
+    def __init__(self, api_key: str, branch: str = GITHUB_BRANCH):
+        self.api_key = api_key
+        self.branch = branch
+
+        # The staged files, keyed by their path relative to the repo's root.
+        # Each value is a tuple of the file bytes (or None), the local file path (or None),
+        # and whether the file is UTF-8 text. Local files are only read when they are committed.
+        self.staged = {}
+
+        # The staged paths which were not committed because they are identical to the remote ones.
+        self.skipped = []
+
+    @staticmethod
+    def get_blob_sha(content: bytes):
+        """
+        Compute the git blob SHA-1 of the given content, identical to the "sha" returned by the GitHub API. [2]
+        :param content: the file content.
+        :return: the hexadecimal git blob SHA-1 string.
+        """
+        h = hashlib.sha1(f'blob {len(content)}\0'.encode('utf-8'))
+        h.update(content)
+        return h.hexdigest()
+
+    @staticmethod
+    def get_file_blob_sha(local_path: str):
+        """
+        Compute the git blob SHA-1 of a local file without reading it whole into memory.
+        :param local_path: the local file path.
+        :return: the hexadecimal git blob SHA-1 string.
+        """
+        h = hashlib.sha1(f'blob {os.path.getsize(local_path)}\0'.encode('utf-8'))
+        with open(local_path, 'rb') as fi:
+            for chunk in iter(lambda: fi.read(1024 * 1024), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def get_headers(self):
+        return {
+            'Authorization': f'Bearer {self.api_key}',
+            'Accept': 'application/vnd.github+json',
+        }
+
+    def is_empty(self):
+        """ Whether there is nothing staged to be committed. """
+        return len(self.staged) == 0
+
+    def stage_bytes(self, repo_path: str, content: bytes, is_text: bool = False):
+        """
+        Stage raw bytes to be written to the given repo path.
+        :param repo_path: the file path relative to the repo's root, e.g., 'gkisplus.json'.
+        :param content: the file content to commit.
+        :param is_text: whether the content is UTF-8 text, which can be inlined into the tree without a blob request.
+        :return: nothing.
+        """
+        self.staged[repo_path] = (content, None, is_text)
+
+    def stage_file(self, repo_path: str, local_path: str, is_text: bool = False):
+        """
+        Stage a local file to be written to the given repo path.
+        Only its path is kept, so that a large file is never held whole in memory.
+        :param repo_path: the file path relative to the repo's root.
+        :param local_path: the local file to commit.
+        :param is_text: whether the file is UTF-8 text.
+        :return: nothing.
+        """
+        self.staged[repo_path] = (None, local_path, is_text)
+
+    def get_staged_sha(self, repo_path: str):
+        """
+        Compute the git blob SHA-1 of a staged file, reading a local file in chunks.
+        :param repo_path: the staged file path relative to the repo's root.
+        :return: the hexadecimal git blob SHA-1 string.
+        """
+        content, local_path, _ = self.staged[repo_path]
+        return self.get_blob_sha(content) if local_path is None else self.get_file_blob_sha(local_path)
+
+    def open_staged(self, repo_path: str):
+        """
+        Open a staged file for reading.
+        :param repo_path: the staged file path relative to the repo's root.
+        :return: the binary file object and the number of bytes in it.
+        """
+        content, local_path, _ = self.staged[repo_path]
+        if local_path is None:
+            return io.BytesIO(content), len(content)
+        return open(local_path, 'rb'), os.path.getsize(local_path)
+
+    def check_response(self, r: requests.Response):
+        """
+        Raise the appropriate exception when a GitHub API request is not successful.
+        :param r: the response to check.
+        :return: the response's parsed JSON.
+        """
+        if r.status_code in (401, 403, 404):
+            raise InvalidPushCredentialError
+        r.raise_for_status()
+        return r.json()
+
+    def commit(self, message: str, anim_window: ScreenLoadingAnimation = None):
+        """
+        Create the blobs, a single tree, and a single commit, then move the branch ref once.
+        Mobile clients never see a half-updated state, since all files change in the same commit.
+        :param message: the commit message.
+        :param anim_window: the loading screen animator to display the commit progress.
+        :return: the generic GitHub API JSON response of the updated reference.
+        """
+        with requests.Session() as s:
+            s.headers.update(self.get_headers())
+
+            # Retrieving the latest commit and its tree.
+            msg = 'Retrieving the latest commit of the GKI Salatiga+ data repository ...'
+            Lg('lib.git_data.GitDataCommitter.commit', msg)
+            anim_window.set_prog_msg(40, msg)
+            ref = self.check_response(s.get(f'{self.GITHUB_REPO_API}/git/ref/heads/{self.branch}'))
+            parent_sha = ref['object']['sha']
+            parent_commit = self.check_response(s.get(f'{self.GITHUB_REPO_API}/git/commits/{parent_sha}'))
+            base_tree_sha = parent_commit['tree']['sha']
+
+            # Skipping the staged files which are identical to the remote ones.
+            remote_tree = self.check_response(s.get(f'{self.GITHUB_REPO_API}/git/trees/{base_tree_sha}?recursive=1'))
+            remote_shas = {a['path']: a['sha'] for a in remote_tree['tree'] if a['type'] == 'blob'}
+            for path in list(self.staged.keys()):
+                if remote_shas.get(path) == self.get_staged_sha(path):
+                    Lg('lib.git_data.GitDataCommitter.commit', f'Unchanged, skipping: {path}')
+                    self.skipped.append(path)
+                    del self.staged[path]
+
+            # Do not create an empty commit.
+            if self.is_empty():
+                Lg('lib.git_data.GitDataCommitter.commit', 'Nothing has changed. No commit is created.')
+                return ref
+
+            # Building the tree entries. Text files are inlined, binary files are uploaded as blobs.
+            tree = []
+            for i, (path, (_, _, is_text)) in enumerate(self.staged.items()):
+                fi, content_size = self.open_staged(path)
+                with fi:
+                    if is_text:
+                        tree.append({
+                            'path': path, 'mode': self.GIT_FILE_MODE, 'type': 'blob',
+                            'content': fi.read().decode('utf-8')
+                        })
+                        continue
+
+                    # Streaming the file as base64 into the request body.
+                    msg = f'Uploading the blob of: {path} ...'
+                    Lg('lib.git_data.GitDataCommitter.commit', msg)
+                    anim_window.set_prog_msg(50 + round(30 * i / len(self.staged)), msg)
+                    body = StreamingBase64Body(fi, content_size, {'encoding': 'base64'})
+                    blob = self.check_response(s.post(
+                        f'{self.GITHUB_REPO_API}/git/blobs', data=body, headers={'Content-Type': 'application/json'}
+                    ))
+
+                tree.append({'path': path, 'mode': self.GIT_FILE_MODE, 'type': 'blob', 'sha': blob['sha']})
+
+            # Creating the tree on top of the latest one.
+            msg = 'Creating the commit ...'
+            Lg('lib.git_data.GitDataCommitter.commit', msg)
+            anim_window.set_prog_msg(85, msg)
+            new_tree = self.check_response(s.post(f'{self.GITHUB_REPO_API}/git/trees', json={
+                'base_tree': base_tree_sha,
+                'tree': tree
+            }))
+
+            # Creating the commit.
+            new_commit = self.check_response(s.post(f'{self.GITHUB_REPO_API}/git/commits', json={
+                'message': message,
+                'tree': new_tree['sha'],
+                'parents': [parent_sha]
+            }))
+
+            # Moving the branch reference, which publishes every staged file at once.
+            msg = 'Publishing the commit ...'
+            Lg('lib.git_data.GitDataCommitter.commit', msg)
+            anim_window.set_prog_msg(95, msg)
+            r = self.check_response(s.patch(f'{self.GITHUB_REPO_API}/git/refs/heads/{self.branch}', json={
+                'sha': new_commit['sha'],
+                'force': False
+            }))
+
+        # Clear the staging area once the commit has been published.
+        self.staged = {}
+        return r
@@ -0,0 +1,217 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Building and reusing Google API service objects
+    - https://googleapis.github.io/google-api-python-client/docs/start.html#building-and-calling-a-service
+    - https://github.com/googleapis/google-api-python-client/blob/main/docs/thread_safety.md
+    [2] Refreshing OAuth 2.0 user credentials
+    - https://google-auth.readthedocs.io/en/latest/reference/google.oauth2.credentials.html
+    [3] Sending the requests of a shared service object through a per-thread HTTP transport
+    - https://googleapis.github.io/google-api-python-client/docs/epy/googleapiclient.discovery-module.html#build
+    - https://googleapis.dev/python/google-auth-httplib2/latest/index.html
+"""
+from datetime import datetime as dt, timezone
+import threading
+
+from google.auth.transport.requests import Request
+from google.oauth2 import service_account
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest, build_http
+
+from lib.logger import Logger as Lg
+
+
+class GoogleApiManager(object):
+    """
+    Keeps the Google API credentials in memory and builds each Google API service only once per process. [1]
+    The service objects are shared, but their requests are sent through a per-thread HTTP transport. [3]
+    The OAuth 2.0 user token is refreshed in the background before it expires,
+    and the refreshed token is only written to the disk once, upon "save_token".
+    """
+
+    # The Google Drive API scopes.
+    GOOGLE_DRIVE_SCOPES = [
+        'https://www.googleapis.com/auth/docs',
+        'https://www.googleapis.com/auth/drive',
+        'https://www.googleapis.com/auth/drive.appdata',
+        'https://www.googleapis.com/auth/drive.apps.readonly',
+        'https://www.googleapis.com/auth/drive.file',
+        'https://www.googleapis.com/auth/drive.meet.readonly',
+        'https://www.googleapis.com/auth/drive.metadata',
+        'https://www.googleapis.com/auth/drive.metadata.readonly',
+        'https://www.googleapis.com/auth/drive.photos.readonly',
+        'https://www.googleapis.com/auth/drive.readonly',
+    ]
+
+    # How long before its expiry (in seconds) the user token is refreshed in the background.
+    REFRESH_MARGIN = 5 * 60
+
+    def __init__(self, token_path: str, scopes: list = None):
+        """
+        :param token_path: the JSON file of the OAuth 2.0 user token (or the service account key).
+        :param scopes: the requested API scopes. Defaults to the Google Drive scopes.
+        """
+        self.token_path = token_path
+        self.scopes = self.GOOGLE_DRIVE_SCOPES if scopes is None else scopes
+
+        self.lock = threading.RLock()
+        self.local = threading.local()
+
+        # The built service objects, keyed by their API name, version, and credential type.
+        self.services = {}
+
+        # The in-memory credentials, loaded upon their first use.
+        self.user_creds = None
+        self.service_account_creds = None
+
+        # The user token last written to (or read from) the disk.
+        self.saved_token = None
+
+        self.refresh_timer = None
+
+    def get_user_credentials(self):
+        """
+        Obtain the OAuth 2.0 user credentials, loading them from the disk only once.
+        :return: the valid user credentials.
+        """
+        with self.lock:
+            if self.user_creds is None:
+                self.user_creds = Credentials.from_authorized_user_file(self.token_path, self.scopes)
+                self.saved_token = self.user_creds.token
+                self.schedule_refresh()
+
+            # If the credential has expired, refresh it right away.
+            if not self.user_creds.valid and self.user_creds.refresh_token:
+                Lg('lib.google_api.GoogleApiManager.get_user_credentials',
+                   'The Google Drive OAUTH2.0 credential is expired. Refreshing now ...')
+                self.refresh_user_credentials()
+
+            return self.user_creds
+
+    def get_service_account_credentials(self):
+        """
+        Obtain the service account credentials, loading them from the disk only once.
+        The service account token is refreshed in memory by the Google auth library itself.
+        :return: the service account credentials.
+        """
+        with self.lock:
+            if self.service_account_creds is None:
+                self.service_account_creds = service_account.Credentials.from_service_account_file(
+                    filename=self.token_path,
+                    scopes=self.scopes
+                )
+            return self.service_account_creds
+
+    def get_http(self, use_service_account: bool = False):
+        """
+        Obtain the calling thread's authorized HTTP transport, creating it upon the thread's first request.
+        The transports are not thread-safe, so each thread keeps its own. [1]
+        :param use_service_account: whether to authorize with the service account instead of the user token.
+        :return: the thread's authorized HTTP transport.
+        """
+        transports = getattr(self.local, 'transports', None)
+        if transports is None:
+            transports = self.local.transports = {}
+
+        if use_service_account not in transports:
+            creds = self.get_service_account_credentials() if use_service_account else self.get_user_credentials()
+            transports[use_service_account] = AuthorizedHttp(creds, http=build_http())
+
+        return transports[use_service_account]
+
+    def get_service(self, name: str, version: str, use_service_account: bool = False):
+        """
+        Obtain a Google API service object, building it (and parsing its discovery document) only once per process.
+        Each request of the service is sent through the calling thread's own HTTP transport. [3]
+        :param name: the API name, e.g., 'drive'.
+        :param version: the API version, e.g., 'v3'.
+        :param use_service_account: whether to authorize with the service account instead of the user token.
+        :return: the service object.
+        """
+        key = (name, version, use_service_account)
+        with self.lock:
+            if key not in self.services:
+                creds = self.get_service_account_credentials() if use_service_account else self.get_user_credentials()
+
+                # The shared transport of the service is never used: every request is built on the thread's own.
+                def build_request(http, *args, **kwargs):
+                    return HttpRequest(self.get_http(use_service_account), *args, **kwargs)
+
+                # The discovery document bundled with the client library is used, so no request is made here.
+                Lg('lib.google_api.GoogleApiManager.get_service', f'Building the Google API service: {name} {version}')
+                self.services[key] = build(
+                    name, version, credentials=creds, requestBuilder=build_request,
+                    cache_discovery=False, static_discovery=True
+                )
+
+            return self.services[key]
+
+    def refresh_user_credentials(self):
+        """
+        Refresh the OAuth 2.0 user token in memory, then schedule its next refresh. [2]
+        :return: nothing.
+        """
+        with self.lock:
+            self.user_creds.refresh(Request())
+            self.schedule_refresh()
+
+    def refresh_in_background(self):
+        try:
+            Lg('lib.google_api.GoogleApiManager.refresh_in_background', 'Refreshing the Google Drive OAUTH2.0 token ...')
+            self.refresh_user_credentials()
+        except Exception as e:
+            # The token will be refreshed upon its next use instead.
+            Lg('lib.google_api.GoogleApiManager.refresh_in_background', f'Failed to refresh the token: {e}')
+
+    def schedule_refresh(self):
+        """
+        Schedule the background refresh of the user token shortly before it expires.
+        :return: nothing.
+        """
+        with self.lock:
+            if self.refresh_timer is not None:
+                self.refresh_timer.cancel()
+                self.refresh_timer = None
+
+            if self.user_creds.expiry is None or not self.user_creds.refresh_token:
+                return
+
+            # The credential expiry is a naive UTC datetime.
+            now = dt.now(timezone.utc).replace(tzinfo=None)
+            delay = (self.user_creds.expiry - now).total_seconds() - self.REFRESH_MARGIN
+
+            self.refresh_timer = threading.Timer(max(delay, 0), self.refresh_in_background)
+            self.refresh_timer.daemon = True
+            self.refresh_timer.start()
+
+    def save_token(self):
+        """
+        Write the user token to the disk, only if it has been refreshed since it was last written.
+        :return: nothing.
+        """
+        with self.lock:
+            if self.user_creds is None or self.user_creds.token == self.saved_token:
+                return
+
+            Lg('lib.google_api.GoogleApiManager.save_token', 'Saving the refreshed Google Drive OAUTH2.0 token ...')
+            with open(self.token_path, 'w') as fo:
+                fo.write(self.user_creds.to_json())
+            self.saved_token = self.user_creds.token
+
+    def shutdown(self):
+        """
+        Stop the background token refresh and save the latest token.
+        :return: nothing.
+        """
+        with self.lock:
+            if self.refresh_timer is not None:
+                self.refresh_timer.cancel()
+                self.refresh_timer = None
+            self.save_token()
@@ -0,0 +1,166 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] HTTP conditional requests
+    - https://developer.mozilla.org/en-US/docs/Web/HTTP/Conditional_requests
+    [2] Conditional requests to the GitHub REST API
+    - https://docs.github.com/en/rest/using-the-rest-api/best-practices-for-using-the-rest-api#use-conditional-requests-if-appropriate
+    [3] Creating unique temporary files
+    - https://docs.python.org/3/library/tempfile.html#tempfile.mkstemp
+"""
+from json.decoder import JSONDecodeError
+import json
+import os
+import tempfile
+import threading
+
+import requests
+
+from lib.logger import Logger as Lg
+
+
+class HttpValidatorCache(object):
+    """ Remembers the ETag and Last-Modified validators of downloaded URLs to perform conditional GET requests. [1] """
+
+    # The size of each chunk when streaming a download to the disk.
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    # The file name suffix of an unfinished download.
+    TEMP_SUFFIX = '.part'
+
+    def __init__(self, cache_path: str):
+        """
+        :param cache_path: the JSON file in which the validators are persisted across runs.
+        """
+        self.cache_path = cache_path
+        self.lock = threading.Lock()
+        self.validators = {}
+        self.load()
+
+    def load(self):
+        """
+        Load the persisted validators from the disk.
+        :return: nothing.
+        """
+        try:
+            with open(self.cache_path, 'r') as fi:
+                self.validators = json.load(fi)
+        except (FileNotFoundError, JSONDecodeError):
+            self.validators = {}
+
+    def save(self):
+        """
+        Persist the validators to the disk.
+        :return: nothing.
+        """
+        with open(self.cache_path, 'w') as fo:
+            json.dump(self.validators, fo)
+
+    def forget(self, url: str):
+        """
+        Remove the validators of a given URL, so that the next request is unconditional.
+        :param url: the URL to forget.
+        :return: nothing.
+        """
+        with self.lock:
+            if self.validators.pop(url, None) is not None:
+                self.save()
+
+    def get_conditional_headers(self, url: str, local_path: str = None):
+        """
+        Build the conditional request headers of a given URL.
+        :param url: the URL to request.
+        :param local_path: the local copy of the resource. If it does not exist, no validator is sent.
+        :return: the dict of conditional request headers.
+        """
+        if local_path is not None and not os.path.isfile(local_path):
+            return {}
+
+        with self.lock:
+            v = self.validators.get(url, {})
+
+        headers = {}
+        if v.get('etag'):
+            headers['If-None-Match'] = v['etag']
+        if v.get('last_modified'):
+            headers['If-Modified-Since'] = v['last_modified']
+        return headers
+
+    def remember(self, url: str, r: requests.Response):
+        """
+        Store the validators returned by a successful response.
+        :param url: the requested URL.
+        :param r: the successful response.
+        :return: nothing.
+        """
+        etag = r.headers.get('ETag')
+        last_modified = r.headers.get('Last-Modified')
+        if etag is None and last_modified is None:
+            return
+
+        with self.lock:
+            self.validators[url] = {'etag': etag, 'last_modified': last_modified}
+            self.save()
+
+    def fetch(self, url: str, local_path: str = None, session: requests.Session = None, headers: dict = None):
+        """
+        Perform a conditional GET request.
+        :param url: the URL to request.
+        :param local_path: the local copy of the resource. If it does not exist, the request is unconditional.
+        :param session: (optional) the session to send the request with.
+        :param headers: (optional) any additional request headers.
+        :return: the response, or None if the server reports that the local copy is already current (HTTP 304).
+        """
+        request_headers = dict(headers) if headers is not None else {}
+        request_headers.update(self.get_conditional_headers(url, local_path))
+
+        r = (session if session is not None else requests).get(url, headers=request_headers)
+        if r.status_code == 304:
+            Lg('lib.http_cache.HttpValidatorCache.fetch', f'Already current, skipping: {url}')
+            return None
+
+        r.raise_for_status()
+        self.remember(url, r)
+        return r
+
+    def download(self, url: str, local_path: str, session: requests.Session = None):
+        """
+        Download a URL into a local file, unless the local file is already current.
+        The file is only replaced once it has been completely downloaded.
+        :param url: the URL to download.
+        :param local_path: the local file path to save the download into.
+        :param session: (optional) the session to send the request with.
+        :return: True if the file has been downloaded, False if the local file is already current.
+        """
+        request_headers = self.get_conditional_headers(url, local_path)
+
+        with (session if session is not None else requests).get(url, headers=request_headers, stream=True) as r:
+            if r.status_code == 304:
+                Lg('lib.http_cache.HttpValidatorCache.download', f'Already current, skipping: {url}')
+                return False
+
+            r.raise_for_status()
+
+            # Streaming the download into a temporary file first.
+            # Its name is unique, so that concurrent downloads into the same local path do not clobber each other. [3]
+            fd, temp_path = tempfile.mkstemp(
+                prefix=os.path.basename(local_path) + '.',
+                suffix=self.TEMP_SUFFIX,
+                dir=os.path.dirname(os.path.abspath(local_path))
+            )
+            try:
+                with os.fdopen(fd, 'wb') as fo:
+                    for chunk in r.iter_content(self.DOWNLOAD_CHUNK_SIZE):
+                        fo.write(chunk)
+                os.replace(temp_path, local_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+
+            self.remember(url, r)
+            return True
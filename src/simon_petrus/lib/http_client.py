@@ -0,0 +1,107 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Session objects and connection pooling in the "requests" library
+    - https://requests.readthedocs.io/en/latest/user/advanced/#session-objects
+    - https://requests.readthedocs.io/en/latest/api/#requests.adapters.HTTPAdapter
+    [2] Thread safety of "requests" sessions
+    - https://github.com/psf/requests/issues/2766
+    [3] Passing the API key of Google APIs as a request header
+    - https://cloud.google.com/docs/authentication/api-keys-use#using-with-rest
+"""
+from urllib.parse import urlparse
+import threading
+
+from requests.adapters import HTTPAdapter
+import requests
+
+
+class HttpClient(object):
+    """
+    A long-lived HTTP client whose connections are pooled per host and reused across calls and threads. [1]
+    Each thread gets its own session (sessions are not thread-safe), but all sessions share the same pools. [2]
+    """
+
+    # The number of per-host connection pools to keep, and the maximum number of connections in each pool.
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 10
+
+    # The default connect and read timeouts, in seconds.
+    CONNECT_TIMEOUT = 10
+    READ_TIMEOUT = 60
+
+    def __init__(self, connect_timeout: float = CONNECT_TIMEOUT, read_timeout: float = READ_TIMEOUT,
+                 pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE):
+        """
+        :param connect_timeout: the default connect timeout, in seconds.
+        :param read_timeout: the default read timeout, in seconds.
+        :param pool_connections: the number of per-host connection pools to keep.
+        :param pool_maxsize: the maximum number of connections kept in each pool.
+        """
+        self.timeout = (connect_timeout, read_timeout)
+
+        # The adapter, and therefore the connection pools, shared by every thread's session.
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+        # The default request headers of each host, e.g., the authorization header.
+        self.host_headers = {}
+
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def get_session(self):
+        """
+        Obtain the calling thread's session, creating it upon the thread's first request.
+        :return: the thread's requests.Session.
+        """
+        s = getattr(self.local, 'session', None)
+        if s is None:
+            s = requests.Session()
+            s.mount('https://', self.adapter)
+            s.mount('http://', self.adapter)
+            self.local.session = s
+        return s
+
+    def set_host_headers(self, host: str, headers: dict):
+        """
+        Set the default headers sent with every request to a given host.
+        :param host: the host name, e.g., 'gkisalatiga.org'.
+        :param headers: the default headers of the host.
+        :return: nothing.
+        """
+        with self.lock:
+            self.host_headers[host] = dict(headers)
+
+    def request(self, method: str, url: str, headers: dict = None, **kwargs):
+        """
+        Send a request through the pooled connections, applying the host's default headers and the default timeouts.
+        :param method: the HTTP method, e.g., 'GET'.
+        :param url: the request URL.
+        :param headers: (optional) the request headers, which override the host's default headers.
+        :param kwargs: any other keyword arguments accepted by requests.Session.request.
+        :return: the response.
+        """
+        with self.lock:
+            request_headers = dict(self.host_headers.get(urlparse(url).hostname, {}))
+        if headers is not None:
+            request_headers.update(headers)
+
+        kwargs.setdefault('timeout', self.timeout)
+        return self.get_session().request(method, url, headers=request_headers, **kwargs)
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        return self.request('DELETE', url, **kwargs)
@@ -0,0 +1,170 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Reading images with their EXIF orientation applied
+    - https://doc.qt.io/qt-5/qimagereader.html#setAutoTransform
+    [2] Writing progressive JPEG and WebP images using Qt
+    - https://doc.qt.io/qt-5/qimagewriter.html#setProgressiveScanWrite
+    - https://doc.qt.io/qt-5/qimagewriter.html#setQuality
+"""
+import hashlib
+import os
+import threading
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QImageReader, QImageWriter, QPainter
+
+from lib.logger import Logger as Lg
+
+
+class ImageOptimizer(object):
+    """
+    Downscales and re-encodes the images picked by the user before they are stored as the app's assets.
+    Only the pixels are kept, so no EXIF (e.g., GPS location) or any other metadata is ever published.
+    The results are cached on the disk, keyed by the source image's content hash and the output parameters.
+    """
+
+    # The default maximum (width, height) of each kind of image asset, in pixels.
+    ASSET_DIMENSIONS = {
+        'banner': (1280, 1280),
+        'poster': (1080, 1920),
+        'qris': (1024, 1024),
+    }
+
+    # The file extension and the Qt image format name of each supported output format.
+    FORMAT_EXTENSIONS = {
+        'jpeg': 'jpg',
+        'png': 'png',
+        'webp': 'webp',
+    }
+    FORMAT_NAMES = {
+        'jpeg': b'jpeg',
+        'png': b'png',
+        'webp': b'webp',
+    }
+
+    # The maximum number of cached images. The least recently used images are removed first.
+    MAX_CACHED_IMAGES = 128
+
+    # The size of each chunk when hashing a file.
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_directory: str, asset_dimensions: dict = None):
+        """
+        :param cache_directory: the directory of the persistent optimized image cache.
+        :param asset_dimensions: the maximum (width, height) of each kind of image asset, overriding the defaults.
+        """
+        self.cache_directory = cache_directory
+        self.asset_dimensions = dict(self.ASSET_DIMENSIONS)
+        self.asset_dimensions.update(asset_dimensions or {})
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def hash_file(path: str):
+        """
+        Compute the SHA-256 digest of a file without reading it whole into memory.
+        :param path: the file to hash.
+        :return: the hexadecimal digest.
+        """
+        h = hashlib.sha256()
+        with open(path, 'rb') as fi:
+            for chunk in iter(lambda: fi.read(ImageOptimizer.HASH_CHUNK_SIZE), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def optimize(self, source_path: str, asset_type: str, image_format: str = 'webp', quality: int = 80):
+        """
+        Obtain the optimized copy of an image, encoding it only if no identical result has been cached.
+        :param source_path: the image picked by the user.
+        :param asset_type: the kind of image asset, i.e., 'banner', 'poster', or 'qris'.
+        :param image_format: either 'jpeg', 'png', or 'webp'.
+        :param quality: the quality (0-100) of the lossy image formats.
+        :return: the cached optimized image's path.
+        """
+        max_width, max_height = self.asset_dimensions[asset_type]
+        if image_format not in self.FORMAT_EXTENSIONS:
+            raise ValueError(f'Unknown image format: {image_format}')
+
+        # The lossless PNG output does not depend on the quality setting.
+        quality_key = f'-q{quality}' if image_format != 'png' else ''
+        name = (f'{self.hash_file(source_path)}-{max_width}x{max_height}{quality_key}'
+                f'.{self.FORMAT_EXTENSIONS[image_format]}')
+        output_path = self.cache_directory + os.sep + name
+
+        if os.path.isfile(output_path):
+            Lg('lib.image_optimizer.ImageOptimizer.optimize', f'Using the cached image: {name}')
+            os.utime(output_path)
+            return output_path
+
+        os.makedirs(self.cache_directory, exist_ok=True)
+        self.encode(source_path, output_path, max_width, max_height, image_format, quality)
+
+        Lg('lib.image_optimizer.ImageOptimizer.optimize',
+           f'Optimized {source_path} from {os.path.getsize(source_path)} to {os.path.getsize(output_path)} bytes.')
+
+        self.prune()
+        return output_path
+
+    def encode(self, source_path: str, output_path: str, max_width: int, max_height: int, image_format: str,
+               quality: int):
+        """
+        Downscale an image to fit the given dimensions, then write it in the given format.
+        :param source_path: the image to encode.
+        :param output_path: the image file to write.
+        :param max_width: the maximum image width, in pixels.
+        :param max_height: the maximum image height, in pixels.
+        :param image_format: either 'jpeg', 'png', or 'webp'.
+        :param quality: the quality (0-100) of the lossy image formats.
+        :return: nothing.
+        """
+        # Phone photos are often stored sideways, with their rotation only noted in the EXIF data. [1]
+        reader = QImageReader(source_path)
+        reader.setAutoTransform(True)
+        img = reader.read()
+        if img.isNull():
+            raise ValueError(f'Cannot read the image "{source_path}": {reader.errorString()}')
+
+        if img.width() > max_width or img.height() > max_height:
+            img = img.scaled(max_width, max_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        # Only the pixels are copied into a fresh image, leaving every metadata behind.
+        # JPEG has no transparency, so transparent pixels are painted over white instead of black.
+        keep_alpha = img.hasAlphaChannel() and image_format != 'jpeg'
+        clean = QImage(img.size(), QImage.Format_ARGB32 if keep_alpha else QImage.Format_RGB32)
+        clean.fill(Qt.transparent if keep_alpha else Qt.white)
+        painter = QPainter(clean)
+        painter.drawImage(0, 0, img)
+        painter.end()
+
+        # Writing the image. [2]
+        writer = QImageWriter(output_path + '.part', self.FORMAT_NAMES[image_format])
+        if image_format != 'png':
+            writer.setQuality(quality)
+        if image_format == 'jpeg':
+            writer.setOptimizedWrite(True)
+            writer.setProgressiveScanWrite(True)
+
+        if not writer.write(clean):
+            raise ValueError(f'Cannot write the image "{output_path}": {writer.errorString()}')
+
+        # Only fully written images ever appear in the cache.
+        os.replace(output_path + '.part', output_path)
+
+    def prune(self):
+        """
+        Remove the least recently used images beyond the cache's capacity.
+        :return: nothing.
+        """
+        with self.lock:
+            paths = [
+                self.cache_directory + os.sep + a for a in os.listdir(self.cache_directory)
+                if not a.endswith('.part')
+            ]
+            paths.sort(key=os.path.getmtime, reverse=True)
+            for a in paths[self.MAX_CACHED_IMAGES:]:
+                os.remove(a)
@@ -0,0 +1,228 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Low-quality image placeholders
+    - https://web.dev/articles/browser-level-image-lazy-loading#avoid_layout_shifts
+    [2] Reading images from memory using Qt
+    - https://doc.qt.io/qt-5/qimagereader.html#QImageReader-1
+    [3] The BlurHash algorithm
+    - https://github.com/woltapp/blurhash/blob/master/Algorithm.md
+    - https://github.com/woltapp/blurhash/blob/master/C/encode.c
+"""
+from json.decoder import JSONDecodeError
+import copy
+import json
+import math
+import threading
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from PyQt5.QtGui import QImage, QImageReader, QPainter, qBlue, qGreen, qRed
+
+
+class ImagePlaceholderStore(object):
+    """
+    Computes the dimensions and the BlurHash of the app's images, so that the GKI Salatiga+ app
+    can lay out the page and show a blurred preview before each full image is downloaded. [1]
+    The results are persisted across runs, keyed by the image's file ID and checksum.
+    """
+
+    # The maximum width and height of the downscaled image from which the BlurHash is computed, in pixels.
+    PLACEHOLDER_SIZE = 32
+
+    # The digits of the base 83 encoding used by BlurHash. [3]
+    BASE83_CHARACTERS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+
+    def __init__(self, cache_path: str):
+        """
+        :param cache_path: the JSON file in which the computed placeholders are persisted across runs.
+        """
+        self.cache_path = cache_path
+        self.lock = threading.RLock()
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        """
+        Load the persisted placeholders from the disk.
+        :return: nothing.
+        """
+        try:
+            with open(self.cache_path, 'r') as fi:
+                self.entries = json.load(fi)
+        except (FileNotFoundError, JSONDecodeError):
+            self.entries = {}
+
+    def save(self):
+        """
+        Persist the placeholders to the disk.
+        :return: nothing.
+        """
+        with self.lock:
+            with open(self.cache_path, 'w') as fo:
+                json.dump(self.entries, fo)
+
+    def get(self, file_id: str, checksum: str):
+        """
+        Obtain the computed placeholder of a given image.
+        :param file_id: the image's Google Drive file ID, or its path relative to the assets directory.
+        :param checksum: the checksum of the image's current content.
+        :return: a copy of the dict with the keys "width", "height", and "blurhash", or None if never computed.
+        """
+        with self.lock:
+            e = self.entries.get(file_id)
+            if e is None or e['checksum'] != checksum:
+                return None
+            return copy.deepcopy(e['info'])
+
+    def put(self, file_id: str, checksum: str, info: dict, save: bool = True):
+        """
+        Store the computed placeholder of a given image, replacing that of its older content.
+        :param file_id: the image's Google Drive file ID, or its path relative to the assets directory.
+        :param checksum: the checksum of the image's current content.
+        :param info: the dict with the keys "width", "height", and "blurhash".
+        :param save: whether to persist the placeholders right away. Pass False when storing many at once,
+            then call "save" after the last one.
+        :return: nothing.
+        """
+        with self.lock:
+            self.entries[file_id] = {'checksum': checksum, 'info': copy.deepcopy(info)}
+            if save:
+                self.save()
+
+    def get_info(self, file_id: str, checksum: str, read_data, save: bool = True):
+        """
+        Obtain the placeholder of a given image, computing it only if the image's content has changed.
+        :param file_id: the image's Google Drive file ID, or its path relative to the assets directory.
+        :param checksum: the checksum of the image's current content.
+        :param read_data: the function returning the image's bytes, only called when no placeholder is cached.
+        :param save: whether to persist a newly computed placeholder right away.
+        :return: the dict with the keys "width", "height", and "blurhash".
+        """
+        info = self.get(file_id, checksum)
+        if info is not None:
+            return info
+
+        info = self.make_placeholder(read_data())
+        self.put(file_id, checksum, info, save)
+        return info
+
+    @staticmethod
+    def make_placeholder(data: bytes):
+        """
+        Read an image's dimensions and encode its BlurHash placeholder. [1] [2]
+        :param data: the image's bytes.
+        :return: the dict with the keys "width", "height", and "blurhash".
+        """
+        ba = QByteArray(data)
+        buf = QBuffer(ba)
+        buf.open(QIODevice.ReadOnly)
+        reader = QImageReader(buf)
+        reader.setAutoTransform(True)
+        img = reader.read()
+        if img.isNull():
+            raise ValueError(f'Cannot read the image: {reader.errorString()}')
+
+        width, height = img.width(), img.height()
+        img = img.scaled(
+            ImagePlaceholderStore.PLACEHOLDER_SIZE, ImagePlaceholderStore.PLACEHOLDER_SIZE,
+            Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+
+        # Transparent pixels are painted over white instead of black.
+        small = QImage(img.size(), QImage.Format_RGB32)
+        small.fill(Qt.white)
+        painter = QPainter(small)
+        painter.drawImage(0, 0, img)
+        painter.end()
+
+        pixels = [
+            [(qRed(c), qGreen(c), qBlue(c)) for c in (small.pixel(x, y) for x in range(small.width()))]
+            for y in range(small.height())
+        ]
+
+        # More horizontal components for landscape images, and more vertical ones for portrait images.
+        x_components, y_components = (4, 3) if width >= height else (3, 4)
+
+        return {
+            'width': width,
+            'height': height,
+            'blurhash': ImagePlaceholderStore.encode_blurhash(pixels, x_components, y_components)
+        }
+
+    @staticmethod
+    def encode_blurhash(pixels: list, x_components: int, y_components: int):
+        """
+        Encode the BlurHash of an image, i.e., the first few components of its discrete cosine transform. [3]
+        :param pixels: the image's rows of (red, green, blue) sRGB pixels.
+        :param x_components: the number of horizontal components (1-9).
+        :param y_components: the number of vertical components (1-9).
+        :return: the BlurHash string, e.g., 28 characters long for 4x3 components.
+        """
+        height, width = len(pixels), len(pixels[0])
+        linear = [[tuple(ImagePlaceholderStore.srgb_to_linear(c) for c in p) for p in row] for row in pixels]
+
+        # Computing each component's average color, weighted by its cosine basis function.
+        factors = []
+        for j in range(y_components):
+            cos_y = [math.cos(math.pi * j * y / height) for y in range(height)]
+            for i in range(x_components):
+                cos_x = [math.cos(math.pi * i * x / width) for x in range(width)]
+                norm = (1 if i == 0 and j == 0 else 2) / (width * height)
+                r = g = b = 0.0
+                for y in range(height):
+                    for x in range(width):
+                        basis = cos_x[x] * cos_y[y]
+                        r += basis * linear[y][x][0]
+                        g += basis * linear[y][x][1]
+                        b += basis * linear[y][x][2]
+                factors.append((r * norm, g * norm, b * norm))
+
+        dc, ac = factors[0], factors[1:]
+        result = ImagePlaceholderStore.encode_base83((x_components - 1) + (y_components - 1) * 9, 1)
+
+        # The AC components are quantized relative to the largest one.
+        if len(ac) > 0:
+            quantized_max = max(0, min(82, math.floor(max(abs(c) for f in ac for c in f) * 166 - 0.5)))
+            max_value = (quantized_max + 1) / 166
+        else:
+            quantized_max, max_value = 0, 1
+        result += ImagePlaceholderStore.encode_base83(quantized_max, 1)
+
+        # The DC component is the image's average color.
+        dc_value = sum(ImagePlaceholderStore.linear_to_srgb(c) << s for c, s in zip(dc, (16, 8, 0)))
+        result += ImagePlaceholderStore.encode_base83(dc_value, 4)
+
+        for f in ac:
+            q = [max(0, min(18, math.floor(math.copysign(abs(c / max_value) ** 0.5, c) * 9 + 9.5))) for c in f]
+            result += ImagePlaceholderStore.encode_base83(q[0] * 19 * 19 + q[1] * 19 + q[2], 2)
+
+        return result
+
+    @staticmethod
+    def encode_base83(value: int, length: int):
+        """
+        Encode a non-negative integer in the base 83 digits of BlurHash. [3]
+        :param value: the integer to encode.
+        :param length: the number of digits.
+        :return: the encoded string.
+        """
+        return ''.join(
+            ImagePlaceholderStore.BASE83_CHARACTERS[(value // 83 ** (length - i)) % 83] for i in range(1, length + 1)
+        )
+
+    @staticmethod
+    def srgb_to_linear(value: int):
+        # Converting an sRGB channel (0-255) to linear light (0-1).
+        v = value / 255
+        return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+    @staticmethod
+    def linear_to_srgb(value: float):
+        # Converting a linear light channel (0-1) back to sRGB (0-255).
+        v = max(0.0, min(1.0, value))
+        return int(v * 12.92 * 255 + 0.5) if v <= 0.0031308 else int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
@@ -0,0 +1,307 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Running CPU-bound work in a process pool
+    - https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+    - https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
+    [2] Rasterizing PDF pages using PyMuPDF
+    - https://pymupdf.readthedocs.io/en/latest/page.html#Page.get_pixmap
+    - https://pymupdf.readthedocs.io/en/latest/pixmap.html#Pixmap.tobytes
+    [3] Encoding WebP images using Qt
+    - https://doc.qt.io/qt-5/qimage.html#save-1
+    [4] Shrinking PDF files using PyMuPDF
+    - https://pymupdf.readthedocs.io/en/latest/document.html#Document.save
+    - https://pymupdf.readthedocs.io/en/latest/page.html#Page.replace_image
+"""
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import multiprocessing
+import os
+import shutil
+import sys
+import threading
+
+import fitz
+
+from lib.logger import Logger as Lg
+
+
+def init_worker(parent_temp_directory: str):
+    """
+    Prepare a freshly spawned worker process.
+    :param parent_temp_directory: the app's own temporary directory, which must be left untouched.
+    :return: nothing.
+    """
+    # A spawned worker re-imports the app's modules, which creates another (unused) temporary directory.
+    prefs = sys.modules.get('lib.preferences')
+    if prefs is not None and prefs.SavedPreferences.TEMP_DIRECTORY != parent_temp_directory:
+        shutil.rmtree(prefs.SavedPreferences.TEMP_DIRECTORY, ignore_errors=True)
+
+
+def render_thumbnail(pdf_path: str, output_path: str, page: int, dpi: int, max_width: int, image_format: str,
+                     quality: int):
+    """
+    Rasterize a PDF page into an image file. This function runs in a worker process. [2]
+    :param pdf_path: the PDF file to rasterize.
+    :param output_path: the image file to write.
+    :param page: the zero-based page number to rasterize.
+    :param dpi: the rasterization resolution.
+    :param max_width: the maximum image width in pixels, or 0 for no limit.
+    :param image_format: either 'png', 'jpeg', or 'webp'.
+    :param quality: the quality (0-100) of the lossy image formats.
+    :return: the written image path.
+    """
+    with fitz.open(pdf_path) as doc:
+        p = doc[page]
+
+        zoom = dpi / 72
+        if max_width > 0:
+            zoom = min(zoom, max_width / p.rect.width)
+        pix = p.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+
+    if image_format == 'png':
+        data = pix.tobytes('png')
+
+    elif image_format == 'jpeg':
+        data = pix.tobytes('jpg', jpg_quality=quality)
+
+    elif image_format == 'webp':
+        # PyMuPDF cannot write WebP images, but Qt can. [3]
+        from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+        from PyQt5.QtGui import QImage
+
+        ba = QByteArray()
+        buf = QBuffer(ba)
+        buf.open(QIODevice.WriteOnly)
+        if not QImage.fromData(pix.tobytes('png'), 'PNG').save(buf, 'WEBP', quality):
+            raise ValueError('This Qt installation cannot encode WebP images')
+        data = bytes(ba)
+
+    else:
+        raise ValueError(f'Unknown thumbnail image format: {image_format}')
+
+    # Only fully written images ever appear in the cache.
+    with open(output_path + '.part', 'wb') as fo:
+        fo.write(data)
+    os.replace(output_path + '.part', output_path)
+
+    return output_path
+
+
+def optimize_pdf(pdf_path: str, output_path: str, target_dpi: int, quality: int):
+    """
+    Write a smaller copy of a PDF file. This function runs in a worker process. [4]
+    Embedded images displayed above the target resolution are downsampled and re-encoded as JPEG,
+    the metadata are stripped, and the unused objects are removed while every stream is deflated.
+    :param pdf_path: the PDF file to optimize.
+    :param output_path: the optimized PDF file to write.
+    :param target_dpi: the resolution to which the embedded images are downsampled.
+    :param quality: the JPEG quality (0-100) of the downsampled images.
+    :return: the number of downsampled images.
+    """
+    n_downsampled = 0
+
+    with fitz.open(pdf_path) as doc:
+        done = set()
+        for page in doc:
+            for img in page.get_images(full=True):
+                xref, smask = img[0], img[1]
+
+                # Images shared by several pages are only processed once,
+                # and images with transparency masks cannot be stored as JPEG.
+                if xref in done or smask != 0:
+                    continue
+                done.add(xref)
+
+                rects = page.get_image_rects(xref)
+                if len(rects) == 0:
+                    continue
+
+                # The resolution at which the image is displayed on the page (in points, i.e., 1/72 inch).
+                pix = fitz.Pixmap(doc, xref)
+                if pix.colorspace is None:
+                    continue
+                shown_width = max(a.width for a in rects)
+                dpi = pix.width / (shown_width / 72) if shown_width > 0 else 0
+                if dpi <= target_dpi * 1.1:
+                    continue
+
+                # Converting CMYK (or any other non-RGB color) images, which the JPEG encoder cannot take.
+                if pix.colorspace.n not in (1, 3):
+                    pix = fitz.Pixmap(fitz.csRGB, pix)
+                if pix.alpha:
+                    pix = fitz.Pixmap(pix, 0)
+
+                scale = target_dpi / dpi
+                pix = fitz.Pixmap(pix, max(1, round(pix.width * scale)), max(1, round(pix.height * scale)), None)
+                stream = pix.tobytes('jpg', jpg_quality=quality)
+
+                # The image is only replaced if it actually becomes smaller.
+                if len(stream) < len(doc.xref_stream_raw(xref)):
+                    page.replace_image(xref, stream=stream)
+                    n_downsampled += 1
+
+        # Stripping the document information and the XMP metadata.
+        doc.set_metadata({})
+        doc.del_xml_metadata()
+
+        doc.save(output_path + '.part', garbage=4, deflate=True, deflate_images=True, deflate_fonts=True)
+
+    os.replace(output_path + '.part', output_path)
+    return n_downsampled
+
+
+class PdfWorker(object):
+    """
+    Runs the CPU-heavy PDF work in a pool of worker processes, so that it never holds the GUI process's GIL. [1]
+    The rendered PDF thumbnails are cached on the disk, keyed by the PDF's content hash and the render parameters.
+    """
+
+    # The maximum number of worker processes.
+    MAX_WORKERS = 2
+
+    # The maximum number of cached thumbnails. The least recently used thumbnails are removed first.
+    MAX_CACHED_THUMBNAILS = 64
+
+    # The file extension of each supported thumbnail image format.
+    THUMBNAIL_EXTENSIONS = {
+        'jpeg': 'jpg',
+        'png': 'png',
+        'webp': 'webp',
+    }
+
+    # The size of each chunk when hashing a file.
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, thumbnail_directory: str, temp_directory: str):
+        """
+        :param thumbnail_directory: the directory of the persistent thumbnail cache.
+        :param temp_directory: the app's temporary directory.
+        """
+        self.thumbnail_directory = thumbnail_directory
+        self.temp_directory = temp_directory
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def get_executor(self):
+        """
+        Obtain the process pool, starting it upon its first use.
+        :return: the process pool executor.
+        """
+        with self.lock:
+            if self.executor is None:
+                # Forking a multithreaded Qt process is unsafe, so the workers are always spawned afresh.
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.MAX_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=init_worker,
+                    initargs=(self.temp_directory,)
+                )
+            return self.executor
+
+    def run(self, target, *args):
+        """
+        Run a module-level function in a worker process and wait for its result.
+        :param target: the function to run.
+        :param args: the function's arguments, which must be picklable.
+        :return: the function's return value.
+        """
+        return self.get_executor().submit(target, *args).result()
+
+    @staticmethod
+    def hash_file(path: str):
+        """
+        Compute the SHA-256 digest of a file without reading it whole into memory.
+        :param path: the file to hash.
+        :return: the hexadecimal digest.
+        """
+        h = hashlib.sha256()
+        with open(path, 'rb') as fi:
+            for chunk in iter(lambda: fi.read(PdfWorker.HASH_CHUNK_SIZE), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def get_thumbnail(self, pdf_path: str, page: int = 0, dpi: int = 75, max_width: int = 0,
+                      image_format: str = 'png', quality: int = 80):
+        """
+        Obtain the thumbnail of a PDF page, rendering it only if no identical render has been cached.
+        :param pdf_path: the PDF file to rasterize.
+        :param page: the zero-based page number to rasterize.
+        :param dpi: the rasterization resolution.
+        :param max_width: the maximum image width in pixels, or 0 for no limit.
+        :param image_format: either 'png', 'jpeg', or 'webp'.
+        :param quality: the quality (0-100) of the lossy image formats.
+        :return: the cached thumbnail's path.
+        """
+        if image_format not in self.THUMBNAIL_EXTENSIONS:
+            raise ValueError(f'Unknown thumbnail image format: {image_format}')
+
+        # The lossless PNG thumbnail does not depend on the quality setting.
+        quality_key = f'-q{quality}' if image_format != 'png' else ''
+        name = (f'{self.hash_file(pdf_path)}-p{page}-d{dpi}-w{max_width}{quality_key}'
+                f'.{self.THUMBNAIL_EXTENSIONS[image_format]}')
+        thumbnail_path = self.thumbnail_directory + os.sep + name
+
+        if os.path.isfile(thumbnail_path):
+            Lg('lib.pdf_worker.PdfWorker.get_thumbnail', f'Using the cached thumbnail: {name}')
+            os.utime(thumbnail_path)
+            return thumbnail_path
+
+        os.makedirs(self.thumbnail_directory, exist_ok=True)
+        self.run(render_thumbnail, pdf_path, thumbnail_path, page, dpi, max_width, image_format, quality)
+        Lg('lib.pdf_worker.PdfWorker.get_thumbnail', f'Rendered the thumbnail: {name}')
+
+        self.prune_thumbnails()
+        return thumbnail_path
+
+    def optimize_pdf(self, pdf_path: str, target_dpi: int = 150, quality: int = 75):
+        """
+        Write a smaller copy of a PDF file into the temporary directory.
+        :param pdf_path: the PDF file to optimize.
+        :param target_dpi: the resolution to which the embedded images are downsampled.
+        :param quality: the JPEG quality (0-100) of the downsampled images.
+        :return: the path to the smaller of the original and the optimized PDF, and the number of bytes saved.
+        """
+        output_directory = self.temp_directory + os.sep + 'optimized_pdf'
+        os.makedirs(output_directory, exist_ok=True)
+        output_path = output_directory + os.sep + os.path.basename(pdf_path)
+
+        n_downsampled = self.run(optimize_pdf, pdf_path, output_path, target_dpi, quality)
+        bytes_saved = os.path.getsize(pdf_path) - os.path.getsize(output_path)
+        Lg('lib.pdf_worker.PdfWorker.optimize_pdf',
+           f'Downsampled {n_downsampled} images and saved {bytes_saved} bytes: {pdf_path}')
+
+        # Some PDF files are already as small as they can be.
+        if bytes_saved <= 0:
+            os.remove(output_path)
+            return pdf_path, 0
+
+        return output_path, bytes_saved
+
+    def prune_thumbnails(self):
+        """
+        Remove the least recently used thumbnails beyond the cache's capacity.
+        :return: nothing.
+        """
+        paths = [
+            self.thumbnail_directory + os.sep + a for a in os.listdir(self.thumbnail_directory)
+            if not a.endswith('.part')
+        ]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for a in paths[self.MAX_CACHED_THUMBNAILS:]:
+            os.remove(a)
+
+    def shutdown(self):
+        """
+        Stop the worker processes, if any have been started.
+        :return: nothing.
+        """
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
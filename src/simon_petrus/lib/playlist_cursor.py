@@ -0,0 +1,83 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Conditional requests to the YouTube Data API using ETags
+    - https://developers.google.com/youtube/v3/getting-started#etags
+"""
+from json.decoder import JSONDecodeError
+import copy
+import json
+import threading
+
+
+class PlaylistCursorStore(object):
+    """
+    Remembers, per YouTube playlist, the ETag of its first result page and the videos already ingested,
+    so that the next synchronization only requests the videos added since. [1]
+    """
+
+    def __init__(self, cache_path: str):
+        """
+        :param cache_path: the JSON file in which the cursors are persisted across runs.
+        """
+        self.cache_path = cache_path
+        self.lock = threading.Lock()
+        self.cursors = {}
+        self.load()
+
+    def load(self):
+        """
+        Load the persisted cursors from the disk.
+        :return: nothing.
+        """
+        try:
+            with open(self.cache_path, 'r') as fi:
+                self.cursors = json.load(fi)
+        except (FileNotFoundError, JSONDecodeError):
+            self.cursors = {}
+
+    def save(self):
+        """
+        Persist the cursors to the disk.
+        :return: nothing.
+        """
+        with open(self.cache_path, 'w') as fo:
+            json.dump(self.cursors, fo)
+
+    def get(self, playlist_id: str):
+        """
+        Obtain the cursor of a given playlist.
+        :param playlist_id: the YouTube playlist ID.
+        :return: a copy of the cursor dict (with the keys "etag", "ids", and "items"), or None if never synchronized.
+        """
+        with self.lock:
+            c = self.cursors.get(playlist_id)
+            return copy.deepcopy(c) if c is not None else None
+
+    def put(self, playlist_id: str, etag: str, ids: list, items: list):
+        """
+        Store the cursor of a given playlist after a complete synchronization.
+        :param playlist_id: the YouTube playlist ID.
+        :param etag: the ETag of the playlist's first result page.
+        :param ids: every video ID listed in the playlist, in playlist order, including the unavailable videos.
+        :param items: the ingested (available) videos. Each item carries its YouTube video ID as "id".
+        :return: nothing.
+        """
+        with self.lock:
+            self.cursors[playlist_id] = {'etag': etag, 'ids': list(ids), 'items': copy.deepcopy(items)}
+            self.save()
+
+    def forget(self, playlist_id: str):
+        """
+        Remove the cursor of a given playlist, so that its next synchronization starts from scratch.
+        :param playlist_id: the playlist to forget.
+        :return: nothing.
+        """
+        with self.lock:
+            if self.cursors.pop(playlist_id, None) is not None:
+                self.save()
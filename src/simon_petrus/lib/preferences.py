@@ -37,11 +37,19 @@ class SavedPreferences(object):
     # The GKI Salatiga+ asset data folder.
     ASSETS_DIRECTORY = CONF_DIRECTORY + os.sep + 'assets'
 
+    # The persistent cache of the rendered PDF thumbnails.
+    PDF_THUMBNAIL_DIRECTORY = CONF_DIRECTORY + os.sep + 'pdf_thumbnails'
+
+    # The persistent cache of the optimized carousel and QRIS images.
+    IMAGE_CACHE_DIRECTORY = CONF_DIRECTORY + os.sep + 'optimized_images'
+
     # Unescaped double backslash problem mitigation in Windows OS.
     if os.name == 'nt':
         CONF_DIRECTORY = CONF_DIRECTORY.replace('\\', '/')
         TEMP_DIRECTORY = TEMP_DIRECTORY.replace('\\', '/')
         ASSETS_DIRECTORY = ASSETS_DIRECTORY.replace('\\', '/')
+        PDF_THUMBNAIL_DIRECTORY = PDF_THUMBNAIL_DIRECTORY.replace('\\', '/')
+        IMAGE_CACHE_DIRECTORY = IMAGE_CACHE_DIRECTORY.replace('\\', '/')
 
     # The app's settings JSON file.
     JSON_SETTINGS = CONF_DIRECTORY + os.sep + 'saved_preferences.json'
@@ -49,13 +57,36 @@ class SavedPreferences(object):
     # The GKI Salatiga+ downloaded (or fallback) JSON schema.
     JSON_DATA_SCHEMA = CONF_DIRECTORY + os.sep + 'data_schema.json'
 
+    # The persisted HTTP validators (ETag and Last-Modified) of the downloaded remote data.
+    JSON_HTTP_VALIDATORS = CONF_DIRECTORY + os.sep + 'http_validators.json'
+
+    # The persisted per-playlist synchronization cursors of the YouTube playlists.
+    JSON_YT_PLAYLIST_CURSORS = CONF_DIRECTORY + os.sep + 'yt_playlist_cursors.json'
+
+    # The persisted cache of the YouTube, WordPress, and Instagram lookup responses.
+    JSON_RESPONSE_CACHE = CONF_DIRECTORY + os.sep + 'response_cache.json'
+
+    # The persisted dimensions and BlurHash placeholders of the carousel and gallery images.
+    JSON_IMAGE_PLACEHOLDERS = CONF_DIRECTORY + os.sep + 'image_blurhashes.json'
+
     # The temporarily stored Google OAUTH2.0 token.
     JSON_GOOGLE_ACCOUNT_SERVICE_KEY = TEMP_DIRECTORY + os.sep + 'temp_oauth_token_refresh.json'
 
     # The default settings/config template JSON structure.
     JSON_SETTINGS_TEMPLATE = {
         'autosync_on_launch': 1,
+        'gallery_sharded': 0,
         'gdrive_fetch_all_photos': 0,
+        'gdrive_upload_chunk_mib': 5,
+        'image_optimize_dimensions': {'banner': [1280, 1280], 'poster': [1080, 1920], 'qris': [1024, 1024]},
+        'image_optimize_format': 'webp',
+        'image_optimize_quality': 80,
+        'pdf_optimize_before_upload': 0,
+        'pdf_optimize_image_quality': 75,
+        'pdf_optimize_target_dpi': 150,
+        'pdf_thumbnail_format': 'png',
+        'pdf_thumbnail_quality': 80,
+        'push_single_commit': 1,
         'remember_cred_loc': 0,
         'saved_cred_loc': '',
     }
@@ -187,6 +218,9 @@ class SavedPreferences(object):
         # print(self.session_secret)
         # print(self.JSON_GOOGLE_OAUTH_TOKEN)
 
+        # Flushing the refreshed Google Drive OAUTH token, which is otherwise only kept in memory.
+        global_schema.google_api.shutdown()
+
         # Saving the latest generated Google Drive OAUTH token to the encrypted JSON location.
         if os.path.isfile(self.session_json_enc_path) and os.path.isfile(self.JSON_GOOGLE_ACCOUNT_SERVICE_KEY):
             Lg('lib.preferences.SavedPreferences.shutdown', f'Overwriting old and expired Google OAUTH tokens ...')
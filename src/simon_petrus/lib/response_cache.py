@@ -0,0 +1,134 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] LRU caching with OrderedDict
+    - https://docs.python.org/3/library/collections.html#ordereddict-examples-and-recipes
+"""
+from collections import OrderedDict
+from json.decoder import JSONDecodeError
+import copy
+import json
+import threading
+import time
+
+from lib.logger import Logger as Lg
+
+
+class ResponseCache(object):
+    """
+    A keyed cache of remote lookup results, each kept for its own time-to-live and persisted across runs.
+    Once full, the least recently used entries are evicted first. [1]
+    """
+
+    # The maximum number of cached entries.
+    MAX_ENTRIES = 256
+
+    def __init__(self, cache_path: str, max_entries: int = MAX_ENTRIES):
+        """
+        :param cache_path: the JSON file in which the cached entries are persisted across runs.
+        :param max_entries: the maximum number of cached entries.
+        """
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.load()
+
+    def load(self):
+        """
+        Load the persisted entries from the disk, dropping the expired ones.
+        :return: nothing.
+        """
+        try:
+            with open(self.cache_path, 'r') as fi:
+                self.entries = OrderedDict(json.load(fi))
+        except (FileNotFoundError, JSONDecodeError):
+            self.entries = OrderedDict()
+
+        now = time.time()
+        for key in [a for a, b in self.entries.items() if b['expires'] <= now]:
+            del self.entries[key]
+
+    def save(self):
+        """
+        Persist the entries to the disk, in their least-to-most recently used order.
+        :return: nothing.
+        """
+        with open(self.cache_path, 'w') as fo:
+            json.dump(list(self.entries.items()), fo)
+
+    def get(self, key: str):
+        """
+        Obtain a cached value, unless it has expired.
+        :param key: the cache key.
+        :return: a copy of the cached value, or None if it is absent or expired.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            if entry['expires'] <= time.time():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return copy.deepcopy(entry['value'])
+
+    def put(self, key: str, value, ttl: float):
+        """
+        Cache a value, evicting the least recently used entries if the cache is full.
+        :param key: the cache key.
+        :param value: the JSON-serializable value to cache.
+        :param ttl: the time-to-live of the value, in seconds.
+        :return: nothing.
+        """
+        with self.lock:
+            self.entries[key] = {'expires': time.time() + ttl, 'value': copy.deepcopy(value)}
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self.save()
+
+    def fetch(self, key: str, ttl: float, target, force_refresh: bool = False):
+        """
+        Obtain a cached value, or call the target function and cache its return value.
+        :param key: the cache key.
+        :param ttl: the time-to-live of a newly cached value, in seconds.
+        :param target: the function returning the value to cache when it is absent or expired.
+        :param force_refresh: whether to bypass the cached value and always call the target function.
+        :return: the cached or newly retrieved value.
+        """
+        if not force_refresh:
+            value = self.get(key)
+            if value is not None:
+                Lg('lib.response_cache.ResponseCache.fetch', f'Using the cached response: {key}')
+                return value
+
+        value = target()
+        self.put(key, value, ttl)
+        return value
+
+    def forget(self, key: str):
+        """
+        Remove a cached value.
+        :param key: the cache key to forget.
+        :return: nothing.
+        """
+        with self.lock:
+            if self.entries.pop(key, None) is not None:
+                self.save()
+
+    def clear(self):
+        """
+        Remove every cached value.
+        :return: nothing.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.save()
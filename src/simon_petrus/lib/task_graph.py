@@ -0,0 +1,111 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Launching parallel tasks with concurrent.futures
+    - https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.wait
+"""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import time
+
+from lib.logger import Logger as Lg
+
+
+class TaskGraph(object):
+    """
+    Runs a small graph of dependent stages in a thread pool. [1]
+    Each stage starts as soon as all of the stages it depends on have finished,
+    so the graph takes about as long as its slowest chain of stages instead of the sum of all stages.
+    """
+
+    # The maximum number of stages running at the same time.
+    MAX_WORKERS = 4
+
+    def __init__(self, log_tag: str):
+        """
+        :param log_tag: the logging tag under which the stage timings are reported.
+        """
+        self.log_tag = log_tag
+
+        # The registered stages, keyed by their names. Each value is a tuple of the function and its dependencies.
+        self.stages = {}
+
+        # The return value and the duration (in seconds) of each finished stage.
+        self.results = {}
+        self.timings = {}
+
+    def add(self, name: str, target, deps: tuple = ()):
+        """
+        Register a stage.
+        :param name: the unique name of the stage.
+        :param target: the function to run. It receives the return values of its dependencies as positional arguments.
+        :param deps: the names of the stages which must finish before this stage starts.
+        :return: nothing.
+        """
+        for a in deps:
+            if a not in self.stages:
+                raise ValueError(f'The stage "{name}" depends on the unregistered stage "{a}"')
+        self.stages[name] = (target, tuple(deps))
+
+    def run_stage(self, name: str):
+        """
+        Run a single stage and record its duration.
+        :param name: the name of the stage to run.
+        :return: the stage's return value.
+        """
+        target, deps = self.stages[name]
+        start = time.perf_counter()
+        result = target(*[self.results[a] for a in deps])
+        self.timings[name] = time.perf_counter() - start
+        Lg(self.log_tag, f'Stage "{name}" finished in {self.timings[name]:.2f} s.')
+        return result
+
+    def run(self, max_workers: int = MAX_WORKERS, on_stage_done=None):
+        """
+        Run every registered stage, respecting their dependencies.
+        The first exception raised by any stage is re-raised here, after the running stages have stopped.
+        The results of the stages which did finish are then left in "results", so that the caller can roll them back.
+        :param max_workers: the maximum number of stages running at the same time.
+        :param on_stage_done: (optional) a function receiving the name of each finished stage,
+            the number of finished stages, and the total number of stages.
+        :return: the dict of the stages' return values, keyed by the stage names.
+        """
+        start = time.perf_counter()
+        pending = dict(self.stages)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                # Starting every stage whose dependencies have all finished.
+                for name in [a for a in pending.keys() if all(b in self.results for b in pending[a][1])]:
+                    running[executor.submit(self.run_stage, name)] = name
+                    del pending[name]
+
+                if not running:
+                    raise ValueError(f'The stages {list(pending.keys())} have circular dependencies')
+
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        self.results[name] = future.result()
+                    except Exception:
+                        # Do not start any further stage, but record the results of those still running.
+                        for a in running.keys():
+                            a.cancel()
+                        for a, b in running.items():
+                            try:
+                                self.results[b] = a.result()
+                            except Exception:
+                                pass
+                        raise
+
+                    if on_stage_done is not None:
+                        on_stage_done(name, len(self.results), len(self.stages))
+
+        Lg(self.log_tag, f'All {len(self.stages)} stages finished in {time.perf_counter() - start:.2f} s.')
+        return self.results
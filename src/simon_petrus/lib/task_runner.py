@@ -0,0 +1,144 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+
+---
+REFERENCES:
+    [1] Multithreading PyQt5 applications with QThreadPool
+    - https://www.pythonguis.com/tutorials/multithreading-pyqt-applications-qthreadpool
+    [2] Waiting for a signal without blocking the GUI using a local QEventLoop
+    - https://doc.qt.io/qt-5/qeventloop.html#exec
+"""
+import traceback
+
+from PyQt5 import QtCore
+from PyQt5.QtCore import pyqtSignal
+
+from lib.logger import Logger as Lg
+
+
+class TaskSignals(QtCore.QObject):
+    """ The signals emitted by a background task. QRunnable cannot emit signals by itself. [1] """
+
+    # Emitted with the task's return value when the task completes without raising.
+    finished = pyqtSignal(object)
+
+    # Emitted with the raised exception when the task fails.
+    error = pyqtSignal(object)
+
+    # Emitted with a progress value (0-100) and a status message.
+    progress = pyqtSignal(int, str)
+
+    # Always emitted once the task stops running, regardless of its outcome.
+    done = pyqtSignal()
+
+
+class BackgroundTask(QtCore.QRunnable):
+    """ Runs a single function in the global QThreadPool and reports its outcome through Qt signals. """
+
+    def __init__(self, target, args: tuple = (), kwargs: dict = None, with_progress: bool = False):
+        """
+        :param target: the function to run in the background.
+        :param args: the positional arguments passed to the target function.
+        :param kwargs: the keyword arguments passed to the target function.
+        :param with_progress: whether to pass a "progress_callback(value, msg)" keyword argument to the target.
+        """
+        super(BackgroundTask, self).__init__()
+        self.target = target
+        self.args = args
+        self.kwargs = {} if kwargs is None else kwargs
+        self.signals = TaskSignals()
+        self.result = None
+        self.exception = None
+
+        # The task is kept alive by its Python references instead of being deleted by the thread pool.
+        self.setAutoDelete(False)
+
+        if with_progress:
+            self.kwargs['progress_callback'] = self.signals.progress.emit
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        try:
+            self.result = self.target(*self.args, **self.kwargs)
+            self.signals.finished.emit(self.result)
+
+        except Exception as e:
+            self.exception = e
+            Lg('lib.task_runner.BackgroundTask.run', f'The background task raised an exception: {e}')
+            traceback.print_exc()
+            self.signals.error.emit(e)
+
+        finally:
+            self.signals.done.emit()
+
+
+class TaskRunner(object):
+    """ Dispatches background tasks to the app-wide QThreadPool. """
+
+    # The tasks which are still running, kept referenced so that they do not get garbage-collected.
+    running_tasks = set()
+
+    @staticmethod
+    def start(target, args: tuple = (), kwargs: dict = None,
+              on_finished=None, on_error=None, on_progress=None, with_progress: bool = False):
+        """
+        Start a function in the background without waiting for it.
+        :param target: the function to run in the background.
+        :param args: the positional arguments passed to the target function.
+        :param kwargs: the keyword arguments passed to the target function.
+        :param on_finished: (optional) the slot receiving the target's return value.
+        :param on_error: (optional) the slot receiving the exception raised by the target.
+        :param on_progress: (optional) the slot receiving the progress value and status message.
+        :param with_progress: whether to pass a "progress_callback(value, msg)" keyword argument to the target.
+        :return: the started BackgroundTask.
+        """
+        task = BackgroundTask(target, args, kwargs, with_progress)
+
+        if on_finished is not None:
+            task.signals.finished.connect(on_finished)
+        if on_error is not None:
+            task.signals.error.connect(on_error)
+        if on_progress is not None:
+            task.signals.progress.connect(on_progress)
+
+        # Release the reference once the task is done.
+        TaskRunner.running_tasks.add(task)
+        task.signals.done.connect(lambda: TaskRunner.running_tasks.discard(task))
+
+        QtCore.QThreadPool.globalInstance().start(task)
+        return task
+
+    @staticmethod
+    def run_and_wait(target, args: tuple = (), kwargs: dict = None, on_error=None, on_progress=None,
+                     with_progress: bool = False):
+        """
+        Run a function in the background and idle on a local Qt event loop until it is done. [2]
+        The GUI stays responsive and no CPU is spent polling for the result.
+        :param target: the function to run in the background.
+        :param args: the positional arguments passed to the target function.
+        :param kwargs: the keyword arguments passed to the target function.
+        :param on_error: (optional) a function mapping the raised exception into a fallback return value.
+            If not specified, the exception is re-raised in the calling thread.
+        :param on_progress: (optional) the slot receiving the progress value and status message.
+        :param with_progress: whether to pass a "progress_callback(value, msg)" keyword argument to the target.
+        :return: the target's return value, even if it is falsy.
+        """
+        loop = QtCore.QEventLoop()
+        task = BackgroundTask(target, args, kwargs, with_progress)
+        task.signals.done.connect(loop.quit)
+        if on_progress is not None:
+            task.signals.progress.connect(on_progress)
+
+        # The task is referenced locally until the loop quits.
+        QtCore.QThreadPool.globalInstance().start(task)
+        loop.exec_()
+
+        if task.exception is not None:
+            if on_error is None:
+                raise task.exception
+            return on_error(task.exception)
+
+        return task.result
@@ -24,49 +24,64 @@ REFERENCES:
     - https://pypi.org/project/instascrap
     [8] Parsing query parameters from a URL
     - https://www.perplexity.ai/search/how-to-parse-url-parameter-in-WSLXEUNZTdedJpXCr7cVKA
+    [9] Passing the API key of Google APIs as a request header
+    - https://cloud.google.com/docs/authentication/api-keys-use#using-with-rest
+    [10] Resumable uploads to Google Drive
+    - https://developers.google.com/drive/api/guides/manage-uploads#resumable
+    - https://googleapis.github.io/google-api-python-client/docs/epy/googleapiclient.http.HttpRequest-class.html#next_chunk
+    [11] Paginating and batching YouTube Data API requests
+    - https://developers.google.com/youtube/v3/guides/implementation/pagination
+    - https://developers.google.com/youtube/v3/docs/videos/list#id
+    [12] Conditional requests to the YouTube Data API using ETags
+    - https://developers.google.com/youtube/v3/getting-started#etags
+    [13] Incremental XML parsing with lxml
+    - https://lxml.de/parsing.html#iterparse-and-iterwalk
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime as dt
-from google.auth.transport.requests import Request
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 from instascrap import InstaScraper
-from lxml import html
+from lxml import etree
 from requests.exceptions import ConnectionError
 from urllib.parse import urlparse, parse_qs
-import fitz
 import json
 import os
-import requests
+import shutil
+import time
 import traceback
-import urllib.request
 
 import global_schema
 from lib.database import AppDatabase
 from lib.exceptions import InvalidMimeTypeException, UploadFileSizeTooBig, MalformedHttpResponseJSON
 from lib.logger import Logger as Lg
 from lib.mimetypes import MimeTypes
+from lib.task_graph import TaskGraph
 from lib.preferences import SavedPreferences
+from lib.string_validator import StringValidator
 from loading_animation import ScreenLoadingAnimation
 
 
 class Uploader(object):
 
-    # The Google Drive API scopes.
-    GOOGLE_DRIVE_SCOPES = [
-        'https://www.googleapis.com/auth/docs',
-        'https://www.googleapis.com/auth/drive',
-        'https://www.googleapis.com/auth/drive.appdata',
-        'https://www.googleapis.com/auth/drive.apps.readonly',
-        'https://www.googleapis.com/auth/drive.file',
-        'https://www.googleapis.com/auth/drive.meet.readonly',
-        'https://www.googleapis.com/auth/drive.metadata',
-        'https://www.googleapis.com/auth/drive.metadata.readonly',
-        'https://www.googleapis.com/auth/drive.photos.readonly',
-        'https://www.googleapis.com/auth/drive.readonly',
-    ]
+    # How long (in seconds) the responses of each kind of remote lookup are cached.
+    CACHE_TTL_IG_PROFILE = 10 * 60
+    CACHE_TTL_WP_CATEGORY = 7 * 24 * 60 * 60
+    CACHE_TTL_YT_RSS = 10 * 60
+    CACHE_TTL_YT_VIDEO = 60 * 60
+
+    # The resolution of the PDF thumbnails used as the posts' featured images.
+    PDF_THUMBNAIL_DPI = 75
+
+    # The chunk size of resumable Google Drive uploads must be a multiple of 256 KiB.
+    GDRIVE_CHUNK_GRANULARITY = 256 * 1024
+
+    # The number of times an interrupted Google Drive upload is resumed before giving up.
+    GDRIVE_MAX_RESUME_ATTEMPTS = 5
+
+    # The number of times each chunk is retried (with exponential backoff) by the Google API client itself.
+    GDRIVE_CHUNK_RETRIES = 3
 
     # The Google Drive ID of "Warta Jemaat" uploads.
     GDRIVE_ID_WARTA_JEMAAT = '1Nof_4RXb6RY33lkv__5uw4q3v5Ogf9oc'
@@ -110,11 +125,40 @@ class Uploader(object):
     # The YouTube RSS base URL for retrieving latest channel data.
     YT_RSS_BASE_SOURCE = 'https://www.youtube.com/feeds/videos.xml'
 
+    # The XML namespaces used in the YouTube RSS feed.
+    YT_RSS_NAMESPACES = {
+        'atom': 'http://www.w3.org/2005/Atom',
+        'media': 'http://search.yahoo.com/mrss/',
+        'yt': 'http://www.youtube.com/xml/schemas/2015',
+    }
+
+    # The host of the YouTube API v3.
+    YT_API_HOST = 'www.googleapis.com'
+
+    # The maximum number of YouTube playlists synchronized at the same time.
+    YT_MAX_WORKERS = 4
+
+    # The maximum number of results per page of the YouTube API v3, which is also
+    # the maximum number of video IDs per "videos.list" request.
+    YT_MAX_RESULTS = 50
+
     def __init__(self):
         self.anim = global_schema.anim
         self.prefs = global_schema.prefs
         self.app_db = global_schema.app_db
 
+        # The app-wide pooled HTTP client.
+        self.http = global_schema.http_client
+
+        # Sending the credentials by default with every WordPress and YouTube API request. [9]
+        if 'wp_authorization' in self.app_db.credentials:
+            self.http.set_host_headers(
+                urlparse(self.WP_DOMAIN_TARGET).hostname,
+                {'Authorization': 'Basic ' + self.app_db.credentials['wp_authorization']}
+            )
+        if 'api_youtube' in self.app_db.credentials:
+            self.http.set_host_headers(self.YT_API_HOST, {'X-Goog-Api-Key': self.app_db.credentials['api_youtube']})
+
     def edit_wp_post(self, post_id: int, new_content: str):
         """
         Edit and update an existing WordPress post in GKISalatiga.org. [5]
@@ -122,17 +166,12 @@ class Uploader(object):
         :param new_content: the new content that will overwrite the previous post content.
         :return: generic WordPress REST API JSON dict response.
         """
-        with requests.Session() as s:
-            # Prepare the request header.
-            wp_token = self.app_db.credentials['wp_authorization']
-            header = {'Authorization': 'Basic ' + wp_token}
-
-            # Finding the post ID's corresponding post URL.
-            post_url = self.WP_ENDPOINT_PAGES + '/' + str(post_id)
+        # Finding the post ID's corresponding post URL.
+        post_url = self.WP_ENDPOINT_PAGES + '/' + str(post_id)
 
-            # Updating the post.
-            post_data = {'content': new_content}
-            r = s.post(post_url, headers=header, json=post_data)
+        # Updating the post.
+        post_data = {'content': new_content}
+        r = self.http.post(post_url, json=post_data)
 
         # Return the obtained data.
         return r.json()
@@ -140,48 +179,55 @@ class Uploader(object):
     def generate_pdf_thumbnail(self, pdf_path: str):
         """
         Generate PDF overview thumbnail as an image.
+        The first page is rendered in a worker process, and only if the same PDF has not been rendered before.
         :param pdf_path: the string pointing to the respective PDF file's path.
         :return: the generated thumbnail's image path.
         """
+        image_format = self.prefs.settings['pdf_thumbnail_format']
 
-        # Determining the output filename.
-        filename_without_extension = os.path.splitext(os.path.split(pdf_path)[1])[0]
-        output_file = self.prefs.TEMP_DIRECTORY + os.sep + filename_without_extension + '.png'
-
-        # Setting PDF thumbnail image quality.
-        dpi = 75
-        zoom_factor = dpi / 72
-
-        # Generating the rasterization of PDF using PyMuPDF (fitz).
-        magnify = fitz.Matrix(zoom_factor, zoom_factor)
-        raster_doc = fitz.open(pdf_path)
+        # Rendering the first page, or reusing its cached render.
+        thumbnail_path = global_schema.pdf_worker.get_thumbnail(
+            pdf_path, page=0, dpi=self.PDF_THUMBNAIL_DPI, image_format=image_format,
+            quality=self.prefs.settings['pdf_thumbnail_quality']
+        )
 
-        # Saving only the raster image of the first page of the PDF only.
-        pix = raster_doc[0].get_pixmap(matrix=magnify)
-        pix.save(output_file)
+        # The uploaded media is named after the PDF file, not after the cached thumbnail.
+        filename_without_extension = os.path.splitext(os.path.split(pdf_path)[1])[0]
+        output_file = (self.prefs.TEMP_DIRECTORY + os.sep + filename_without_extension +
+                       '.' + global_schema.pdf_worker.THUMBNAIL_EXTENSIONS[image_format])
+        shutil.copyfile(thumbnail_path, output_file)
 
         # Returning the output thumbnail path.
         return output_file
 
-    def get_latest_ig_post(self, account_name: str):
+    def get_latest_ig_post(self, account_name: str, force_refresh: bool = False):
         """
         Retrieve one and only one last post of an Instagram account.
         This function also downloads the image of the post.
         :param account_name: the account name to scrape for the latest post.
+        :param force_refresh: whether to bypass the cached profile data.
         :return: the path of the downloaded latest Instagram post picture, as well as its metadata.
         """
-        ig_s = InstaScraper()
-
-        # Scrape the Instagram post data. [7]
-        r = ig_s.Scraper({'usernames': [account_name]})[0]
+        def scrape():
+            # Scrape the Instagram post data. [7]
+            return InstaScraper().Scraper({'usernames': [account_name]})[0]['latestPosts'][0]
 
         # Preparing the latest post's metadata
-        meta = r['latestPosts'][0]
+        meta = global_schema.response_cache.fetch(
+            f'ig-latest-post:{account_name}', self.CACHE_TTL_IG_PROFILE, scrape, force_refresh)
+
+        # The post image has already been downloaded in this session.
+        saved_file_path = self.prefs.TEMP_DIRECTORY + os.sep + 'ig_post-' + meta['id'] + '.webp'
+        if os.path.isfile(saved_file_path):
+            return saved_file_path, meta
 
         # Saving/downloading the post image.
         download_url = meta['displayUrl']
-        saved_file_path = self.prefs.TEMP_DIRECTORY + os.sep + 'ig_post-' + meta['id'] + '.webp'
-        urllib.request.urlretrieve(download_url, saved_file_path)
+        with self.http.get(download_url, stream=True) as r:
+            r.raise_for_status()
+            with open(saved_file_path, 'wb') as fo:
+                for chunk in r.iter_content(64 * 1024):
+                    fo.write(chunk)
 
         # Return the desired response data.
         return saved_file_path, meta
@@ -191,23 +237,11 @@ class Uploader(object):
         Scrape 10 the latest tata ibadah posts uploaded to GKISalatiga.org.
         :return: a standard dict specifying the latest tata ibadah data, as returned by the WordPress REST API.
         """
-        with requests.Session() as s:
-            s.get(self.WP_DOMAIN_TARGET)
-
-            # The authorization header.
-            wp_token = self.app_db.credentials['wp_authorization']
-            header = {'Authorization': 'Basic ' + wp_token}
+        # Retrieving the category ID.
+        category_id = self.get_wp_category_id('tata-ibadah')
 
-            # Retrieving the category ID.
-            cat_slug = 'tata-ibadah'
-            r = s.get(self.WP_ENDPOINT_CATEGORY + f'?slug={cat_slug}', headers=header)
-
-            # The category ID:
-            category_id = r.json()[0]['id']
-            Lg('lib.uploader.Uploader.get_latest_liturgi', f'Category "{cat_slug}" has the following ID: {category_id}')
-
-            # Fetch the latest category posts.
-            r = s.get(self.WP_ENDPOINT_POSTS + f'?categories={category_id}', headers=header)
+        # Fetch the latest category posts.
+        r = self.http.get(self.WP_ENDPOINT_POSTS + f'?categories={category_id}')
 
         return r.json()
 
@@ -216,23 +250,11 @@ class Uploader(object):
         Scrape 10 the latest warta jemaat posts uploaded to GKISalatiga.org.
         :return: a standard dict specifying the latest warta jemaat data, as returned by the WordPress REST API.
         """
-        with requests.Session() as s:
-            s.get(self.WP_DOMAIN_TARGET)
-
-            # The authorization header.
-            wp_token = self.app_db.credentials['wp_authorization']
-            header = {'Authorization': 'Basic ' + wp_token}
+        # Retrieving the category ID.
+        category_id = self.get_wp_category_id('warta-jemaat')
 
-            # Retrieving the category ID.
-            cat_slug = 'warta-jemaat'
-            r = s.get(self.WP_ENDPOINT_CATEGORY + f'?slug={cat_slug}', headers=header)
-
-            # The category ID:
-            category_id = r.json()[0]['id']
-            Lg('lib.uploader.Uploader.get_latest_warta', f'Category "{cat_slug}" has the following ID: {category_id}')
-
-            # Fetch the latest category posts.
-            r = s.get(self.WP_ENDPOINT_POSTS + f'?categories={category_id}', headers=header)
+        # Fetch the latest category posts.
+        r = self.http.get(self.WP_ENDPOINT_POSTS + f'?categories={category_id}')
 
         # Return the data.
         return r.json()
@@ -243,47 +265,105 @@ class Uploader(object):
         :param playlist_id: the playlist ID whose data will be fetched.
         :return: a generic YouTube API v3 JSON dict.
         """
-        # Prepare the YouTube API v3 API key.
-        key = self.app_db.credentials['api_youtube']
-
         # Preparing the request queries.
         part = 'snippet'
         max_results = 50
 
         # Fetching the data.
-        with requests.Session() as s:
-            r = s.get(self.YT_ENDPOINT_PLAYLIST_ITEMS + f'?key={key}&part={part}&playlistId={playlist_id}&maxResults={max_results}')
+        r = self.http.get(self.YT_ENDPOINT_PLAYLIST_ITEMS + f'?part={part}&playlistId={playlist_id}&maxResults={max_results}')
 
         # Return the data.
         return r.json()
 
-    def get_yt_playlist_data(self, playlist_id: str, max_result: int = 25):
+    def get_wp_category_id(self, cat_slug: str, force_refresh: bool = False):
         """
-        Retrieve the list of videos in a given YouTube playlist.
-        :param playlist_id: the playlist ID which videos we will obtain.
-        :param max_result: the number of video results (from 1 to 50) that we will obtain.
-        :return: generic list of the playlist's retrieved video metadata.
+        Retrieve the ID of a WordPress category, which hardly ever changes.
+        :param cat_slug: the category slug, e.g., 'warta-jemaat'.
+        :param force_refresh: whether to bypass the cached category ID.
+        :return: the category ID.
         """
-        try:
-            max_result = 50 if max_result > 50 else (0 if max_result < 0 else max_result)
-
-            # Prepare the YouTube API v3 API key.
-            key = self.app_db.credentials['api_youtube']
+        def lookup():
+            r = self.http.get(self.WP_ENDPOINT_CATEGORY, params={'slug': cat_slug})
+            r.raise_for_status()
+            return r.json()[0]['id']
 
-            # Preparing the request queries.
-            part = 'snippet'
+        category_id = global_schema.response_cache.fetch(
+            f'wp-category:{cat_slug}', self.CACHE_TTL_WP_CATEGORY, lookup, force_refresh)
+        Lg('lib.uploader.Uploader.get_wp_category_id', f'Category "{cat_slug}" has the following ID: {category_id}')
 
-            global_schema.anim.set_prog_msg(50, 'Retrieving the latest playlist data ...')
+        return category_id
 
-            # Fetching the data.
-            with requests.Session() as s:
-                r = s.get(
-                    self.YT_ENDPOINT_PLAYLIST_ITEMS +
-                    f'?key={key}&part={part}&playlistId={playlist_id}&maxResults={max_result}'
-                )
+    def get_yt_playlist_data(self, playlist_id: str, show_progress: bool = True):
+        """
+        Retrieve the list of videos in a given YouTube playlist, following every result page. [11]
+        Only the videos not ingested at the last synchronization are requested in detail,
+        and nothing else is requested at all if the playlist has not changed (HTTP 304). [12]
+        :param playlist_id: the playlist ID which videos we will obtain.
+        :param show_progress: whether to report the progress to the loading screen.
+        :return: the playlist's available videos, each as a dict of "title", "date", "desc", "link", and "thumbnail".
+        """
+        try:
+            cursor = global_schema.yt_cursors.get(playlist_id)
+            known_items = {a['id']: a for a in cursor['items']} if cursor is not None else {}
+
+            if show_progress:
+                global_schema.anim.set_prog_msg(20, 'Retrieving the latest playlist data ...')
+
+            # Paging through the playlist, which only lists the video IDs.
+            ids = []
+            etag = None
+            page_token = None
+            while True:
+                params = {'part': 'contentDetails', 'playlistId': playlist_id, 'maxResults': self.YT_MAX_RESULTS}
+                headers = {}
+                if page_token is not None:
+                    params['pageToken'] = page_token
+                elif cursor is not None:
+                    headers['If-None-Match'] = cursor['etag']
+
+                r = self.http.get(self.YT_ENDPOINT_PLAYLIST_ITEMS, params=params, headers=headers)
+
+                # The playlist has not changed since its last synchronization.
+                if r.status_code == 304:
+                    Lg('Uploader.get_yt_playlist_data', f'The playlist {playlist_id} is unchanged, using its stored items.')
+                    return self.strip_yt_video_ids(cursor['items']), True, 'The YouTube playlist is already up to date!'
+
+                r.raise_for_status()
+                j = r.json()
+
+                if etag is None:
+                    etag = r.headers.get('ETag', j['etag'])
+
+                # Every page is listed once the playlist has changed, since any page may have had
+                # its videos replaced without the playlist's total changing.
+                ids.extend(a['contentDetails']['videoId'] for a in j['items'])
+                page_token = j.get('nextPageToken')
+
+                if page_token is None:
+                    break
+
+            # Retrieving the details of the new videos only, in batches of 50 IDs.
+            # The videos which were private or deleted at the last synchronization are requested again,
+            # since they may have become available since.
+            ids = list(dict.fromkeys(ids))
+            new_ids = [a for a in ids if a not in known_items]
+            if show_progress:
+                global_schema.anim.set_prog_msg(60, f'Retrieving the details of {len(new_ids)} new videos ...')
+
+            for b in self.get_yt_videos_data(new_ids):
+                item = self.get_yt_playlist_item(b)
+                if item is not None:
+                    known_items[item['id']] = item
+
+            # Private or deleted videos are not returned by the API, so they are skipped.
+            items = [known_items[a] for a in ids if a in known_items]
+            if len(items) < len(ids):
+                Lg('Uploader.get_yt_playlist_data', f'Skipped {len(ids) - len(items)} private or deleted videos.')
+
+            global_schema.yt_cursors.put(playlist_id, etag, ids, items)
 
             # Return the data.
-            return r.json(), True, 'YouTube playlist data synchronization successful!'
+            return self.strip_yt_video_ids(items), True, 'YouTube playlist data synchronization successful!'
 
         except ConnectionError as e:
             msg = f'Cannot scrape YouTube data because the internet is lost: {e}'
@@ -295,12 +375,35 @@ class Uploader(object):
             Lg('Uploader.get_yt_playlist_data', msg)
             return [], False, msg
 
-    def get_yt_rss_data(self, filter_title_keyword: str = '', channel_id: str = YT_GKIS_CHANNEL_ID):
+    @staticmethod
+    def get_yt_playlist_item(video: dict):
+        """
+        Convert a YouTube API v3 video resource into a playlist content item.
+        :param video: the video resource returned by "videos.list".
+        :return: the playlist content item, or None if the video has no "high quality" thumbnail.
+        """
+        snippet = video['snippet']
+        if 'high' not in snippet['thumbnails']:
+            Lg('Uploader.get_yt_playlist_item', f'We cannot retrieve the thumbnail of the video: {video["id"]}')
+            return None
+
+        return {
+            'id': video['id'],
+            'title': snippet['title'],
+            'date': snippet['publishedAt'].split('T')[0],
+            'desc': snippet['description'],
+            'link': StringValidator.get_youtube_link_from_id(video['id']),
+            'thumbnail': snippet['thumbnails']['high']['url']
+        }
+
+    def get_yt_rss_data(self, filter_title_keyword: str = '', channel_id: str = YT_GKIS_CHANNEL_ID,
+                        force_refresh: bool = False):
         """
         Retrieve the list of a YouTube channel's latest videos from the official RSS feed.
         :param channel_id: the YouTube channel ID which RSS feed will be scraped.
         :param filter_title_keyword: the keywords in the video title that would qualify an RSS video.
         (Pass an empty string for "no filter, fetch everything in the RSS".)
+        :param force_refresh: whether to check the feed again even if it has been checked recently.
         :return: generic list of the retrieved RSS video list, as a Python dict instead of regular XML tree.
             the returned data includes:
                 - video ID
@@ -318,63 +421,15 @@ class Uploader(object):
         """
         try:
             # Fetching the data.
-            with requests.Session() as s:
-                global_schema.anim.set_prog_msg(50, 'Retrieving the latest RSS data ...')
-
-                r = s.get(f'{self.YT_RSS_BASE_SOURCE}?channel_id={channel_id}')
-                c = html.fromstring(r.content)
-
-                video_id = [l.split(':')[2] for l in c.xpath('//entry/id/text()')]
-                video_title = [l.strip() for l in c.xpath('//entry/title/text()')]
-                video_url = [l.strip() for l in c.xpath('//entry/link/@href')]
-                author_name = [l.strip() for l in c.xpath('//entry/author/name/text()')]
-                author_url = [l.strip() for l in c.xpath('//entry/author/uri/text()')]
-                date_published = [l.strip() for l in c.xpath('//entry/published/text()')]
-                date_updated = [l.strip() for l in c.xpath('//entry/updated/text()')]
-                video_thumbnail = [l.strip() for l in c.xpath('//entry//*[local-name()="media:thumbnail"]/@url')]
-                video_description = [l.strip() for l in c.xpath('//entry//*[local-name()="media:description"]/text()')]
-                number_of_views = [l.strip() for l in c.xpath('//entry//*[local-name()="media:statistics"]/@views')]
-                number_of_ratings = [l.strip() for l in c.xpath('//entry//*[local-name()="media:starrating"]/@count')]
-                rating_average = [l.strip() for l in c.xpath('//entry//*[local-name()="media:starrating"]/@average')]
-
-                # The return data being built.
-                return_json = []
-
-                # Building the return JSON data.
-                # Assumes all the above lists have the same/identical size.
-                for i in range(len(video_id)):
-                    # The filter. Continue the loop if the current entry does not match criteria.
-                    if filter_title_keyword != '':
-                        if not video_title[i].lower().__contains__(filter_title_keyword.lower()):
-                            continue
-
-                    # Building the response JSON data.
-                    a = {
-                        'is_data_empty': 0,
-                        'video_id': video_id[i],
-                        'video_title': video_title[i],
-                        'video_url': video_url[i],
-                        'author_name': author_name[i],
-                        'author_url': author_url[i],
-                        'date_published': date_published[i],
-                        'date_updated': date_updated[i],
-                        'video_thumbnail': video_thumbnail[i],
-                        'video_description': video_description[i],
-                        'number_of_views': number_of_views[i],
-                        'number_of_ratings': number_of_ratings[i],
-                        'rating_average': rating_average[i],
-                    }
-
-                    # Appending to the general JSON dict.
-                    return_json.append(a)
-
-                # DEBUG.
-                # print(return_json)
-
-                # Mitigating infinite ThreadWithResult looping when an empty dict is returned.
-                if return_json is [] or len(return_json) == 0 or str(return_json) == '[]':
-                    Lg('Uploader.get_yt_rss_data', 'Got some empty post-filtering data here.')
-                    return [{'is_data_empty': 1}], True, 'Sync successful but the returned data is empty!'
+            global_schema.anim.set_prog_msg(50, 'Retrieving the latest RSS data ...')
+
+            feed_path = self.get_yt_rss_feed(channel_id, force_refresh)
+            return_json = self.parse_yt_rss_feed(feed_path, filter_title_keyword)
+
+            # Mitigating infinite ThreadWithResult looping when an empty dict is returned.
+            if len(return_json) == 0:
+                Lg('Uploader.get_yt_rss_data', 'Got some empty post-filtering data here.')
+                return [{'is_data_empty': 1}], True, 'Sync successful but the returned data is empty!'
 
             # Return the data.
             return return_json, True, 'The YouTube playlist has been synchronized!'
@@ -389,25 +444,318 @@ class Uploader(object):
             Lg('Uploader.get_yt_rss_data', msg)
             return [], False, msg
 
-    def get_yt_video_data(self, video_id: str):
+    @staticmethod
+    def get_yt_rss_playlist_items(rss_data: list):
+        """
+        Convert the RSS videos into playlist content items.
+        :param rss_data: the RSS videos, as returned by "get_yt_rss_data".
+        :return: the playlist content items, each as a dict of "title", "date", "desc", "link", and "thumbnail".
+        """
+        return [
+            {
+                'title': b['video_title'],
+                'date': b['date_published'].split('T')[0],
+                'desc': b['video_description'],
+                'link': b['video_url'],
+                'thumbnail': b['video_thumbnail']
+            }
+            for b in rss_data if not b['is_data_empty'] == 1
+        ]
+
+    def get_yt_rss_feed(self, channel_id: str = YT_GKIS_CHANNEL_ID, force_refresh: bool = False):
+        """
+        Download the RSS feed of a YouTube channel, unless the locally stored feed is still current.
+        A feed checked only a few minutes ago is not checked again.
+        :param channel_id: the YouTube channel ID which RSS feed will be downloaded.
+        :param force_refresh: whether to check the feed again even if it has been checked recently.
+        :return: the path to the locally stored RSS feed.
+        """
+        feed_url = f'{self.YT_RSS_BASE_SOURCE}?channel_id={channel_id}'
+        feed_path = self.prefs.CONF_DIRECTORY + os.sep + f'yt_rss_{channel_id}.xml'
+
+        if not os.path.isfile(feed_path):
+            force_refresh = True
+
+        def download():
+            global_schema.http_cache.download(feed_url, feed_path, session=self.http.get_session())
+            return feed_path
+
+        return global_schema.response_cache.fetch(f'yt-rss:{channel_id}', self.CACHE_TTL_YT_RSS, download, force_refresh)
+
+    def get_yt_video_data(self, video_id: str, force_refresh: bool = False):
         """
         Retrieve the YouTube snippet data from a given YouTube ID.
         :param video_id: the YouTube video's ID to retrieve the information of.
+        :param force_refresh: whether to bypass the cached snippet data.
         :return: generic YouTube v3 API JSON response.
         """
-        # Prepare the YouTube API v3 API key.
-        key = self.app_db.credentials['api_youtube']
+        cache_key = f'yt-video:{video_id}'
+        j = None if force_refresh else global_schema.response_cache.get(cache_key)
+        if j is not None:
+            return j
 
         # Preparing the request queries.
         part = 'snippet'
 
         # Fetching the data.
-        with requests.Session() as s:
-            r = s.get(
-                self.YT_ENDPOINT_VIDEO_ITEMS + f'?key={key}&part={part}&id={video_id}')
+        r = self.http.get(self.YT_ENDPOINT_VIDEO_ITEMS + f'?part={part}&id={video_id}')
+        j = r.json()
+
+        # Videos which are not found (yet) are not cached, since they may be published any moment.
+        if j.get('pageInfo', {}).get('totalResults', 0) > 0:
+            global_schema.response_cache.put(cache_key, j, self.CACHE_TTL_YT_VIDEO)
 
         # Return the data.
-        return r.json()
+        return j
+
+    def get_yt_videos_data(self, video_ids: list):
+        """
+        Retrieve the YouTube snippet data of many videos, requesting up to 50 video IDs per API call.
+        :param video_ids: the YouTube video IDs to retrieve the information of.
+        :return: the list of the retrieved YouTube API v3 video resources. Private or deleted videos are absent.
+        """
+        videos = []
+        for i in range(0, len(video_ids), self.YT_MAX_RESULTS):
+            r = self.http.get(self.YT_ENDPOINT_VIDEO_ITEMS, params={
+                'part': 'snippet',
+                'id': ','.join(video_ids[i:i + self.YT_MAX_RESULTS]),
+                'maxResults': self.YT_MAX_RESULTS
+            })
+            r.raise_for_status()
+            videos.extend(r.json()['items'])
+        return videos
+
+    @staticmethod
+    def parse_yt_rss_feed(feed_path: str, filter_title_keyword: str = ''):
+        """
+        Parse a YouTube RSS feed in a single pass, one entry at a time. [13]
+        Every field is read from its own entry, so an entry lacking an optional element
+        (e.g., "media:starRating") yields an empty string instead of shifting the other entries' fields.
+        :param feed_path: the path to the locally stored RSS feed.
+        :param filter_title_keyword: the keywords in the video title that would qualify an RSS video.
+        (Pass an empty string for "no filter, fetch everything in the RSS".)
+        :return: the list of the qualifying RSS videos, as described in "get_yt_rss_data".
+        """
+        ns = Uploader.YT_RSS_NAMESPACES
+        keyword = filter_title_keyword.lower()
+
+        def text(entry, path: str):
+            return (entry.findtext(path, default='', namespaces=ns) or '').strip()
+
+        def attr(entry, path: str, name: str):
+            e = entry.find(path, namespaces=ns)
+            return e.get(name, '').strip() if e is not None else ''
+
+        return_json = []
+        for _, entry in etree.iterparse(feed_path, events=('end',), tag=f'{{{ns["atom"]}}}entry'):
+            video_title = text(entry, 'atom:title')
+
+            # The filter. Skip the rest of the current entry if it does not match criteria.
+            if keyword == '' or keyword in video_title.lower():
+                return_json.append({
+                    'is_data_empty': 0,
+                    'video_id': text(entry, 'yt:videoId') or text(entry, 'atom:id').split(':')[-1],
+                    'video_title': video_title,
+                    'video_url': attr(entry, 'atom:link', 'href'),
+                    'author_name': text(entry, 'atom:author/atom:name'),
+                    'author_url': text(entry, 'atom:author/atom:uri'),
+                    'date_published': text(entry, 'atom:published'),
+                    'date_updated': text(entry, 'atom:updated'),
+                    'video_thumbnail': attr(entry, 'media:group/media:thumbnail', 'url'),
+                    'video_description': text(entry, 'media:group/media:description'),
+                    'number_of_views': attr(entry, 'media:group/media:community/media:statistics', 'views'),
+                    'number_of_ratings': attr(entry, 'media:group/media:community/media:starRating', 'count'),
+                    'rating_average': attr(entry, 'media:group/media:community/media:starRating', 'average'),
+                })
+
+            # Freeing the parsed entry, so that only one entry is held in memory at a time.
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+
+        return return_json
+
+    def publish_pdf_post(self, pdf_path: str, post_title: str, folder_id: str, cats: list, tags: list, post_label: str):
+        """
+        Upload a PDF file to Google Drive, then post it to WordPress with the PDF thumbnail as its featured image.
+        The Drive upload runs in parallel with the thumbnail generation and upload,
+        and the post is created once both branches have finished.
+        The uploaded thumbnail is deleted again if the post cannot be created, so that no WordPress media is orphaned.
+        :param pdf_path: the string pointing to the respective PDF file's path.
+        :param post_title: the title of the WordPress post.
+        :param folder_id: the target Google Drive folder ID to which the PDF file will be uploaded.
+        :param cats: the category IDs of the WordPress post.
+        :param tags: the tag IDs of the WordPress post.
+        :param post_label: the kind of the post displayed in the status messages, e.g., 'Warta Jemaat'.
+        :return: a boolean of upload status and an upload message string.
+        """
+        try:
+            # Finding the selected file's mime type. [2]
+            file_mimetype = MimeTypes.guess_mimetype(pdf_path)
+
+            if file_mimetype != 'application/pdf':
+                raise InvalidMimeTypeException
+
+            def optimize_pdf():
+                if self.prefs.settings['pdf_optimize_before_upload'] != 1:
+                    return pdf_path
+
+                optimized_path, bytes_saved = global_schema.pdf_worker.optimize_pdf(
+                    pdf_path, self.prefs.settings['pdf_optimize_target_dpi'],
+                    self.prefs.settings['pdf_optimize_image_quality']
+                )
+                msg = (f'The PDF file has been optimized from {os.path.getsize(pdf_path) / 1048576:.1f} MiB: '
+                       f'{bytes_saved / 1048576:.1f} MiB saved.')
+                Lg('lib.uploader.Uploader.publish_pdf_post', msg)
+                self.anim.set_status_message(msg)
+                return optimized_path
+
+            def upload_thumbnail(thumbnail_path: str):
+                wp_media_upload_response = self.upload_wp_media(
+                    thumbnail_path, f'Featured image for the post "{post_title}"')
+                return wp_media_upload_response['id']
+
+            def create_post(gdrive_pdf_id: str, featured_image_id: int):
+                content = f'''
+                <!-- AUTO-GENERATED BY "SIMON PETRUS", AN ADMINISTRATOR DASHBOARD APP OF GKI SALATIGA -->
+                <!-- SEE MORE IN THIS GITHUB REPOSITORY: https://github.com/gkisalatiga/simon-petrus -->
+                <iframe src="https://drive.google.com/file/d/{gdrive_pdf_id}/preview" width="640" height="480" allow="autoplay"></iframe>
+                <p>
+                    <a href="https://drive.usercontent.google.com/u/0/uc?export=download&id={gdrive_pdf_id}">
+                        <strong>{post_title}</strong>
+                    </a>
+                </p>
+                '''.strip()
+                return self.upload_wp_post(post_title, content, featured_image_id, cats, tags)
+
+            # The Drive branch (optimization, then upload) and the thumbnail branch do not depend on each other.
+            graph = TaskGraph('lib.uploader.Uploader.publish_pdf_post')
+            graph.add('optimize', optimize_pdf)
+            graph.add('drive', lambda upload_path: self.upload_google_drive(
+                upload_path, file_mimetype, folder_id, f'{post_title}.pdf',
+                lambda sent, total: self.anim.set_status_message(
+                    f'Uploading PDF to Google Drive ({sent / 1048576:.1f} of {total / 1048576:.1f} MiB) ...')
+            )['id'], deps=('optimize',))
+            graph.add('thumbnail', lambda: self.generate_pdf_thumbnail(pdf_path))
+            graph.add('thumbnail_upload', upload_thumbnail, deps=('thumbnail',))
+            graph.add('post', create_post, deps=('drive', 'thumbnail_upload'))
+
+            # The status message displayed once each stage is done.
+            stage_msg = {
+                'optimize': 'The PDF file is ready to be uploaded.',
+                'drive': 'The PDF file has been uploaded to Google Drive.',
+                'thumbnail': 'The PDF thumbnail has been generated.',
+                'thumbnail_upload': 'The featured image (thumbnail) has been uploaded to WordPress.',
+                'post': 'The post has been published to WordPress.',
+            }
+
+            msg = 'Uploading PDF to Google Drive and generating the PDF thumbnail ...'
+            self.anim.set_prog_msg(10, msg)
+            Lg('lib.uploader.Uploader.publish_pdf_post', msg)
+            try:
+                graph.run(
+                    on_stage_done=lambda name, n, total: self.anim.set_prog_msg(
+                        10 + round(85 * n / total), stage_msg[name])
+                )
+            except Exception:
+                # The post could not be created, so the uploaded featured image would be left orphaned.
+                if 'thumbnail_upload' in graph.results and 'post' not in graph.results:
+                    self.delete_wp_media(graph.results['thumbnail_upload'])
+                raise
+
+            # Done! It's finished.
+            self.anim.set_progress(100)
+            return True, f'The "{post_label}" post has been successfully uploaded and created!'
+
+        except HttpError as e:
+            msg = f'An unknown HTTP error has just occurred. Maybe check your internet connection?: {e}'
+            Lg('lib.uploader.Uploader.publish_pdf_post', msg)
+            return False, msg
+
+        except InvalidMimeTypeException as e:
+            msg = f'You must select a valid PDF file ending in ".pdf" file extension!: {e}'
+            Lg('lib.uploader.Uploader.publish_pdf_post', msg)
+            return False, msg
+
+        except Exception as e:
+            msg = f'Unknown error is detected: {e}'
+            Lg('lib.uploader.Uploader.publish_pdf_post', msg)
+            traceback.print_exc()
+            return False, msg
+
+    @staticmethod
+    def strip_yt_video_ids(items: list):
+        """
+        Remove the internal video IDs from the playlist content items, as stored in the JSON schema.
+        :param items: the playlist content items.
+        :return: the playlist content items without their "id" key.
+        """
+        return [{k: v for k, v in a.items() if k != 'id'} for a in items]
+
+    def sync_yt_playlists(self, playlists: list, progress_callback=None):
+        """
+        Synchronize several YouTube playlists concurrently.
+        Every RSS playlist filters the same channel feed, so the feed is downloaded and parsed only once for all of them.
+        :param playlists: the playlists' JSON nodes to synchronize.
+        :param progress_callback: (optional) a function receiving the progress value (0-100) and a status message
+            each time a playlist is done.
+        :return: the list of (content items, success status, log message) tuples, in the same order as the playlists.
+        """
+        results = [None] * len(playlists)
+        n_done = 0
+
+        def report(i: int):
+            nonlocal n_done
+            n_done += 1
+            msg = f'({n_done}/{len(playlists)}) Synchronized the playlist: {playlists[i]["title"]}'
+            Lg('Uploader.sync_yt_playlists', msg)
+            if progress_callback is not None:
+                progress_callback(round(100 * n_done / len(playlists)), msg)
+
+        with ThreadPoolExecutor(max_workers=self.YT_MAX_WORKERS) as executor:
+            futures = {}
+            for i, a in enumerate(playlists):
+                if a['type'] == 'regular':
+                    futures[executor.submit(self.get_yt_playlist_data, a['playlist-id'], False)] = [i]
+                elif a['type'] != 'rss':
+                    results[i] = [], False, f'Unknown playlist type: {a["type"]}'
+                    report(i)
+
+            # The one shared download of the channel's RSS feed.
+            rss_idx = [i for i, a in enumerate(playlists) if a['type'] == 'rss']
+            if len(rss_idx) > 0:
+                # The user asked for the latest data, and the conditional request keeps the check cheap.
+                futures[executor.submit(self.get_yt_rss_feed, force_refresh=True)] = rss_idx
+
+            for future in as_completed(futures):
+                if playlists[futures[future][0]]['type'] == 'regular':
+                    results[futures[future][0]] = future.result()
+                    report(futures[future][0])
+                    continue
+
+                try:
+                    rss_data = self.parse_yt_rss_feed(future.result())
+                    for i in futures[future]:
+                        keyword = playlists[i]['rss-title-keyword'].lower()
+                        a = [b for b in rss_data if keyword in b['video_title'].lower()]
+                        results[i] = self.get_yt_rss_playlist_items(a), True, 'The YouTube playlist has been synchronized!'
+
+                except ConnectionError as e:
+                    msg = f'Cannot scrape YouTube data because the internet is lost: {e}'
+                    Lg('Uploader.sync_yt_playlists', msg)
+                    for i in futures[future]:
+                        results[i] = [], False, msg
+
+                except Exception as e:
+                    msg = f'Unknown error detected: {e}'
+                    Lg('Uploader.sync_yt_playlists', msg)
+                    for i in futures[future]:
+                        results[i] = [], False, msg
+
+                for i in futures[future]:
+                    report(i)
+
+        return results
 
     def update_wp_homepage(
             self,
@@ -429,100 +777,97 @@ class Uploader(object):
             # DEBUG! Please comment out after use.
             # print(autodetect_last_yt, autodetect_last_ig, custom_yt_link, custom_ig_img_path)
 
-            # Preparing the poster image.
-            msg = 'Preparing the service poster image ...'
-            self.anim.set_prog_msg(10, msg)
-            Lg('lib.uploader.Uploader.update_wp_homepage', msg)
-            if not autodetect_last_ig:
-                # Finding the selected file's mime type. [2]
-                file_mimetype = MimeTypes.guess_mimetype(custom_ig_img_path)
-
-                if not file_mimetype.startswith('image/'):
-                    raise InvalidMimeTypeException
-
-                local_ig_poster_path = custom_ig_img_path
+            # The "Ibadah GKI Salatiga" homepage post id.
+            homepage_post_id = 52
 
-            else:
-                # Obtaining the latest Instagram post using "instascrap".
-                msg = 'Scraping the latest Instagram post ...'
-                self.anim.set_prog_msg(15, msg)
-                Lg('lib.uploader.Uploader.update_wp_homepage', msg)
-                poster_img_path, poster_meta = self.get_latest_ig_post(self.IG_ACCOUNT_USERNAME)
+            def prepare_poster():
+                if not autodetect_last_ig:
+                    # Finding the selected file's mime type. [2]
+                    file_mimetype = MimeTypes.guess_mimetype(custom_ig_img_path)
 
-                # Prepare the poster path.
-                local_ig_poster_path = poster_img_path
+                    if not file_mimetype.startswith('image/'):
+                        raise InvalidMimeTypeException
 
-            # Scraping the latest "Warta Jemaat" data.
-            msg = 'Fetching the latest "Warta Jemaat" posts ...'
-            self.anim.set_prog_msg(25, msg)
-            Lg('lib.uploader.Uploader.update_wp_homepage', msg)
-            all_warta = self.get_latest_warta()
+                    return custom_ig_img_path
 
-            # The latest warta link.
-            latest_warta = all_warta[0]['link']
+                # Obtaining the latest Instagram post using "instascrap".
+                # The homepage must show the post published right now, not the one cached minutes ago.
+                poster_img_path, poster_meta = self.get_latest_ig_post(self.IG_ACCOUNT_USERNAME, force_refresh=True)
+                return poster_img_path
 
-            # Scraping the latest "Tata Ibadah" data.
-            msg = 'Fetching the latest "Tata Ibadah" posts ...'
-            self.anim.set_prog_msg(40, msg)
-            Lg('lib.uploader.Uploader.update_wp_homepage', msg)
-            all_liturgi = self.get_latest_liturgi()
+            def upload_poster(local_ig_poster_path: str):
+                return self.upload_wp_media(local_ig_poster_path, f'Sunday service featured poster image')
 
-            # The latest liturgi link.
-            latest_liturgi = all_liturgi[0]['link']
+            def prepare_yt_embed():
+                if not autodetect_last_yt:
+                    # Parsing the YouTube link's query parameters. [8]
+                    parsed_url = urlparse(custom_yt_link)
+                    v = parse_qs(parsed_url.query)['v'][0]
 
-            # Preparing the latest YouTube streaming URL.
-            msg = 'Preparing the YouTube embedded streaming URL ...'
-            self.anim.set_prog_msg(55, msg)
-            Lg('lib.uploader.Uploader.update_wp_homepage', msg)
-            if not autodetect_last_yt:
-                # Parsing the YouTube link's query parameters. [8]
-                parsed_url = urlparse(custom_yt_link)
-                v = parse_qs(parsed_url.query)['v'][0]
-                target_yt_embed = self.YT_EMBED_PREFIX + f'/{v}'
+                    # DEBUG! Please comment out on production.
+                    # print(f'v:{v}')
 
-                # DEBUG! Please comment out on production.
-                # print(f'v:{v}')
+                    return self.YT_EMBED_PREFIX + f'/{v}'
 
-            else:
                 # Calling the YouTube API v3 to retrieve the latest "Kebaktian Umum" URL.
-                msg = 'Fetching the latest "Kebaktian Umum" YouTube streaming videos ...'
-                self.anim.set_prog_msg(60, msg)
-                Lg('lib.uploader.Uploader.update_wp_homepage', msg)
                 all_video_data = self.get_latest_yt_playlist(self.YT_PLAYLIST_KEBAKTIAN_UMUM)
 
                 # Filtering only one latest video, then obtain its videoId.
                 latest_video_id = all_video_data['items'][0]['snippet']['resourceId']['videoId']
 
                 # Building the embedded YouTube video link.
-                target_yt_embed = self.YT_EMBED_PREFIX + f'/{latest_video_id}'
+                return self.YT_EMBED_PREFIX + f'/{latest_video_id}'
 
-            # Upload the PDF thumbnail to WordPress.
-            msg = 'Uploading the Instagram poster to WordPress ...'
-            self.anim.set_prog_msg(75, msg)
-            Lg('lib.uploader.Uploader.update_wp_homepage', msg)
-            wp_media_upload_response = self.upload_wp_media(
-                local_ig_poster_path, f'Sunday service featured poster image')
-            poster_image_link = wp_media_upload_response['guid']['raw']
+            def update_homepage(target_yt_embed: str, latest_liturgi: str, latest_warta: str, poster_media: dict):
+                poster_image_link = poster_media['guid']['raw']
 
-            # The "Ibadah GKI Salatiga" homepage post id.
-            homepage_post_id = 52
+                # DEBUG! Please comment out on production.
+                # print(target_yt_embed, latest_liturgi, latest_warta, poster_image_link)
+
+                # Creating the post.
+                content = f'''
+                <!-- AUTO-GENERATED BY "SIMON PETRUS", AN ADMINISTRATOR DASHBOARD APP OF GKI SALATIGA -->
+                <!-- SEE MORE IN THIS GITHUB REPOSITORY: https://github.com/gkisalatiga/simon-petrus -->
+                <p><iframe title="YouTube video player" src="{target_yt_embed}" width="560" height="315" frameborder="0" allowfullscreen="allowfullscreen"></iframe></p>
+                <p><a id="link-liturgi" href="{latest_liturgi}"><img class="alignnone wp-image-4171" src="https://i0.wp.com/gkisalatiga.org/wp-content/uploads/2023/07/2-1.png?resize=218%2C66" alt="Tautan Liturgi" width="218" height="66" /></a></p>
+                <p><a id="link-warta" href="{latest_warta}"><img class="alignnone wp-image-4170" src="https://i0.wp.com/gkisalatiga.org/wp-content/uploads/2023/07/WARTA-JEMAAT-1.png?resize=218%2C66" alt="Tautan Warta Jemaat" width="218" height="66" /></a></p>
+                <figure class="wp-block-image size-large"><img src="{poster_image_link}" alt="Poster Kebaktian Umum" width="100%" /></figure>
+                '''.strip()
+                return self.edit_wp_post(homepage_post_id, content)
+
+            # The independent fetches run concurrently. The poster is uploaded as soon as it is ready,
+            # and the homepage is updated once every input is available.
+            graph = TaskGraph('lib.uploader.Uploader.update_wp_homepage')
+            graph.add('poster', prepare_poster)
+            graph.add('warta', lambda: self.get_latest_warta()[0]['link'])
+            graph.add('liturgi', lambda: self.get_latest_liturgi()[0]['link'])
+            graph.add('youtube', prepare_yt_embed)
+            graph.add('poster_upload', upload_poster, deps=('poster',))
+            graph.add('homepage', update_homepage, deps=('youtube', 'liturgi', 'warta', 'poster_upload'))
+
+            # The status message displayed once each stage is done.
+            stage_msg = {
+                'poster': 'The service poster image is ready.',
+                'warta': 'The latest "Warta Jemaat" posts have been fetched.',
+                'liturgi': 'The latest "Tata Ibadah" posts have been fetched.',
+                'youtube': 'The YouTube embedded streaming URL is ready.',
+                'poster_upload': 'The service poster has been uploaded to WordPress.',
+                'homepage': 'The WordPress homepage has been updated.',
+            }
 
-            # DEBUG! Please comment out on production.
-            # print(target_yt_embed, latest_liturgi, latest_warta, poster_image_link)
-
-            # Creating the post.
-            content = f'''
-            <!-- AUTO-GENERATED BY "SIMON PETRUS", AN ADMINISTRATOR DASHBOARD APP OF GKI SALATIGA -->
-            <!-- SEE MORE IN THIS GITHUB REPOSITORY: https://github.com/gkisalatiga/simon-petrus -->
-            <p><iframe title="YouTube video player" src="{target_yt_embed}" width="560" height="315" frameborder="0" allowfullscreen="allowfullscreen"></iframe></p>
-            <p><a id="link-liturgi" href="{latest_liturgi}"><img class="alignnone wp-image-4171" src="https://i0.wp.com/gkisalatiga.org/wp-content/uploads/2023/07/2-1.png?resize=218%2C66" alt="Tautan Liturgi" width="218" height="66" /></a></p>
-            <p><a id="link-warta" href="{latest_warta}"><img class="alignnone wp-image-4170" src="https://i0.wp.com/gkisalatiga.org/wp-content/uploads/2023/07/WARTA-JEMAAT-1.png?resize=218%2C66" alt="Tautan Warta Jemaat" width="218" height="66" /></a></p>
-            <figure class="wp-block-image size-large"><img src="{poster_image_link}" alt="Poster Kebaktian Umum" width="100%" /></figure>
-            '''.strip()
-            msg = 'Updating the WordPress homepage. This will not be very long ...'
-            self.anim.set_prog_msg(90, msg)
+            msg = 'Fetching the latest service poster, posts, and YouTube streaming video ...'
+            self.anim.set_prog_msg(10, msg)
             Lg('lib.uploader.Uploader.update_wp_homepage', msg)
-            j = self.edit_wp_post(homepage_post_id, content)
+            try:
+                j = graph.run(
+                    on_stage_done=lambda name, n, total: self.anim.set_prog_msg(
+                        10 + round(85 * n / total), stage_msg[name])
+                )['homepage']
+            except Exception:
+                # The homepage could not be updated, so the uploaded poster would be left orphaned.
+                if 'poster_upload' in graph.results and 'homepage' not in graph.results:
+                    self.delete_wp_media(graph.results['poster_upload']['id'])
+                raise
 
             # Did we make it? Has the homepage been updated?
             if j['id'] != homepage_post_id:
@@ -558,47 +903,62 @@ class Uploader(object):
             traceback.print_exc()
             return False, msg
 
-    def upload_google_drive(self, file_path: str, mime: str, folder_id: str, save_as: str):
+    def upload_google_drive(self, file_path: str, mime: str, folder_id: str, save_as: str, progress_callback=None):
         """
         Upload a file to Simon Petrus' specific Google Drive drop folder.
+        The file is sent in resumable chunks, so that an interrupted upload continues
+        from the last byte received by Google Drive instead of starting over. [10]
         :param file_path: the absolute file path of the file that will be uploaded.
         :param mime: the mimetype of the uploaded file.
         :param folder_id: the target Google Drive folder ID to which the file will be uploaded.
         :param save_as: the name of the file to save as in Google Drive.
+        :param progress_callback: (optional) a function receiving the number of uploaded bytes and the file size.
         :return: generic Google Drive API JSON (dict) response.
         """
-        # Using the following method, the maximum file size is 5 MiB.
-        if os.path.getsize(file_path) >= 5000000:
-            raise UploadFileSizeTooBig(
-                'This method does not yet support uploading files larger than 5 MiB to Google Drive')
-
-        # Parsing the Service Account key file as the API credential.
-        account_service_json_location = global_schema.prefs.JSON_GOOGLE_ACCOUNT_SERVICE_KEY
-
-        # Build the credential using the provided Service Account key file.
-        creds = service_account.Credentials.from_service_account_file(
-            filename=account_service_json_location,
-            scopes=self.GOOGLE_DRIVE_SCOPES
-        )
-
-        # Attempt to upload the requested file to Google Drive.
+        # The cached Google Drive service, authorized with the in-memory Service Account credential.
         # Error-catching is done at level of the method which called this function.
-        service = build('drive', 'v3', credentials=creds)
+        service = global_schema.google_api.get_service('drive', 'v3', use_service_account=True)
 
         # This parent folder ID is a publicly shared Google Drive folder.
         parent_gdrive_folder = folder_id
 
+        # Rounding the configured chunk size to the required granularity.
+        chunk_size = round(self.prefs.settings['gdrive_upload_chunk_mib'] * 1024 * 1024 / self.GDRIVE_CHUNK_GRANULARITY)
+        chunk_size = max(1, chunk_size) * self.GDRIVE_CHUNK_GRANULARITY
+
         # Call the Drive v3 API to upload a file
-        # SOURCE: https://developers.google.com/drive/api/guides/manage-uploads#multipart
+        # SOURCE: https://developers.google.com/drive/api/guides/manage-uploads#resumable
         file_metadata = {'name': save_as, 'parents': [parent_gdrive_folder]}
-        media = MediaFileUpload(file_path, mimetype=mime)
+        media = MediaFileUpload(file_path, mimetype=mime, chunksize=chunk_size, resumable=True)
         # pylint: disable=maybe-no-member
-        print(5)
-        file = (
-            service.files()
-            .create(body=file_metadata, media_body=media, fields='*')
-            .execute()
-        )
+        request = service.files().create(body=file_metadata, media_body=media, fields='*')
+
+        file = None
+        resume_attempts = 0
+        total_size = os.path.getsize(file_path)
+        while file is None:
+            try:
+                status, file = request.next_chunk(num_retries=self.GDRIVE_CHUNK_RETRIES)
+
+            except (HttpError, ConnectionError, OSError) as e:
+                # Only retry on transient failures. Client errors (e.g., an invalid credential) are not resumable.
+                if isinstance(e, HttpError) and e.resp.status < 500 and e.resp.status != 429:
+                    raise
+                if resume_attempts >= self.GDRIVE_MAX_RESUME_ATTEMPTS:
+                    raise
+
+                # The next "next_chunk" call asks Google Drive how many bytes it has received and continues from there.
+                resume_attempts += 1
+                Lg('lib.uploader.Uploader.upload_google_drive',
+                   f'The upload is interrupted, resuming (attempt {resume_attempts}): {e}')
+                time.sleep(2 ** resume_attempts)
+                continue
+
+            if status is not None and progress_callback is not None:
+                progress_callback(status.resumable_progress, total_size)
+
+        if progress_callback is not None:
+            progress_callback(total_size, total_size)
 
         return file
 
@@ -609,78 +969,7 @@ class Uploader(object):
         :param pdf_path: the string pointing to the respective PDF file's path.
         :param post_title: the title of the WordPress post.
         """
-        try:
-            # Finding the selected file's mime type. [2]
-            file_mimetype = MimeTypes.guess_mimetype(pdf_path)
-
-            if file_mimetype != 'application/pdf':
-                raise InvalidMimeTypeException
-
-            # Generate the thumbnail.
-            msg = 'Generating the PDF thumbnail ...'
-            self.anim.set_prog_msg(10, msg)
-            Lg('lib.uploader.Uploader.upload_liturgi', msg)
-            thumbnail_path = self.generate_pdf_thumbnail(pdf_path)
-
-            # Upload the PDF file to Google Drive.
-            msg = 'Uploading PDF to Google Drive ...'
-            self.anim.set_prog_msg(45, msg)
-            Lg('lib.uploader.Uploader.upload_liturgi', msg)
-            gdrive_response = self.upload_google_drive(pdf_path, file_mimetype, self.GDRIVE_ID_LITURGI, f'{post_title}.pdf')
-            gdrive_pdf_id = gdrive_response['id']
-
-            # Upload the PDF thumbnail to WordPress.
-            msg = 'Uploading thumbnail to WordPress ...'
-            self.anim.set_prog_msg(75, msg)
-            Lg('lib.uploader.Uploader.upload_liturgi', msg)
-            wp_media_upload_response = self.upload_wp_media(
-                thumbnail_path, f'Featured image for the post "{post_title}"')
-            featured_image_id = wp_media_upload_response['id']
-
-            # Determining the post categories and tags.
-            cats = [67]
-            tags = [34, 68]
-
-            # Creating the post.
-            content = f'''
-            <!-- AUTO-GENERATED BY "SIMON PETRUS", AN ADMINISTRATOR DASHBOARD APP OF GKI SALATIGA -->
-            <!-- SEE MORE IN THIS GITHUB REPOSITORY: https://github.com/gkisalatiga/simon-petrus -->
-            <iframe src="https://drive.google.com/file/d/{gdrive_pdf_id}/preview" width="640" height="480" allow="autoplay"></iframe>
-            <p>
-                <a href="https://drive.usercontent.google.com/u/0/uc?export=download&id={gdrive_pdf_id}">
-                    <strong>{post_title}</strong>
-                </a>
-            </p>
-            '''.strip()
-            msg = 'Posting the post to WordPress ...'
-            self.anim.set_prog_msg(90, msg)
-            Lg('lib.uploader.Uploader.upload_liturgi', msg)
-            self.upload_wp_post(post_title, content, featured_image_id, cats, tags)
-
-            # Done! It's finished.
-            self.anim.set_progress(100)
-            return True, 'The "Tata Ibadah" post has been successfully uploaded and created!'
-
-        except HttpError as e:
-            msg = f'An unknown HTTP error has just occurred. Maybe check your internet connection?: {e}'
-            Lg('lib.uploader.Uploader.upload_liturgi', msg)
-            return False, msg
-
-        except InvalidMimeTypeException as e:
-            msg = f'You must select a valid PDF file ending in ".pdf" file extension!: {e}'
-            Lg('lib.uploader.Uploader.upload_liturgi', msg)
-            return False, msg
-
-        except UploadFileSizeTooBig as e:
-            msg = f'The selected PDF file size must be less than or equal to 5 MiB: {e}'
-            Lg('lib.uploader.Uploader.upload_liturgi', msg)
-            return False, msg
-
-        except Exception as e:
-            msg = f'Unknown error is detected: {e}'
-            Lg('lib.uploader.Uploader.upload_liturgi', msg)
-            traceback.print_exc()
-            return False, msg
+        return self.publish_pdf_post(pdf_path, post_title, self.GDRIVE_ID_LITURGI, [67], [34, 68], 'Tata Ibadah')
 
     def upload_warta(self, pdf_path: str, post_title: str):
         """
@@ -689,78 +978,7 @@ class Uploader(object):
         :param pdf_path: the string pointing to the respective PDF file's path.
         :param post_title: the title of the WordPress post.
         """
-        try:
-            # Finding the selected file's mime type. [2]
-            file_mimetype = MimeTypes.guess_mimetype(pdf_path)
-
-            if file_mimetype != 'application/pdf':
-                raise InvalidMimeTypeException
-
-            # Generate the thumbnail.
-            msg = 'Generating the PDF thumbnail ...'
-            self.anim.set_prog_msg(10, msg)
-            Lg('lib.uploader.Uploader.upload_warta', msg)
-            thumbnail_path = self.generate_pdf_thumbnail(pdf_path)
-
-            # Upload the PDF file to Google Drive.
-            msg = 'Uploading PDF to Google Drive ...'
-            self.anim.set_prog_msg(45, msg)
-            Lg('lib.uploader.Uploader.upload_warta', msg)
-            gdrive_response = self.upload_google_drive(pdf_path, file_mimetype, self.GDRIVE_ID_WARTA_JEMAAT, f'{post_title}.pdf')
-            gdrive_pdf_id = gdrive_response['id']
-
-            # Upload the PDF thumbnail to WordPress.
-            msg = 'Uploading featured image (thumbnail) to WordPress ...'
-            self.anim.set_prog_msg(75, msg)
-            Lg('lib.uploader.Uploader.upload_warta', msg)
-            wp_media_upload_response = self.upload_wp_media(
-                thumbnail_path, f'Featured image for the post "{post_title}"')
-            featured_image_id = wp_media_upload_response['id']
-
-            # Determining the post categories.
-            cats = [4]
-            tags = [34, 10]
-
-            # Creating the post.
-            content = f'''
-            <!-- AUTO-GENERATED BY "SIMON PETRUS", AN ADMINISTRATOR DASHBOARD APP OF GKI SALATIGA -->
-            <!-- SEE MORE IN THIS GITHUB REPOSITORY: https://github.com/gkisalatiga/simon-petrus -->
-            <iframe src="https://drive.google.com/file/d/{gdrive_pdf_id}/preview" width="640" height="480" allow="autoplay"></iframe>
-            <p>
-                <a href="https://drive.usercontent.google.com/u/0/uc?export=download&id={gdrive_pdf_id}">
-                    <strong>{post_title}</strong>
-                </a>
-            </p>
-            '''.strip()
-            msg = 'Posting the post to WordPress ...'
-            self.anim.set_prog_msg(90, msg)
-            Lg('lib.uploader.Uploader.upload_warta', msg)
-            self.upload_wp_post(post_title, content, featured_image_id, cats, tags)
-
-            # Done! It's finished.
-            self.anim.set_progress(100)
-            return True, 'The "Warta Jemaat" post has been successfully uploaded and created!'
-
-        except HttpError as e:
-            msg = f'An unknown HTTP error has just occurred. Maybe check your internet connection?: {e}'
-            Lg('lib.uploader.Uploader.upload_warta', msg)
-            return False, msg
-
-        except InvalidMimeTypeException as e:
-            msg = f'You must select a valid PDF file ending in ".pdf" file extension!: {e}'
-            Lg('lib.uploader.Uploader.upload_warta', msg)
-            return False, msg
-
-        except UploadFileSizeTooBig as e:
-            msg = f'The selected PDF file size must be less than or equal to 5 MiB: {e}'
-            Lg('lib.uploader.Uploader.upload_warta', msg)
-            return False, msg
-
-        except Exception as e:
-            msg = f'Unknown error is detected: {e}'
-            Lg('lib.uploader.Uploader.upload_warta', msg)
-            traceback.print_exc()
-            return False, msg
+        return self.publish_pdf_post(pdf_path, post_title, self.GDRIVE_ID_WARTA_JEMAAT, [4], [34, 10], 'Warta Jemaat')
 
     def upload_wp_media(self, file_path: str, file_caption: str):
         """
@@ -769,26 +987,30 @@ class Uploader(object):
         :param file_path: the file to upload.
         :return: generic WordPress JSON response.
         """
-        wp_token = self.app_db.credentials['wp_authorization']
-
-        # Prepare the request header.
-        header = {'Authorization': 'Basic ' + wp_token}
-
-        # Begin the requests dispatching.
-        with requests.Session() as s:
-            # We need to first open this site, since the API blocks cross-origin requests.
-            r = s.get(self.WP_DOMAIN_TARGET)
+        # Preparing the media to upload.
+        with open(file_path, 'rb') as fo:
+            media = {
+                'file': fo,
+                'caption': file_caption
+            }
 
-            # Preparing the media to upload.
-            with open(file_path, 'rb') as fo:
-                media = {
-                    'file': fo,
-                    'caption': file_caption
-                }
+            # Uploading the file.
+            r = self.http.post(self.WP_ENDPOINT_MEDIA, files=media)
+            return r.json()
 
-                # Uploading the file.
-                r = s.post(self.WP_ENDPOINT_MEDIA, headers=header, files=media)
-                return r.json()
+    def delete_wp_media(self, media_id: int):
+        """
+        Permanently delete a media item from GKISalatiga.org, e.g., one uploaded for a post which could not be created.
+        Media items cannot be trashed, so the deletion is forced. [5]
+        :param media_id: the ID of the media item to delete.
+        :return: nothing. A failed deletion is only logged, so that it never hides the original error.
+        """
+        try:
+            r = self.http.delete(self.WP_ENDPOINT_MEDIA + f'/{media_id}', params={'force': 'true'})
+            r.raise_for_status()
+            Lg('lib.uploader.Uploader.delete_wp_media', f'Deleted the orphaned WordPress media: {media_id}')
+        except Exception as e:
+            Lg('lib.uploader.Uploader.delete_wp_media', f'Cannot delete the orphaned WordPress media {media_id}: {e}')
 
     def upload_wp_post(self, title: str, post_content: str, featured_image: int, cats: list, tags: list = []):
         """
@@ -800,27 +1022,17 @@ class Uploader(object):
         :param cats: the category IDs of this particular post, as an array.
         :return: generic WordPress API JSON response.
         """
-        wp_token = self.app_db.credentials['wp_authorization']
-
-        # Prepare the request header.
-        header = {'Authorization': 'Basic ' + wp_token}
-
-        # Begin the requests dispatching.
-        with requests.Session() as s:
-            # We need to first open this site, since the API blocks cross-origin requests.
-            r = s.get(self.WP_DOMAIN_TARGET)
-
-            # Preparing the post content to upload.
-            post_data = {
-                'title': title,
-                'content': post_content,
-                'categories': cats,
-                'tags': tags,
-                'featured_media': featured_image,
-                'status': 'publish',
-                'comment_status': 'closed'
-            }
-
-            # Uploading the new post as "published".
-            r = s.post(self.WP_ENDPOINT_POSTS, headers=header, json=post_data)
-            return r.json()
+        # Preparing the post content to upload.
+        post_data = {
+            'title': title,
+            'content': post_content,
+            'categories': cats,
+            'tags': tags,
+            'featured_media': featured_image,
+            'status': 'publish',
+            'comment_status': 'closed'
+        }
+
+        # Uploading the new post as "published".
+        r = self.http.post(self.WP_ENDPOINT_POSTS, json=post_data)
+        return r.json()
@@ -27,6 +27,9 @@ class ScreenLoadingAnimation(QtWidgets.QMainWindow, screen_loading_animation.Ui_
     # The signal for updating the progress bar value. [1]
     sig_loading_progress = pyqtSignal(int)
 
+    # The signal for updating the status message, so that it can be safely set from background tasks. [1]
+    sig_loading_status = pyqtSignal(str)
+
     def __init__(self, *args, obj=None, **kwargs):
         super(ScreenLoadingAnimation, self).__init__(*args, **kwargs)
         self.setupUi(self)
@@ -36,6 +39,7 @@ class ScreenLoadingAnimation(QtWidgets.QMainWindow, screen_loading_animation.Ui_
 
         # Connecting the slot for updating the progress bar value.
         self.sig_loading_progress.connect(self.main_progress.setValue)
+        self.sig_loading_status.connect(self.label_status.setText)
 
         gif = QtGui.QMovie(resource_path('assets/loading_animation.gif'))
         self.label_gif.setMovie(gif)
@@ -106,4 +110,4 @@ class ScreenLoadingAnimation(QtWidgets.QMainWindow, screen_loading_animation.Ui_
         :param msg: the message to display in the loading screen.
         :return: nothing.
         """
-        self.findChild(QtWidgets.QLabel, 'label_status').setText(msg)
+        self.sig_loading_status.emit(msg)
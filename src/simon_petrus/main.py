@@ -6,12 +6,16 @@ Written by Samarthya Lykamanuella (github.com/groaking)
 """
 
 from PyQt5 import QtWidgets
+import multiprocessing
 import sys
 
 from handler.screen.screen_credential_decrypt import ScreenCredentialDecrypt
 import global_schema
 
 if __name__ == '__main__':
+    # Letting the spawned PDF worker processes start properly in the frozen (PyInstaller) app.
+    multiprocessing.freeze_support()
+
     # Initiating and constructing the QApplication.
     app = QtWidgets.QApplication(sys.argv)
 
@@ -27,6 +31,7 @@ if __name__ == '__main__':
     exit_code = app.exec()
 
     # Performing post-operation procedures.
+    global_schema.pdf_worker.shutdown()
     global_schema.prefs.shutdown()
 
     # Appropriately exiting the app.
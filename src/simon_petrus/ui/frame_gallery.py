@@ -18,6 +18,9 @@ class Ui_Frame(object):
         self.btn_save = QtWidgets.QPushButton(Frame)
         self.btn_save.setGeometry(QtCore.QRect(30, 510, 101, 31))
         self.btn_save.setObjectName("btn_save")
+        self.btn_fetch_all = QtWidgets.QPushButton(Frame)
+        self.btn_fetch_all.setGeometry(QtCore.QRect(140, 510, 181, 31))
+        self.btn_fetch_all.setObjectName("btn_fetch_all")
         self.app_title = QtWidgets.QLabel(Frame)
         self.app_title.setGeometry(QtCore.QRect(20, 10, 391, 31))
         font = QtGui.QFont()
@@ -615,6 +618,8 @@ class Ui_Frame(object):
         _translate = QtCore.QCoreApplication.translate
         Frame.setWindowTitle(_translate("Frame", "Frame"))
         self.btn_save.setText(_translate("Frame", "✅    SIMPAN"))
+        self.btn_fetch_all.setToolTip(_translate("Frame", "Mutakhirkan semua album dari Google Drive"))
+        self.btn_fetch_all.setText(_translate("Frame", "🔁    MUTAKHIRKAN SEMUA"))
         self.app_title.setText(_translate("Frame", "Album Kenangan GKI Salatiga"))
         self.btn_add.setToolTip(_translate("Frame", "Tambah item baru"))
         self.btn_add.setText(_translate("Frame", "➕"))
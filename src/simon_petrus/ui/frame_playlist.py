@@ -18,6 +18,9 @@ class Ui_Frame(object):
         self.btn_save = QtWidgets.QPushButton(Frame)
         self.btn_save.setGeometry(QtCore.QRect(30, 490, 101, 31))
         self.btn_save.setObjectName("btn_save")
+        self.btn_fetch_all = QtWidgets.QPushButton(Frame)
+        self.btn_fetch_all.setGeometry(QtCore.QRect(140, 490, 181, 31))
+        self.btn_fetch_all.setObjectName("btn_fetch_all")
         self.btn_add = QtWidgets.QPushButton(Frame)
         self.btn_add.setGeometry(QtCore.QRect(530, 140, 31, 31))
         self.btn_add.setObjectName("btn_add")
@@ -442,6 +445,8 @@ class Ui_Frame(object):
         _translate = QtCore.QCoreApplication.translate
         Frame.setWindowTitle(_translate("Frame", "Frame"))
         self.btn_save.setText(_translate("Frame", "✅    SIMPAN"))
+        self.btn_fetch_all.setToolTip(_translate("Frame", "Mutakhirkan semua daftar putar dari YouTube"))
+        self.btn_fetch_all.setText(_translate("Frame", "🔁    MUTAKHIRKAN SEMUA"))
         self.btn_add.setToolTip(_translate("Frame", "Tambah item baru"))
         self.btn_add.setText(_translate("Frame", "➕"))
         self.btn_move_up.setToolTip(_translate("Frame", "Pindah posisi item ke atas"))
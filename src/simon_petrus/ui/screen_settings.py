@@ -15,7 +15,7 @@ class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
         MainWindow.setObjectName("MainWindow")
         MainWindow.setWindowModality(QtCore.Qt.WindowModal)
-        MainWindow.resize(594, 339)
+        MainWindow.resize(594, 369)
         self.centralwidget = QtWidgets.QWidget(MainWindow)
         self.centralwidget.setObjectName("centralwidget")
         self.label = QtWidgets.QLabel(self.centralwidget)
@@ -48,6 +48,26 @@ class Ui_MainWindow(object):
         font.setItalic(True)
         self.label_2.setFont(font)
         self.label_2.setObjectName("label_2")
+        self.btn_clear_cache = QtWidgets.QPushButton(self.centralwidget)
+        self.btn_clear_cache.setGeometry(QtCore.QRect(20, 220, 261, 31))
+        self.btn_clear_cache.setObjectName("btn_clear_cache")
+        self.label_3 = QtWidgets.QLabel(self.centralwidget)
+        self.label_3.setGeometry(QtCore.QRect(20, 270, 261, 24))
+        self.label_3.setObjectName("label_3")
+        self.combo_pdf_thumbnail_format = QtWidgets.QComboBox(self.centralwidget)
+        self.combo_pdf_thumbnail_format.setGeometry(QtCore.QRect(290, 270, 291, 24))
+        self.combo_pdf_thumbnail_format.setObjectName("combo_pdf_thumbnail_format")
+        self.combo_pdf_thumbnail_format.addItem("")
+        self.combo_pdf_thumbnail_format.addItem("")
+        self.combo_pdf_thumbnail_format.addItem("")
+        self.chk_pdf_optimize = QtWidgets.QCheckBox(self.centralwidget)
+        self.chk_pdf_optimize.setGeometry(QtCore.QRect(20, 305, 561, 22))
+        self.chk_pdf_optimize.setChecked(False)
+        self.chk_pdf_optimize.setObjectName("chk_pdf_optimize")
+        self.chk_gallery_sharded = QtWidgets.QCheckBox(self.centralwidget)
+        self.chk_gallery_sharded.setGeometry(QtCore.QRect(20, 335, 561, 22))
+        self.chk_gallery_sharded.setChecked(False)
+        self.chk_gallery_sharded.setObjectName("chk_gallery_sharded")
         MainWindow.setCentralWidget(self.centralwidget)
         self.action_gen_cred = QtWidgets.QAction(MainWindow)
         self.action_gen_cred.setObjectName("action_gen_cred")
@@ -67,5 +87,14 @@ class Ui_MainWindow(object):
         self.chk_gdrive_fetch_all.setText(_translate("MainWindow", "Sinkronisasi semua foto Google Drive pada menu \"Galeri\" GKI Salatiga+"))
         self.label_2.setText(_translate("MainWindow", "Jika dimatikan, sinkronisasi folder pada galeri GKI Salatiga+\n"
 "hanya akan mengambil 100 foto pertama dari folder Google Drive"))
+        self.btn_clear_cache.setToolTip(_translate("MainWindow", "Ambil ulang data YouTube, WordPress, dan Instagram yang tersimpan"))
+        self.btn_clear_cache.setText(_translate("MainWindow", "🗑     HAPUS CACHE DATA DARING"))
+        self.label_3.setText(_translate("MainWindow", "Format gambar pratinjau PDF"))
+        self.combo_pdf_thumbnail_format.setItemText(0, _translate("MainWindow", "PNG"))
+        self.combo_pdf_thumbnail_format.setItemText(1, _translate("MainWindow", "JPEG"))
+        self.combo_pdf_thumbnail_format.setItemText(2, _translate("MainWindow", "WebP"))
+        self.chk_pdf_optimize.setText(_translate("MainWindow", "Perkecil ukuran PDF warta dan tata ibadah sebelum diunggah"))
+        self.chk_gallery_sharded.setToolTip(_translate("MainWindow", "Simpan dan unggah galeri GKI Salatiga+ sebagai satu berkas per tahun"))
+        self.chk_gallery_sharded.setText(_translate("MainWindow", "Pisahkan data galeri per tahun"))
         self.action_gen_cred.setText(_translate("MainWindow", "Generate Secure Credential ..."))
         self.action_exit.setText(_translate("MainWindow", "Exit App"))
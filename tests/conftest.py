@@ -0,0 +1,11 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+"""
+import os
+import sys
+
+# The app's modules are imported relative to its source directory, e.g., "from lib.logger import Logger".
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'simon_petrus'))
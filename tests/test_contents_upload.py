@@ -0,0 +1,47 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+"""
+import base64
+import io
+import json
+
+from lib.contents_upload import StreamingBase64Body, StreamingContentsUpload
+
+
+def read_body(content: bytes, sha: str = None):
+    body = StreamingContentsUpload(io.BytesIO(content), len(content), 'gkisplus-gallery/2024.json', 'Update', sha)
+    raw = b''.join(iter(body.read, b''))
+    assert len(raw) == len(body)
+    return json.loads(raw)
+
+
+def test_new_file_omits_sha():
+    # The gallery shard does not exist on the remote yet.
+    j = read_body(b'{"year": "2024"}')
+    assert 'sha' not in j
+    assert j['path'] == 'gkisplus-gallery/2024.json'
+    assert base64.b64decode(j['content']) == b'{"year": "2024"}'
+
+
+def test_update_includes_sha():
+    j = read_body(b'{"year": "2024"}', 'abc123')
+    assert j['sha'] == 'abc123'
+    assert base64.b64decode(j['content']) == b'{"year": "2024"}'
+
+
+def test_chunked_content_round_trip():
+    # Spanning several encoded chunks, with a length which is not a multiple of 3.
+    content = bytes(range(256)) * (StreamingContentsUpload.ENCODE_CHUNK_SIZE // 128 + 1) + b'xy'
+    j = read_body(content)
+    assert base64.b64decode(j['content']) == content
+
+
+def test_blob_body():
+    # The request body of the Git Data API, as streamed when creating a blob.
+    body = StreamingBase64Body(io.BytesIO(b'PK\x03\x04'), 4, {'encoding': 'base64'})
+    raw = b''.join(iter(body.read, b''))
+    assert len(raw) == len(body)
+    assert json.loads(raw) == {'encoding': 'base64', 'content': base64.b64encode(b'PK\x03\x04').decode('utf-8')}
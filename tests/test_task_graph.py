@@ -0,0 +1,38 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+"""
+import threading
+
+import pytest
+
+from lib.task_graph import TaskGraph
+
+
+def test_failed_stage_keeps_the_running_results():
+    # The upload is still running when the other branch fails.
+    started = threading.Event()
+    failed = threading.Event()
+
+    def fetch():
+        started.wait()
+        failed.set()
+        raise IOError('The fetch failed')
+
+    def upload():
+        started.set()
+        failed.wait()
+        return {'id': 42}
+
+    graph = TaskGraph('tests.test_task_graph')
+    graph.add('fetch', fetch)
+    graph.add('upload', upload)
+    graph.add('publish', lambda a, b: True, deps=('fetch', 'upload'))
+
+    with pytest.raises(IOError):
+        graph.run()
+
+    # The caller can thus roll back the upload.
+    assert graph.results == {'upload': {'id': 42}}
@@ -0,0 +1,76 @@
+"""
+Simon Petrus
+AGPL-3.0-licensed
+Copyright (C) GKI Salatiga 2024
+Written by Samarthya Lykamanuella (github.com/groaking)
+"""
+import global_schema
+from lib.playlist_cursor import PlaylistCursorStore
+from lib.uploader import Uploader
+
+
+class FakeResponse(object):
+    def __init__(self, j: dict, status_code: int = 200):
+        self.j = j
+        self.status_code = status_code
+        self.headers = {'ETag': j.get('etag', '')}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.j
+
+
+class FakeYouTube(object):
+    """ Serves a one-page playlist and the details of only the currently available videos. """
+
+    def __init__(self, playlist_ids: list, available_ids: set, etag: str):
+        self.playlist_ids = playlist_ids
+        self.available_ids = available_ids
+        self.etag = etag
+        self.requested_ids = []
+
+    def get(self, url: str, params: dict = None, headers: dict = None):
+        if url == Uploader.YT_ENDPOINT_PLAYLIST_ITEMS:
+            if (headers or {}).get('If-None-Match') == self.etag:
+                return FakeResponse({}, 304)
+            return FakeResponse({
+                'etag': self.etag,
+                'items': [{'contentDetails': {'videoId': a}} for a in self.playlist_ids]
+            })
+
+        ids = params['id'].split(',')
+        self.requested_ids.extend(ids)
+        return FakeResponse({'items': [
+            {'id': a, 'snippet': {
+                'title': f'Video {a}', 'publishedAt': '2024-01-01T00:00:00Z', 'description': '',
+                'thumbnails': {'high': {'url': f'https://i.ytimg.com/vi/{a}/hqdefault.jpg'}}
+            }}
+            for a in ids if a in self.available_ids
+        ]})
+
+
+def make_uploader(http: FakeYouTube):
+    uploader = Uploader.__new__(Uploader)
+    uploader.http = http
+    return uploader
+
+
+def test_unavailable_video_is_fetched_once_available(tmp_path, monkeypatch):
+    monkeypatch.setattr(global_schema, 'yt_cursors', PlaylistCursorStore(str(tmp_path / 'cursors.json')), raising=False)
+
+    # The second video is still private at the first synchronization.
+    http = FakeYouTube(['a', 'b'], {'a'}, 'etag-1')
+    items, ok, _ = make_uploader(http).get_yt_playlist_data('PL', show_progress=False)
+    assert ok
+    assert [a['title'] for a in items] == ['Video a']
+
+    # The video is made public, which changes the playlist's ETag.
+    http = FakeYouTube(['a', 'b'], {'a', 'b'}, 'etag-2')
+    items, ok, _ = make_uploader(http).get_yt_playlist_data('PL', show_progress=False)
+    assert ok
+    assert [a['title'] for a in items] == ['Video a', 'Video b']
+
+    # Only the video lacking its details is requested again.
+    assert http.requested_ids == ['b']